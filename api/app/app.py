@@ -1,8 +1,22 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from api.app.routers import calculator_router, pvgis_router, pvgis_plus_router, utils_router
+from api.app.services.bird_batch import BirdBatchService
+from api.app.services.pvgis import PVGISService
+from api.app.services.pvgis_async import AsyncPVGISService
 
-app = FastAPI(title="Solar Project", version="0.1")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release shared worker pools and pooled connections on shutdown
+    BirdBatchService.shutdown()
+    PVGISService.close()
+    await AsyncPVGISService.close()
+
+
+app = FastAPI(title="Solar Project", version="0.1", lifespan=lifespan)
 
 # Configure CORS
 app.add_middleware(
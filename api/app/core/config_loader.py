@@ -1,8 +1,9 @@
 # api/app/infrastructure/config/loader.py
 from pathlib import Path
+from typing import Optional
 from pydantic import AnyUrl, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from .logger import app_logger as logger
+from .logger import app_logger as logger, configure_logging
 
 MAX_DECIMAL_PRECISION = 28
 
@@ -14,6 +15,37 @@ class Settings(BaseSettings):
     YEAR_LIMIT_START: int = Field(default=1900, description="Minimum valid year for date inputs")
     YEAR_LIMIT_END: int = Field(default=2100, description="Maximum valid year for date inputs")
     MAX_RECORDS_PER_ARRAY: int = Field(default=500, description="Max records per array in API responses to prevent client issues")
+    MAX_SERIES_POINTS: int = Field(default=1_100_000, description="Max time steps per Bird model series request")
+    EPHEMERIS_CACHE_SIZE: int = Field(default=65_536, description="Max Julian dates kept in the solar ephemeris LRU cache")
+    RASTER_TILE_SIZE: int = Field(default=256, description="Default cells per tile edge for Bird model raster jobs")
+    RASTER_MAX_WORKERS: Optional[int] = Field(default=None, description="Process pool size for raster jobs (default: CPU count)")
+    BATCH_MAX_RECORDS: int = Field(default=500_000, description="Max points per Bird model batch request")
+    BATCH_CHUNK_SIZE: int = Field(default=20_000, description="Points per process-pool task in Bird model batches")
+    BATCH_MAX_WORKERS: Optional[int] = Field(default=None, description="Process pool size for Bird model batches (default: CPU count)")
+    PVGIS_BASE_URL_V52: str = Field(default="https://re.jrc.ec.europa.eu/api/v5_2", description="PVGIS 5.2 API root (point at a stand-in server for load tests)")
+    PVGIS_BASE_URL_V53: str = Field(default="https://re.jrc.ec.europa.eu/api/v5_3", description="PVGIS 5.3 API root")
+    PVGIS_POOL_CONNECTIONS: int = Field(default=4, ge=1, description="Per-host connection pools kept by the PVGIS HTTP session")
+    PVGIS_POOL_MAXSIZE: int = Field(default=16, ge=1, description="Max keep-alive connections per PVGIS host")
+    PVGIS_ASYNC_MAX_CONNECTIONS: int = Field(default=100, ge=1, description="Max concurrent connections of the async PVGIS client")
+    PVGIS_RATE_LIMIT: float = Field(default=25.0, gt=0, description="PVGIS calls per second allowed across all workers (rate + burst must stay <= 30)")
+    PVGIS_RATE_LIMIT_BURST: int = Field(default=5, ge=1, description="PVGIS calls that may be sent back to back before the rate applies")
+    PVGIS_RATE_LIMIT_MAX_WAIT: float = Field(default=30.0, gt=0, description="Max seconds a PVGIS call may queue before it is rejected")
+    PVGIS_RATE_LIMIT_FILE: Optional[Path] = Field(default=None, description="SQLite file holding the shared PVGIS token bucket (default: system temp dir)")
+    PVGIS_CACHE_ENABLED: bool = Field(default=True, description="Cache PVcalc, seriescalc, TMY and horizon responses on disk")
+    PVGIS_CACHE_FILE: Optional[Path] = Field(default=None, description="SQLite file holding the PVGIS response cache (default: system temp dir)")
+    PVGIS_CACHE_MAX_MB: int = Field(default=512, ge=1, description="Max compressed size of the PVGIS response cache; least recently used entries are evicted")
+    PVGIS_CACHE_TTL_DAYS: float = Field(default=30.0, gt=0, description="Days a cached PVGIS response stays valid")
+    PVGIS_CACHE_MEMORY_MB: int = Field(default=64, ge=0, description="Uncompressed size of hot PVGIS responses kept decoded in memory")
+    PVGIS_RETRIES: int = Field(default=3, ge=0, description="Retries of a PVGIS call after 429/529, gateway errors, timeouts or connection errors")
+    PVGIS_RETRY_BASE_DELAY: float = Field(default=0.5, gt=0, description="Backoff before the first PVGIS retry; doubles per retry, with full jitter")
+    PVGIS_RETRY_MAX_DELAY: float = Field(default=10.0, gt=0, description="Longest wait between PVGIS retries (longer Retry-After hints are not retried)")
+    PVGIS_BREAKER_FAILURES: int = Field(default=5, ge=1, description="Consecutive PVGIS failures that open the circuit breaker")
+    PVGIS_BREAKER_RESET_SECONDS: float = Field(default=30.0, gt=0, description="Seconds the PVGIS circuit stays open before a probe call is allowed")
+    PVGIS_YEAR_FANOUT: bool = Field(default=True, description="Split multi-year seriescalc fetches into parallel per-year calls, cached per year")
+    PVGIS_FANOUT_WORKERS: int = Field(default=8, ge=1, description="Threads fetching the years of one multi-year seriescalc in parallel (sync client)")
+    PVGIS_SERIES_STORE_MB: int = Field(default=256, ge=0, description="Memory for hourly series kept as NumPy columns per site and year (0 disables the store)")
+    LOG_LEVEL: str = Field(default="INFO", description="Application log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)")
+    LOG_SAMPLE_EVERY: int = Field(default=1000, ge=1, description="Hot-loop call sites log their first call and then one in every N")
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -36,6 +68,15 @@ class Settings(BaseSettings):
             logger.error(f"Invalid DECIMAL_PRECISION '{v}', using default 10. Error: {e}")
             return 10
 
+    @field_validator("LOG_LEVEL", mode="before")
+    @classmethod
+    def validate_log_level(cls, v):
+        level = str(v).strip().upper()
+        if level not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+            logger.error(f"Invalid LOG_LEVEL '{v}', using default INFO.")
+            return "INFO"
+        return level
+
 
 # Get project root and construct full path to .env
 base_dir = Path(__file__).resolve().parents[3]  # 3 levels up from this file
@@ -43,4 +84,5 @@ env_file = base_dir / ".env"
 
 # Singleton settings instance
 settings = Settings(_env_file=env_file)
+configure_logging(settings.LOG_LEVEL, settings.LOG_SAMPLE_EVERY)
 logger.info(f"Configuration loaded from {env_file}")
@@ -1,9 +1,13 @@
+import itertools
 import logging
 import sys
 from pathlib import Path
 from datetime import datetime
 
-def setup_logger(name: str = "unnamed_logger", level: str = "DEBUG") -> logging.Logger:
+# Default for LogSampler instances without an explicit rate (set from settings.LOG_SAMPLE_EVERY)
+_sample_every = 1000
+
+def setup_logger(name: str = "unnamed_logger", level: str = "INFO") -> logging.Logger:
     """
     Creates and configures a logger instance.\n
     Logs to both stdout and a daily log file under /api/logs/.
@@ -40,6 +44,51 @@ def setup_logger(name: str = "unnamed_logger", level: str = "DEBUG") -> logging.
     return logger
 
 
+def configure_logging(level: str, sample_every: int) -> None:
+    """
+    Apply the logging settings to the global logger (called by config_loader once settings are loaded).
+    Kept here rather than importing settings, because config_loader itself logs through app_logger.
+    """
+    global _sample_every
+    app_logger.setLevel(level)
+    _sample_every = max(1, int(sample_every))
+
+
+class LogSampler:
+    """
+    Level-gated, sampled logging for one call site inside a hot loop.
+
+    Create one instance per call site (usually at module level) and call it like
+    logger.debug with %-style arguments. Nothing is formatted unless the level is
+    enabled, and only the first call and then one in every `every` calls are emitted.
+
+    Example:
+        >>> _log_done = LogSampler(app_logger, logging.DEBUG)
+        >>> _log_done("Julian Date calculated: %s", result)
+    """
+
+    def __init__(self, logger: logging.Logger, level: int = logging.DEBUG, every: int = None):
+        self.logger = logger
+        self.level = level
+        self.every = every
+        self._calls = itertools.count()
+
+    def __call__(self, msg: str, *args) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+
+        # next() on itertools.count is atomic under the GIL, so no lock is needed
+        call = next(self._calls)
+        every = self.every or _sample_every
+        if call % every:
+            return
+
+        if call:
+            msg = f"{msg} (1 of every {every} calls logged)"
+        # stacklevel=2 reports the caller's file, not this one
+        self.logger.log(self.level, msg, *args, stacklevel=2)
+
+
 # Global reusable logger instances
-app_logger = setup_logger("app_logger", "DEBUG")
+app_logger = setup_logger("app_logger", "INFO")
 app_logger.info("Logger initialized.")
@@ -0,0 +1,196 @@
+"""
+Token-bucket rate limiting shared between processes.
+
+The bucket state (tokens, last refill time) lives in a small SQLite file, so every
+uvicorn worker on the host draws from the same bucket. Callers reserve a token in
+one short write transaction and then sleep until their slot is due, so requests
+are queued rather than rejected.
+"""
+
+import asyncio
+import math
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from .logger import app_logger as logger
+
+
+class TokenBucketLimiter:
+    """
+    Token bucket with `rate` tokens per second and room for `burst` tokens.
+
+    Over any window of T seconds at most burst + rate * T calls go through, across
+    all processes sharing the same file and bucket name. Tokens may go negative:
+    each negative token is a caller already holding a future slot, which is how the
+    queue is shared between workers without any coordinator.
+
+    Example:
+        >>> limiter = TokenBucketLimiter("/tmp/pvgis.sqlite", rate=25, burst=5)
+        >>> limiter.acquire()               # blocking callers
+        >>> await limiter.acquire_async()   # coroutines
+    """
+
+    BUSY_TIMEOUT = 5.0
+
+    def __init__(self, path: str, rate: float, burst: int, name: str = "default",
+                 max_wait: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("Rate limit must be positive")
+        if burst < 1:
+            raise ValueError("Rate limit burst must be at least 1")
+
+        self.path = Path(path)
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.name = name
+        self.max_wait = max_wait
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+        # Process-local statistics
+        self._acquired = 0
+        self._delayed = 0
+        self._rejected = 0
+        self._waiting = 0
+        self._total_wait = 0.0
+        self._max_wait_seen = 0.0
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available.
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RuntimeError: If the wait would exceed max_wait (the call is not queued)
+        """
+        wait = self._reserve()
+        if wait > 0:
+            self._enter_queue()
+            try:
+                time.sleep(wait)
+            finally:
+                self._leave_queue()
+        return wait
+
+    async def acquire_async(self) -> float:
+        """
+        Async version of acquire(). The reservation (thread lock, SQLite write with a
+        busy timeout) runs in a worker thread and the wait is an asyncio.sleep, so
+        the event loop is never blocked.
+        """
+        wait = await asyncio.to_thread(self._reserve)
+        if wait > 0:
+            self._enter_queue()
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._leave_queue()
+        return wait
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and wait-time statistics of this process plus the shared bucket state."""
+        with self._lock:
+            tokens = self._read_tokens()
+            acquired = self._acquired
+            return {
+                "rate": self.rate,
+                "burst": int(self.burst),
+                "max_wait": self.max_wait,
+                "backend": str(self.path),
+                "available_tokens": max(0.0, tokens),
+                # Callers of every process holding a slot that is not due yet
+                "shared_queue_depth": math.ceil(-tokens) if tokens < 0 else 0,
+                "queue_depth": self._waiting,
+                "acquired": acquired,
+                "delayed": self._delayed,
+                "rejected": self._rejected,
+                "total_wait_seconds": self._total_wait,
+                "mean_wait_seconds": self._total_wait / acquired if acquired else 0.0,
+                "max_wait_seconds": self._max_wait_seen
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _reserve(self) -> float:
+        """Take a token (possibly a future one) in one write transaction and return the wait until it is due."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                tokens = self._refill(conn, now)
+                wait = max(0.0, (1.0 - tokens) / self.rate)
+
+                if self.max_wait is not None and wait > self.max_wait:
+                    conn.execute("ROLLBACK")
+                    self._rejected += 1
+                    raise RuntimeError(
+                        f"PVGIS request queue is full: next slot in {wait:.1f}s exceeds the "
+                        f"{self.max_wait:.1f}s limit. Please try again later."
+                    )
+
+                conn.execute(
+                    "INSERT INTO buckets (name, tokens, updated) VALUES (?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated",
+                    (self.name, tokens - 1.0, now)
+                )
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+
+            self._acquired += 1
+            if wait > 0:
+                self._delayed += 1
+                self._total_wait += wait
+                self._max_wait_seen = max(self._max_wait_seen, wait)
+
+        if wait > 0:
+            logger.debug("Rate limiter '%s': queued for %.3fs", self.name, wait)
+        return wait
+
+    def _refill(self, conn: sqlite3.Connection, now: float) -> float:
+        row = conn.execute("SELECT tokens, updated FROM buckets WHERE name = ?", (self.name,)).fetchone()
+        if row is None:
+            return self.burst
+        tokens, updated = row
+        # Wall-clock time is shared by all processes; ignore steps backwards
+        return min(self.burst, tokens + max(0.0, now - updated) * self.rate)
+
+    def _read_tokens(self) -> float:
+        conn = self._connection()
+        return self._refill(conn, time.time())
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections must not cross a fork, so reopen in every new worker process
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=self.BUSY_TIMEOUT, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets (name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _enter_queue(self) -> None:
+        with self._lock:
+            self._waiting += 1
+
+    def _leave_queue(self) -> None:
+        with self._lock:
+            self._waiting -= 1
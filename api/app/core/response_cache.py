@@ -0,0 +1,240 @@
+"""
+Persistent cache for upstream API responses.
+
+Entries are content-addressed (the key is a hash of the normalized request) and
+stored zlib-compressed in a SQLite file, so they survive restarts and are shared
+by every worker on the host. Decoded payloads of recently used keys are also kept
+in a small in-process memory tier to skip decompression and JSON parsing.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from .logger import app_logger as logger
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache with TTL expiry and a memory tier.
+
+    - Disk tier: compressed bodies in SQLite; least recently used entries are evicted
+      once the compressed total exceeds max_bytes, and entries older than ttl
+      seconds are treated as misses and deleted.
+    - Memory tier: decoded payloads, bounded by the sum of their uncompressed body
+      sizes (memory_bytes). Payloads are shared between callers and must not be mutated.
+    """
+
+    BUSY_TIMEOUT = 5.0
+    COMPRESSION_LEVEL = 6
+
+    def __init__(self, path: str, max_bytes: int, ttl: float, memory_bytes: int):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.memory_bytes = memory_bytes
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+        self._memory: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._memory_size = 0
+
+        self._hits_memory = 0
+        self._hits_disk = 0
+        self._misses = 0
+        self._stores = 0
+        self._evicted = 0
+        self._expired = 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """SHA-256 of the parts serialized as canonical JSON (sorted keys, no whitespace)."""
+        canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Decoded payload for `key`, or None on a miss or an expired entry."""
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, size, created = entry
+                if now - created <= self.ttl:
+                    self._memory.move_to_end(key)
+                    self._hits_memory += 1
+                    return value
+                self._drop_memory(key)
+
+            row = self._read(key, now)
+            if row is None:
+                return None
+            body, size, created = row
+
+        # Decode outside the lock; large series take tens of milliseconds
+        value = json.loads(zlib.decompress(body))
+        with self._lock:
+            self._remember(key, value, size, created)
+        return value
+
+    def get_compressed(self, key: str) -> Optional[bytes]:
+        """
+        Compressed body for `key` straight from disk (None on a miss or an expired entry),
+        for callers that decompress and parse it incrementally. The memory tier is not used.
+        """
+        with self._lock:
+            row = self._read(key, time.time())
+        return row[0] if row is not None else None
+
+    def put(self, key: str, endpoint: str, body: bytes, value: Any) -> None:
+        """
+        Store the raw response `body` (compressed on disk) and its decoded `value` (memory tier).
+        """
+        created = self.put_compressed(key, endpoint, zlib.compress(body, self.COMPRESSION_LEVEL), len(body))
+        with self._lock:
+            self._remember(key, value, len(body), created)
+
+    def put_compressed(self, key: str, endpoint: str, compressed: bytes, size: int) -> float:
+        """
+        Store a body that was already zlib-compressed (`size` is its uncompressed length).
+        Only the disk tier is written.
+
+        Returns:
+            The entry's creation time
+        """
+        now = time.time()
+
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, endpoint, body, size, stored_bytes, created, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, endpoint, compressed, size, len(compressed), now, now)
+                )
+                self._expired += conn.execute("DELETE FROM entries WHERE created < ?", (now - self.ttl,)).rowcount
+                self._evict(conn)
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+
+            self._stores += 1
+
+        logger.info(f"Cached {endpoint} response: {size} bytes, {len(compressed)} compressed")
+        return now
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of this process plus the size of both tiers."""
+        with self._lock:
+            entries, stored, raw = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(stored_bytes), 0), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            lookups = self._hits_memory + self._hits_disk + self._misses
+            return {
+                "backend": str(self.path),
+                "entries": entries,
+                "disk_bytes": stored,
+                "uncompressed_bytes": raw,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_size,
+                "memory_max_bytes": self.memory_bytes,
+                "hits_memory": self._hits_memory,
+                "hits_disk": self._hits_disk,
+                "misses": self._misses,
+                "hit_ratio": (self._hits_memory + self._hits_disk) / lookups if lookups else 0.0,
+                "stores": self._stores,
+                "evicted": self._evicted,
+                "expired": self._expired
+            }
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._connection().execute("DELETE FROM entries")
+            self._memory.clear()
+            self._memory_size = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _read(self, key: str, now: float) -> Optional[Tuple[bytes, int, float]]:
+        """(compressed body, size, created) of a live disk entry; counts the hit or miss. Caller holds the lock."""
+        conn = self._connection()
+        row = conn.execute("SELECT body, size, created FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self._misses += 1
+            return None
+
+        if now - row[2] > self.ttl:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._expired += 1
+            self._misses += 1
+            return None
+
+        conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        self._hits_disk += 1
+        return row
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used entries until the compressed total fits in max_bytes."""
+        total = conn.execute("SELECT COALESCE(SUM(stored_bytes), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        victims = []
+        for key, stored in conn.execute("SELECT key, stored_bytes FROM entries ORDER BY accessed"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= stored
+
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        self._evicted += len(victims)
+
+    def _remember(self, key: str, value: Any, size: int, created: float) -> None:
+        if size > self.memory_bytes:
+            return
+        self._drop_memory(key)
+        self._memory[key] = (value, size, created)
+        self._memory_size += size
+        while self._memory_size > self.memory_bytes:
+            _, (_, old_size, _) = self._memory.popitem(last=False)
+            self._memory_size -= old_size
+
+    def _drop_memory(self, key: str) -> None:
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_size -= entry[1]
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections must not cross a fork, so reopen in every new worker process
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=self.BUSY_TIMEOUT, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, body BLOB NOT NULL, size INTEGER NOT NULL, "
+                "stored_bytes INTEGER NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
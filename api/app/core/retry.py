@@ -0,0 +1,184 @@
+"""
+Retry and circuit-breaker policies for upstream HTTP calls.
+
+RetryPolicy decides how long to wait before the next attempt (exponential
+backoff with full jitter, never shorter than the server's Retry-After).
+CircuitBreaker stops calling an upstream that keeps failing, so callers get an
+immediate error instead of each waiting for its own timeout.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an upstream while its circuit breaker is open."""
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter: the wait before retry n is uniform in
+    [0, min(max_delay, base_delay * 2**n)]. A Retry-After hint raises the wait to at
+    least that value; hints longer than max_delay end the retries instead.
+    """
+
+    def __init__(self, retries: int, base_delay: float, max_delay: float):
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._lock = threading.Lock()
+        self._scheduled = 0
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Seconds to wait before retrying after failed attempt number `attempt` (0-based),
+        or None if the call should not be retried.
+        """
+        if attempt >= self.retries:
+            return None
+        if retry_after is not None and retry_after > self.max_delay:
+            return None
+
+        delay = random.uniform(0.0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        with self._lock:
+            self._scheduled += 1
+        return delay
+
+    @property
+    def scheduled(self) -> int:
+        """Retries scheduled since startup."""
+        return self._scheduled
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Retry-After header as seconds from now; accepts delta-seconds and HTTP dates."""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after `failure_threshold` consecutive failures. While open every
+    call fails fast with CircuitOpenError. After `reset_timeout` seconds one probe
+    call is let through (half-open): success closes the circuit, failure opens it again.
+    A probe that ends without being recorded (e.g. an unexpected exception or a
+    cancelled task) must be handed back with release_probe(), otherwise the
+    circuit would stay half-open and reject every call. fail_fast() rejects calls
+    without taking the probe, for callers that must wait (e.g. for a rate limit
+    token) between deciding to call and calling.
+
+    State is per process; every worker learns about an outage from its own calls.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        self._rejected = 0
+        self._opened = 0
+
+    def fail_fast(self) -> None:
+        """
+        Reject a call that check() would reject right now, without taking the probe.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and cooling down, or half-open with a probe already running
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if (self._state == self.OPEN and remaining > 0) or (self._state == self.HALF_OPEN and self._probe_in_flight):
+                raise self._open_error(remaining)
+
+    def check(self) -> bool:
+        """
+        Returns:
+            True if this call is the half-open probe; the caller must record its outcome
+            or call release_probe()
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a probe already running
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return False
+
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if self._state == self.OPEN and remaining <= 0:
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+
+            raise self._open_error(remaining)
+
+    def _open_error(self, remaining: float) -> CircuitOpenError:
+        # Called with the lock held
+        self._rejected += 1
+        return CircuitOpenError(
+            f"{self.name} is unavailable after {self._failures} consecutive failures; "
+            f"requests are paused for another {max(0.0, remaining):.0f}s."
+        )
+
+    def release_probe(self) -> None:
+        """Let another probe through after one that ended without a recorded outcome (no-op once recorded)."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self._opened += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "times_opened": self._opened,
+                "rejected": self._rejected
+            }
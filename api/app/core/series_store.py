@@ -0,0 +1,115 @@
+"""
+In-memory store of PVGIS hourly series as NumPy columns.
+
+Series are kept per site (latitude, longitude, slope, azimuth, radiation database)
+and year, so any year range is assembled from the years already in memory and only
+the missing years are fetched. Arrays are read-only and shared by every caller;
+analytics run vectorised over them instead of re-parsing responses.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+from ..dataclasses.hourly_series_dc import HourlySeriesDataclass
+
+SiteKey = Tuple[float, float, float, float, str]
+
+
+class HourlySeriesStore:
+    """
+    LRU of (site, year) -> (PVGIS `inputs` section, series), bounded by the bytes of
+    the stored arrays (memory_bytes). A series larger than the whole budget is
+    returned to the caller but not stored.
+
+    Only the radiation variables are kept: the time axis (int64 epoch seconds, exposed
+    as datetime64[s]) plus G(i), H_sun, T2m, WS10m and Int as float64.
+    Each stored year also keeps its calendar index, so day and hour selections
+    gather rows directly.
+    """
+
+    COLUMNS = ("G(i)", "H_sun", "T2m", "WS10m", "Int")
+
+    def __init__(self, memory_bytes: int):
+        self.memory_bytes = memory_bytes
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[SiteKey, int], Tuple[Dict[str, Any], HourlySeriesDataclass, int]]" = OrderedDict()
+        self._size = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evicted = 0
+
+    @staticmethod
+    def site_key(latitude: float, longitude: float, slope: float, azimuth: float,
+                 database: Optional[str]) -> SiteKey:
+        """Normalized site key; coordinates are rounded so float noise does not split entries."""
+        return (round(float(latitude), 6), round(float(longitude), 6), float(slope), float(azimuth), database or "default")
+
+    def get(self, site: SiteKey, year: int) -> Optional[Tuple[Dict[str, Any], HourlySeriesDataclass]]:
+        with self._lock:
+            entry = self._entries.get((site, year))
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end((site, year))
+            self._hits += 1
+            return entry[0], entry[1]
+
+    def put(self, site: SiteKey, year: int, inputs: Dict[str, Any],
+            series: HourlySeriesDataclass) -> Tuple[Dict[str, Any], HourlySeriesDataclass]:
+        """
+        Store one year of a site. The stored columns are made read-only and the
+        series' calendar index is built here, once, before it is shared.
+
+        Returns:
+            (inputs, series) as stored, for the caller to use instead of its own copy
+        """
+        stored = HourlySeriesDataclass(
+            times=HourlySeriesStore._frozen(series.times, "datetime64[s]"),
+            columns={name: HourlySeriesStore._frozen(series.column(name), np.float64) for name in self.COLUMNS}
+        )
+        calendar = stored.calendar()
+        size = (stored.times.nbytes + sum(values.nbytes for values in stored.columns.values())
+                + calendar.order.nbytes + calendar.offsets.nbytes)
+        if size > self.memory_bytes:
+            return inputs, stored
+
+        with self._lock:
+            old = self._entries.pop((site, year), None)
+            if old is not None:
+                self._size -= old[2]
+            self._entries[(site, year)] = (inputs, stored, size)
+            self._size += size
+            while self._size > self.memory_bytes:
+                _, (_, _, old_size) = self._entries.popitem(last=False)
+                self._size -= old_size
+                self._evicted += 1
+        return inputs, stored
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "sites": len({site for site, _ in self._entries}),
+                "memory_bytes": self._size,
+                "memory_max_bytes": self.memory_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "evicted": self._evicted
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    @staticmethod
+    def _frozen(values: np.ndarray, dtype) -> np.ndarray:
+        # Own copy: the source arrays may be shared with other callers of the same fetch
+        array = np.array(values, dtype=dtype)
+        array.flags.writeable = False
+        return array
@@ -0,0 +1,105 @@
+"""
+In-flight de-duplication of identical calls.
+
+While a call for a key is running, further calls for the same key do not start
+their own work; they wait for the running one and receive its result (or its
+exception). Nothing is kept once the call finishes — caching is a separate layer.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one execution.
+
+    Threads use do(); coroutines use do_async(). The two groups are tracked
+    separately (a thread never waits on an event loop task), but share the counters.
+    Results are shared by reference, so callers must not mutate them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._tasks: Dict[Tuple[int, str], "asyncio.Task"] = {}
+
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run fn() unless a call for `key` is already running in another thread; then wait for it."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await factory() unless a call for `key` is already running on this event loop; then await that one.
+        The shared call runs as its own task, so cancelling one waiter does not cancel it for the others.
+        """
+        # Tasks belong to one loop, so calls on different loops never share them
+        task_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is not None and not task.done():
+                self._coalesced += 1
+            else:
+                task = asyncio.ensure_future(factory())
+                self._tasks[task_key] = task
+                self._executed += 1
+                task.add_done_callback(lambda t, k=task_key: self._forget_task(k, t))
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        """Executed calls, coalesced calls (executions saved) and calls running right now."""
+        with self._lock:
+            return {
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls) + sum(1 for t in self._tasks.values() if not t.done())
+            }
+
+    def _forget_task(self, key: Tuple[int, str], task: "asyncio.Task") -> None:
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        # Mark the exception as retrieved when every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
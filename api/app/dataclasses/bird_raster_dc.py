@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+
+@dataclass
+class RasterJobConfig:
+    """Parameters for a tiled Bird Model raster job over a lat/lon bounding box."""
+    lat_min: float             # degrees (South edge)
+    lat_max: float             # degrees (North edge)
+    lon_min: float             # degrees (West edge)
+    lon_max: float             # degrees (East edge)
+    resolution: float          # grid spacing in degrees (e.g., 0.05)
+    timestamps: List[datetime] # timestamps to evaluate (naive = UTC, aware are converted)
+    output_dir: Path           # directory for tiles, manifest and mosaics
+    solar_constant: float = 1367.0   # W/m²
+    elevation: float = 0.0           # meters above sea level (applied to every cell)
+    station_pressure: float = 1013.25  # mbar (sea-level weather report pressure)
+    albedo: float = 0.2              # dimensionless surface reflectivity (0–1)
+    ozone: float = 0.3               # total column ozone (atm-cm)
+    water_vapor: float = 1.5         # precipitable water vapor (cm)
+    aot500: float = 0.1              # aerosol optical depth @ 500 nm
+    aot380: float = 0.15             # aerosol optical depth @ 380 nm
+    tile_size: Optional[int] = None  # cells per tile edge (default: settings.RASTER_TILE_SIZE)
+    workers: Optional[int] = None    # process pool size (default: settings.RASTER_MAX_WORKERS)
+    fast_transmittance: bool = False # tabulated transmittances (see TransmittanceTables)
+
+
+@dataclass
+class RasterTile:
+    """One rectangular block of the raster grid."""
+    row: int    # first grid row (north to south)
+    col: int    # first grid column (west to east)
+    rows: int
+    cols: int
+
+    @property
+    def name(self) -> str:
+        return f"r{self.row:05d}_c{self.col:05d}"
+
+
+@dataclass
+class RasterJobResult:
+    """Summary of a raster job run."""
+    output_dir: Path
+    shape: tuple                       # (timestamps, rows, cols)
+    total_tiles: int
+    computed_tiles: int                # tiles computed in this run
+    skipped_tiles: int                 # tiles restored from the checkpoint
+    failed_tiles: List[str] = field(default_factory=list)
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+import numpy as np
+
+
+@dataclass
+class ClearSkyIndexDataclass:
+    """Measured and Bird Model clear-sky irradiance aligned on one UTC time axis."""
+    times: np.ndarray                # datetime64[s] (UTC)
+    measured: np.ndarray             # W/m² (PVGIS global irradiance)
+    zenith_angle: np.ndarray         # degrees
+    direct_horizontal: np.ndarray    # W/m² (clear sky)
+    diffuse_horizontal: np.ndarray   # W/m² (clear sky)
+    total_horizontal: np.ndarray     # W/m² (clear sky)
+    clear_sky_index: np.ndarray      # measured / total_horizontal (NaN where the clear-sky value is too low)
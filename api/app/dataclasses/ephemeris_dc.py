@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Union
+import numpy as np
+
+FloatOrArray = Union[float, np.ndarray]
+
+
+@dataclass(frozen=True)
+class EphemerisDataclass:
+    """
+    Location-independent part of the solar position for one Julian date (or an array of them).
+    Shared by every site evaluated at the same instant.
+    """
+    right_ascension: FloatOrArray     # radians
+    declination: FloatOrArray         # radians
+    sidereal_time: FloatOrArray       # degrees (Greenwich mean sidereal time, 0–360)
+    earth_sun_distance: FloatOrArray  # AU
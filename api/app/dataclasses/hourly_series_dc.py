@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import numpy as np
+from ..utils.calendar_index import CalendarIndex, CalendarFilter
+
+
+@dataclass
+class HourlySeriesDataclass:
+    """PVGIS hourly series as typed columns on one UTC time axis."""
+    times: np.ndarray                                          # datetime64[s] (UTC)
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)  # PVGIS variable ("G(i)", "T2m", ...) -> float64
+    _calendar: Optional[CalendarIndex] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def epoch(self) -> np.ndarray:
+        """Time axis as int64 seconds since 1970-01-01 UTC (a view, no copy)."""
+        return self.times.view(np.int64)
+
+    def column(self, name: str, default: float = np.nan) -> np.ndarray:
+        """Values of one PVGIS variable; filled with `default` if the series does not contain it."""
+        values = self.columns.get(name)
+        return values if values is not None else np.full(self.times.size, default)
+
+    def calendar(self) -> CalendarIndex:
+        """(month, day, hour) index of the rows, built on first use and kept with the series."""
+        if self._calendar is None:
+            self._calendar = CalendarIndex(self.times)
+        return self._calendar
+
+    def select(self, month: CalendarFilter = None, day: CalendarFilter = None,
+               hour: CalendarFilter = None) -> "HourlySeriesDataclass":
+        """Records of the given calendar months/days/hours (value, set, or None for any), gathered through the calendar index."""
+        return self.take(self.calendar().rows(month, day, hour))
+
+    def take(self, mask: np.ndarray) -> "HourlySeriesDataclass":
+        """New series with the records selected by a boolean mask (or index array)."""
+        return HourlySeriesDataclass(
+            times=self.times[mask],
+            columns={name: values[mask] for name, values in self.columns.items()}
+        )
+
+    @staticmethod
+    def concatenate(parts: List["HourlySeriesDataclass"]) -> "HourlySeriesDataclass":
+        """Join series end to end; parts must already be in time order. Columns missing from a part are NaN there."""
+        if not parts:
+            return HourlySeriesDataclass(times=np.empty(0, dtype="datetime64[s]"))
+        names = list(dict.fromkeys(name for part in parts for name in part.columns))
+        return HourlySeriesDataclass(
+            times=np.concatenate([part.times for part in parts]),
+            columns={name: np.concatenate([part.column(name) for part in parts]) for name in names}
+        )
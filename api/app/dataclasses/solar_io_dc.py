@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+import numpy as np
+from numpy.typing import ArrayLike
 from ..core.config_loader import settings
 
 """
@@ -40,4 +42,42 @@ class SolarOutputsDataclass:
     corrected_solar_constant: float
     direct_horizontal: float
     diffuse_horizontal: float
-    total_horizontal: float
\ No newline at end of file
+    total_horizontal: float
+
+
+@dataclass
+class SolarInputsArrayDataclass:
+    """
+    Vectorised counterpart of SolarInputsDataclass used by BirdModel.calculate_array.
+    Every field accepts a NumPy array or a scalar; all fields must broadcast together.
+    """
+    solar_constant: ArrayLike
+    longitude: ArrayLike
+    latitude: ArrayLike
+    elevation: ArrayLike
+    month: ArrayLike
+    day: ArrayLike
+    year: ArrayLike
+    hour: ArrayLike
+    minute: ArrayLike
+    second: ArrayLike
+    station_pressure: ArrayLike
+    albedo: ArrayLike
+    ozone: ArrayLike
+    water_vapor: ArrayLike
+    aot500: ArrayLike
+    aot380: ArrayLike
+
+
+@dataclass
+class SolarOutputsArrayDataclass:
+    """Struct-of-arrays outputs from BirdModel.calculate_array (one element per input point)."""
+    julian_date: np.ndarray
+    station_pressure: np.ndarray
+    earth_sun_distance: np.ndarray
+    zenith_angle: np.ndarray
+    air_mass: np.ndarray
+    corrected_solar_constant: np.ndarray
+    direct_horizontal: np.ndarray
+    diffuse_horizontal: np.ndarray
+    total_horizontal: np.ndarray
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+import numpy as np
+
+
+@dataclass
+class SunTimesDataclass:
+    """Daily Sun events for one site (one array entry per day, times as Julian dates)."""
+    solar_noon: np.ndarray      # Julian date of the Sun's upper transit
+    sunrise: np.ndarray         # Julian date (NaN when the Sun does not rise above the altitude)
+    sunset: np.ndarray          # Julian date (NaN when the Sun does not set below the altitude)
+    noon_elevation: np.ndarray  # degrees (Sun's elevation at solar noon)
+    day_length: np.ndarray      # hours above the altitude (24 for polar day, 0 for polar night)
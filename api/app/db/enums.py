@@ -41,3 +41,13 @@ class OutputFormat(str, Enum):
     CSV = "csv"
     BASIC = "basic"
     EPW = "epw"
+
+
+class AggregateGrouping(str, Enum):
+    """Grouping of the records in a PVGIS Plus aggregation."""
+    ALL = "all"
+    MONTH = "month"
+    DAY = "day"
+    HOUR = "hour"
+    MONTH_HOUR = "month_hour"
+    DAY_HOUR = "day_hour"
\ No newline at end of file
@@ -3,7 +3,19 @@ from fastapi import status as http_status
 from pydantic import ValidationError
 from ..core.logger import app_logger as logger
 from ..services.birdmodel import BirdModel
-from ..schemas.solar_io_schemas import SolarInputsSchema, SolarOutputsSchema
+from ..services.bird_series import BirdSeriesService
+from ..services.bird_insolation import BirdInsolationService
+from ..services.bird_batch import BirdBatchService
+from ..schemas.solar_io_schemas import (
+    SolarInputsSchema,
+    SolarOutputsSchema,
+    BirdSeriesRequest,
+    BirdSeriesResponse,
+    BirdInsolationRequest,
+    BirdInsolationResponse,
+    BirdBatchRequest,
+    BirdBatchResponse
+)
 
 router = APIRouter(prefix="/calculator", tags=["Calculator"])
 
@@ -58,4 +70,110 @@ def bird_model(inputs: SolarInputsSchema) -> SolarOutputsSchema:
 
     except Exception as e:
         logger.exception("Unexpected error in Bird model endpoint: %s", e)
-        raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error while calculating Bird model")
\ No newline at end of file
+        raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error while calculating Bird model")
+
+
+@router.post("/bird_model/series", response_model=BirdSeriesResponse)
+def bird_model_series(request: BirdSeriesRequest) -> BirdSeriesResponse:
+    """
+    Calculate a Bird & Hulstrom clear sky irradiance time series for one site.
+    
+    Atmospheric inputs are held fixed while time steps from `start` to `end`
+    (inclusive) every `step_minutes`. The whole range is computed in one
+    vectorised pass and returned as columnar arrays, one entry per time step.
+    
+    Use cases:
+    - Daily or yearly clear-sky curves for dashboards
+    - Clear-sky baselines for measured irradiance series
+    
+    Steps with the sun below the horizon report zero irradiance and air mass.
+    All times are in UTC.
+    """
+    logger.info(
+        f"Bird model series for ({request.latitude}, {request.longitude}), "
+        f"{request.start} -> {request.end} every {request.step_minutes} min"
+    )
+
+    try:
+        return BirdSeriesService.calculate_series(request)
+
+    except ValidationError as e:
+        logger.exception("Validation error while processing Bird model series: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+    except ValueError as e:
+        logger.exception("Value error in Bird model series calculation: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    except Exception as e:
+        logger.exception("Unexpected error in Bird model series endpoint: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error while calculating Bird model series")
+
+
+@router.post("/bird_model/insolation", response_model=BirdInsolationResponse)
+def bird_model_insolation(request: BirdInsolationRequest) -> BirdInsolationResponse:
+    """
+    Calculate daily, monthly and annual clear-sky insolation (Wh/m²) for one site.
+    
+    For every day in the range, sunrise and sunset are located from the solar
+    position and Bird model irradiance is integrated over daylight only, using
+    adaptive Gauss-Legendre quadrature to the requested relative `tolerance`.
+    
+    Returns:
+    - Daily direct, diffuse and total insolation with sunrise, sunset and day length
+    - Monthly and annual sums over the days in the requested range
+    
+    Days are local solar days; sunrise and sunset are reported in UTC.
+    """
+    logger.info(
+        f"Bird model insolation for ({request.latitude}, {request.longitude}), "
+        f"{request.start_date} -> {request.end_date}"
+    )
+
+    try:
+        return BirdInsolationService.calculate(request)
+
+    except ValidationError as e:
+        logger.exception("Validation error while processing Bird model insolation: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+    except ValueError as e:
+        logger.exception("Value error in Bird model insolation calculation: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    except Exception as e:
+        logger.exception("Unexpected error in Bird model insolation endpoint: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error while calculating Bird model insolation")
+
+
+@router.post("/bird_model/batch", response_model=BirdBatchResponse)
+def bird_model_batch(request: BirdBatchRequest) -> BirdBatchResponse:
+    """
+    Calculate the Bird & Hulstrom clear sky model for many unrelated inputs at once.
+    
+    Accepts either a list of `records` (each shaped like `/calculator/bird_model` input)
+    or `columns` (one list per input field). Columnar payloads are validated and
+    parsed much faster for large batches.
+    
+    The batch is split into chunks that run in parallel on a process pool; the
+    response is columnar and keeps the input order.
+    
+    Points with the sun below the horizon report zero irradiance and air mass.
+    """
+    count = len(request.records) if request.records is not None else len(request.columns.latitude)
+    logger.info(f"Bird model batch with {count} points")
+
+    try:
+        return BirdBatchService.calculate(request)
+
+    except ValidationError as e:
+        logger.exception("Validation error while processing Bird model batch: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+    except ValueError as e:
+        logger.exception("Value error in Bird model batch calculation: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    except Exception as e:
+        logger.exception("Unexpected error in Bird model batch endpoint: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error while calculating Bird model batch")
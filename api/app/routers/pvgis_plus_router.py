@@ -3,16 +3,24 @@ from fastapi import status as http_status
 from pydantic import ValidationError
 from ..core.logger import app_logger as logger
 from ..services.pvgis_plus import PVGISPlusService
+from ..services.clear_sky_index import ClearSkyIndexService
 from ..schemas.pvgis_schemas import (
     PVGISDayAverageRequest,
-    PVGISDayAverageResponse
+    PVGISDayAverageResponse,
+    PVGISDayAverageCubeRequest,
+    PVGISDayAverageCubeResponse,
+    PVGISDayStatisticsResponse,
+    PVGISAggregateRequest,
+    PVGISAggregateResponse,
+    ClearSkyIndexRequest,
+    ClearSkyIndexResponse
 )
 
 router = APIRouter(prefix="/pvgis-plus", tags=["PVGIS Plus"])
 
 
 @router.post("/day-average", response_model=PVGISDayAverageResponse)
-def get_day_average(request: PVGISDayAverageRequest) -> PVGISDayAverageResponse:
+async def get_day_average(request: PVGISDayAverageRequest) -> PVGISDayAverageResponse:
     """
     Calculate hourly average solar data for a specific calendar day across multiple years.
     
@@ -37,7 +45,7 @@ def get_day_average(request: PVGISDayAverageRequest) -> PVGISDayAverageResponse:
     )
     
     try:
-        result = PVGISPlusService.calculate_day_average(request)
+        result = await PVGISPlusService.calculate_day_average_async(request)
         
         logger.info(
             f"Successfully calculated averages for {len(result.years_analyzed)} years. "
@@ -61,3 +69,170 @@ def get_day_average(request: PVGISDayAverageRequest) -> PVGISDayAverageResponse:
     except Exception as e:
         logger.exception("Unexpected error in PVGIS day average endpoint: %s", e)
         raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error while calculating day average")
+
+
+@router.post("/day-statistics", response_model=PVGISDayStatisticsResponse)
+async def get_day_statistics(request: PVGISDayAverageRequest) -> PVGISDayStatisticsResponse:
+    """
+    Year-to-year distribution of the hourly solar data of a specific calendar day.
+    
+    For every hour and variable (G_i, H_sun, T2m, WS10m, Int):
+    - Mean, sample standard deviation, minimum and maximum
+    - P10 / P50 / P90 (within 1% of the exact sample of that rank)
+    
+    Takes the same parameters as /day-average. Intended for bankability reports
+    that need the spread across years, not only the average.
+    """
+    logger.info(
+        f"Calculating day statistics for {request.month:02d}/{request.day:02d} "
+        f"at ({request.latitude}, {request.longitude})"
+    )
+    
+    try:
+        result = await PVGISPlusService.calculate_day_statistics_async(request)
+        
+        logger.info(f"Successfully calculated day statistics for {len(result.years_analyzed)} years")
+        
+        return result
+        
+    except ValidationError as e:
+        logger.exception("Validation error in PVGIS day statistics: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    
+    except ValueError as e:
+        logger.exception("Value error in PVGIS day statistics: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    except RuntimeError as e:
+        logger.exception("Runtime error in PVGIS day statistics: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_502_BAD_GATEWAY, detail=f"Error communicating with PVGIS API: {str(e)}")
+    
+    except Exception as e:
+        logger.exception("Unexpected error in PVGIS day statistics endpoint: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error while calculating day statistics")
+
+
+@router.post("/day-average-cube", response_model=PVGISDayAverageCubeResponse)
+async def get_day_average_cube(request: PVGISDayAverageCubeRequest) -> PVGISDayAverageCubeResponse:
+    """
+    Calculate the hourly averages of every calendar day of the year at once.
+    
+    Returns a 366 x 24 matrix per variable (G_i, H_sun, T2m, WS10m, Int), rows
+    labelled by `dates` (MM-DD, February 29 included), with the sample counts and
+    each day's peak hour, peak irradiance and daily total. Row "04-15" holds the
+    same values /day-average returns for April 15.
+    
+    Use this instead of calling /day-average date by date for the same site:
+    the series is fetched once and reduced in a single grouped pass.
+    """
+    logger.info(
+        f"Calculating day average cube at ({request.latitude}, {request.longitude}), "
+        f"{request.start_year}-{request.end_year}"
+    )
+    
+    try:
+        result = await PVGISPlusService.calculate_day_average_cube_async(request)
+        
+        logger.info(f"Successfully calculated day average cube for {len(result.years_analyzed)} years")
+        
+        return result
+        
+    except ValidationError as e:
+        logger.exception("Validation error in PVGIS day average cube: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    
+    except ValueError as e:
+        logger.exception("Value error in PVGIS day average cube: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    except RuntimeError as e:
+        logger.exception("Runtime error in PVGIS day average cube: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_502_BAD_GATEWAY, detail=f"Error communicating with PVGIS API: {str(e)}")
+    
+    except Exception as e:
+        logger.exception("Unexpected error in PVGIS day average cube endpoint: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error while calculating day average cube")
+
+
+@router.post("/aggregate", response_model=PVGISAggregateResponse)
+async def get_aggregate(request: PVGISAggregateRequest) -> PVGISAggregateResponse:
+    """
+    Average PVGIS hourly data over selected months, days and UTC hours, grouped on the server.
+    
+    - **months**: months to include, e.g. [4] for April
+    - **days** / **hours**: days of the month and UTC hours to include (all if omitted)
+    - **group_by**: all, month, day, hour, month_hour or day_hour
+    
+    Examples:
+    - Every April day at 03, 06, 09, 12 and 15 UTC, per hour: months=[4], hours=[3, 6, 9, 12, 15], group_by=hour
+    - Each April day, hour by hour: months=[4], group_by=day_hour
+    - April 15ths only, hour by hour: months=[4], days=[15], group_by=hour
+    
+    Groups without samples (e.g. April 31) are omitted.
+    """
+    logger.info(
+        f"Aggregating months={request.months}, days={request.days}, hours={request.hours} "
+        f"by {request.group_by.value} at ({request.latitude}, {request.longitude})"
+    )
+    
+    try:
+        result = await PVGISPlusService.calculate_aggregate_async(request)
+        
+        logger.info(f"Successfully aggregated {result.record_count} records into {len(result.groups)} groups")
+        
+        return result
+        
+    except ValidationError as e:
+        logger.exception("Validation error in PVGIS aggregate: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    
+    except ValueError as e:
+        logger.exception("Value error in PVGIS aggregate: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    except RuntimeError as e:
+        logger.exception("Runtime error in PVGIS aggregate: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_502_BAD_GATEWAY, detail=f"Error communicating with PVGIS API: {str(e)}")
+    
+    except Exception as e:
+        logger.exception("Unexpected error in PVGIS aggregate endpoint: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error while aggregating PVGIS data")
+
+
+@router.post("/clear-sky-index", response_model=ClearSkyIndexResponse)
+async def get_clear_sky_index(request: ClearSkyIndexRequest) -> ClearSkyIndexResponse:
+    """
+    Compare PVGIS hourly irradiance with the Bird clear-sky model on the same time axis.
+
+    - Fetches the PVGIS hourly series for a horizontal plane (G(i) = global horizontal irradiance)
+    - Evaluates the Bird Model at every PVGIS timestamp in a single vectorised pass
+    - Returns both series side by side with the clear-sky index (measured / clear sky)
+    - Hours with clear-sky irradiance below min_clear_sky report a null index
+    """
+    logger.info(
+        f"Calculating clear-sky index for ({request.latitude}, {request.longitude}), "
+        f"{request.start_year}-{request.end_year}"
+    )
+
+    try:
+        result = await ClearSkyIndexService.calculate_async(request)
+
+        logger.info(f"Clear-sky index calculated for {result.count} records ({result.valid_count} valid)")
+
+        return result
+
+    except ValidationError as e:
+        logger.exception("Validation error in clear-sky index: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+    except ValueError as e:
+        logger.exception("Value error in clear-sky index: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    except RuntimeError as e:
+        logger.exception("Runtime error in clear-sky index: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_502_BAD_GATEWAY, detail=f"Error communicating with PVGIS API: {str(e)}")
+
+    except Exception as e:
+        logger.exception("Unexpected error in clear-sky index endpoint: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error while calculating clear-sky index")
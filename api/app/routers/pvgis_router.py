@@ -4,13 +4,14 @@ from pydantic import ValidationError
 from typing import Dict, Any
 from ..core.logger import app_logger as logger
 from ..services.pvgis import PVGISService
+from ..services.pvgis_async import AsyncPVGISService
 from ..schemas.pvgis_schemas import *
 
 router = APIRouter(prefix="/pvgis", tags=["PVGIS"])
 
 
 @router.post("/pvcalc", response_model=Dict[str, Any])
-def pv_calculator(request: PVCalcRequest) -> Dict[str, Any]:
+async def pv_calculator(request: PVCalcRequest) -> Dict[str, Any]:
     """
     Calculate PV energy production for grid-connected systems.
     
@@ -26,7 +27,7 @@ def pv_calculator(request: PVCalcRequest) -> Dict[str, Any]:
     logger.info(f"PVcalc request for ({request.lat}, {request.lon}), power={request.peakpower}kW")
     
     try:
-        result = PVGISService.pvcalc(request)
+        result = await AsyncPVGISService.pvcalc(request)
         logger.info("PVcalc completed successfully")
         return result
         
@@ -44,7 +45,7 @@ def pv_calculator(request: PVCalcRequest) -> Dict[str, Any]:
 
 
 @router.post("/shscalc", response_model=Dict[str, Any])
-def off_grid_calculator(request: SHSCalcRequest) -> Dict[str, Any]:
+async def off_grid_calculator(request: SHSCalcRequest) -> Dict[str, Any]:
     """
     Calculate performance of off-grid (stand-alone) PV systems with battery storage.
     
@@ -59,7 +60,7 @@ def off_grid_calculator(request: SHSCalcRequest) -> Dict[str, Any]:
     logger.info(f"SHScalc request for ({request.lat}, {request.lon}), battery={request.batterysize}Wh")
     
     try:
-        result = PVGISService.shscalc(request)
+        result = await AsyncPVGISService.shscalc(request)
         logger.info("SHScalc completed successfully")
         return result
         
@@ -77,7 +78,7 @@ def off_grid_calculator(request: SHSCalcRequest) -> Dict[str, Any]:
 
 
 @router.post("/mrcalc", response_model=Dict[str, Any])
-def monthly_radiation(request: MRCalcRequest) -> Dict[str, Any]:
+async def monthly_radiation(request: MRCalcRequest) -> Dict[str, Any]:
     """
     Calculate monthly average radiation values.
     
@@ -94,7 +95,7 @@ def monthly_radiation(request: MRCalcRequest) -> Dict[str, Any]:
     logger.info(f"MRcalc request for ({request.lat}, {request.lon})")
     
     try:
-        result = PVGISService.mrcalc(request)
+        result = await AsyncPVGISService.mrcalc(request)
         logger.info("MRcalc completed successfully")
         return result
         
@@ -112,7 +113,7 @@ def monthly_radiation(request: MRCalcRequest) -> Dict[str, Any]:
 
 
 @router.post("/drcalc", response_model=Dict[str, Any])
-def daily_radiation(request: DRCalcRequest) -> Dict[str, Any]:
+async def daily_radiation(request: DRCalcRequest) -> Dict[str, Any]:
     """
     Calculate daily radiation profiles for a specific month.
     
@@ -129,7 +130,7 @@ def daily_radiation(request: DRCalcRequest) -> Dict[str, Any]:
     logger.info(f"DRcalc request for ({request.lat}, {request.lon}), month={request.month}")
     
     try:
-        result = PVGISService.drcalc(request)
+        result = await AsyncPVGISService.drcalc(request)
         logger.info("DRcalc completed successfully")
         return result
         
@@ -147,7 +148,7 @@ def daily_radiation(request: DRCalcRequest) -> Dict[str, Any]:
 
 
 @router.post("/seriescalc", response_model=Dict[str, Any])
-def hourly_time_series(request: SeriesCalcRequest) -> Dict[str, Any]:
+async def hourly_time_series(request: SeriesCalcRequest) -> Dict[str, Any]:
     """
     Get hourly radiation time series data for a multi-year period.
     
@@ -164,7 +165,7 @@ def hourly_time_series(request: SeriesCalcRequest) -> Dict[str, Any]:
     logger.info(f"Seriescalc request for ({request.lat}, {request.lon}), years={request.startyear}-{request.endyear}")
     
     try:
-        result = PVGISService.seriescalc(request)
+        result = await AsyncPVGISService.seriescalc(request)
         logger.info("Seriescalc completed successfully")
         return result
         
@@ -182,7 +183,7 @@ def hourly_time_series(request: SeriesCalcRequest) -> Dict[str, Any]:
 
 
 @router.post("/tmy", response_model=Dict[str, Any])
-def typical_meteorological_year(request: TMYRequest) -> Dict[str, Any]:
+async def typical_meteorological_year(request: TMYRequest) -> Dict[str, Any]:
     """
     Get Typical Meteorological Year (TMY) data.
     
@@ -199,7 +200,7 @@ def typical_meteorological_year(request: TMYRequest) -> Dict[str, Any]:
     logger.info(f"TMY request for ({request.lat}, {request.lon}), years={request.startyear}-{request.endyear}")
     
     try:
-        result = PVGISService.tmy(request)
+        result = await AsyncPVGISService.tmy(request)
         logger.info("TMY completed successfully")
         return result
         
@@ -217,7 +218,7 @@ def typical_meteorological_year(request: TMYRequest) -> Dict[str, Any]:
 
 
 @router.post("/horizon", response_model=Dict[str, Any])
-def horizon_profile(request: HorizonRequest) -> Dict[str, Any]:
+async def horizon_profile(request: HorizonRequest) -> Dict[str, Any]:
     """
     Get horizon profile data for a location.
     
@@ -234,7 +235,7 @@ def horizon_profile(request: HorizonRequest) -> Dict[str, Any]:
     logger.info(f"Horizon request for ({request.lat}, {request.lon})")
     
     try:
-        result = PVGISService.printhorizon(request)
+        result = await AsyncPVGISService.printhorizon(request)
         logger.info("Horizon completed successfully")
         return result
         
@@ -248,4 +249,90 @@ def horizon_profile(request: HorizonRequest) -> Dict[str, Any]:
     
     except Exception as e:
         logger.exception("Unexpected error in Horizon: %s", e)
-        raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error in Horizon")
\ No newline at end of file
+        raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error in Horizon")
+
+
+@router.get("/client-stats", response_model=PVGISClientStatsResponse)
+def client_stats() -> PVGISClientStatsResponse:
+    """
+    Report connection reuse of the shared PVGIS HTTP session.
+    
+    - **requests_sent**: requests sent through the blocking session
+    - **async_requests_sent**: requests sent through the async client used by the API endpoints
+    - **coalesced_requests**: requests that shared an identical in-flight upstream call instead of starting their own
+    - **retries** / **circuit_state**: transient failures retried and the state of the PVGIS circuit breaker
+    - **connections_opened**: TCP/TLS handshakes actually made
+    - **connections_reused**: requests served on a kept-alive connection
+    - **idle_connections**: open connections currently waiting in the pool
+    """
+    stats = PVGISService.client_stats()
+    stats["async_requests_sent"] = AsyncPVGISService.requests_sent()
+    flights = PVGISService.single_flight_stats()
+    stats.update(upstream_calls=flights["executed"], coalesced_requests=flights["coalesced"],
+                 in_flight=flights["in_flight"])
+    stats.update(PVGISService.resilience_stats())
+    logger.info(
+        f"PVGIS client stats: {stats['requests_sent']} requests, "
+        f"{stats['connections_opened']} connections opened, {stats['connections_reused']} reused, "
+        f"{stats['coalesced_requests']} coalesced"
+    )
+    return PVGISClientStatsResponse(**stats)
+
+
+@router.get("/rate-limit", response_model=PVGISRateLimitStatsResponse)
+def rate_limit_stats() -> PVGISRateLimitStatsResponse:
+    """
+    Report the state of the PVGIS token bucket shared by all workers.
+    
+    - **shared_queue_depth**: calls of all workers waiting for a slot
+    - **queue_depth**: calls of this worker waiting right now
+    - **mean_wait_seconds** / **max_wait_seconds**: time calls spent queued in this worker
+    """
+    stats = PVGISService.rate_limiter().stats()
+    logger.info(
+        f"PVGIS rate limiter stats: {stats['acquired']} acquired, {stats['delayed']} delayed, "
+        f"queue depth {stats['queue_depth']} (shared {stats['shared_queue_depth']})"
+    )
+    return PVGISRateLimitStatsResponse(**stats)
+
+
+@router.get("/cache-stats", response_model=PVGISCacheStatsResponse)
+def cache_stats() -> PVGISCacheStatsResponse:
+    """
+    Report hit rates and size of the PVGIS response cache.
+    
+    - **hits_memory** / **hits_disk** / **misses**: lookups of this worker by tier
+    - **disk_bytes**: compressed size on disk, shared by all workers
+    - **evicted** / **expired**: entries removed by the LRU size bound and the TTL
+    """
+    cache = PVGISService.response_cache()
+    if cache is None:
+        return PVGISCacheStatsResponse(enabled=False)
+    
+    stats = cache.stats()
+    logger.info(
+        f"PVGIS cache stats: {stats['entries']} entries, {stats['disk_bytes']} bytes, "
+        f"hit ratio {stats['hit_ratio']:.3f}"
+    )
+    return PVGISCacheStatsResponse(enabled=True, **stats)
+
+
+@router.get("/series-store-stats", response_model=PVGISSeriesStoreStatsResponse)
+def series_store_stats() -> PVGISSeriesStoreStatsResponse:
+    """
+    Report size and hit rate of the in-memory hourly series store used by the analytics endpoints.
+    
+    - **entries** / **sites**: site-years held and the distinct sites they belong to
+    - **hits** / **misses**: site-year lookups of this worker
+    - **evicted**: site-years dropped by the LRU memory budget
+    """
+    store = PVGISService.series_store()
+    if store is None:
+        return PVGISSeriesStoreStatsResponse(enabled=False)
+    
+    stats = store.stats()
+    logger.info(
+        f"PVGIS series store stats: {stats['entries']} site-years, {stats['memory_bytes']} bytes, "
+        f"hit ratio {stats['hit_ratio']:.3f}"
+    )
+    return PVGISSeriesStoreStatsResponse(enabled=True, **stats)
\ No newline at end of file
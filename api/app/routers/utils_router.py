@@ -1,3 +1,4 @@
+import numpy as np
 from fastapi import APIRouter, HTTPException
 from fastapi import status as http_status
 from pydantic import ValidationError
@@ -5,6 +6,9 @@ from ..core.logger import app_logger as logger
 from ..utils.julianday import JulianDateCalculator
 from ..utils.pressure import PressureCalculator
 from ..utils.solar_position import SolarPositionCalculator
+from ..utils.sun_times import SunTimesCalculator
+from ..utils.time_axis import TimeAxis
+from ..core.config_loader import settings
 from ..schemas.utils_schemas import (
     JulianDayRequest,
     JulianDayResponse,
@@ -13,7 +17,10 @@ from ..schemas.utils_schemas import (
     SolarPositionRequest,
     SolarPositionResponse,
     SolarPositionBatchRequest,
-    SolarPositionBatchResponse
+    SolarPositionBatchResponse,
+    EphemerisCacheStatsResponse,
+    SunTimesRequest,
+    SunTimesResponse
 )
 
 router = APIRouter(prefix="/utils", tags=["Utilities"])
@@ -340,3 +347,84 @@ def calculate_solar_position_batch(request: SolarPositionBatchRequest) -> SolarP
             status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during batch solar position calculation"
         )
+
+
+@router.get("/solar-position/cache-stats", response_model=EphemerisCacheStatsResponse)
+def solar_position_cache_stats() -> EphemerisCacheStatsResponse:
+    """
+    Report how often the location-independent solar ephemeris was reused.
+    
+    The Sun's right ascension, declination, sidereal time and Earth-Sun distance
+    depend only on the Julian date, so they are shared by every site evaluated at
+    the same instant:
+    - **scalar_***: LRU cache used by single-point calculations
+    - **array_***: de-duplication of Julian dates in vectorised calculations
+    """
+    stats = SolarPositionCalculator.cache_stats()
+    logger.info(f"Ephemeris cache stats: {stats}")
+    return EphemerisCacheStatsResponse(**stats)
+
+
+@router.post("/sun-times", response_model=SunTimesResponse)
+def calculate_sun_times(request: SunTimesRequest) -> SunTimesResponse:
+    """
+    Calculate sunrise, sunset, solar noon and day length for every day of a date range.
+    
+    All days are solved at once with vectorised Newton iterations on the solar
+    elevation curve, so a whole year for one site takes a few milliseconds.
+    
+    **Outputs (one list entry per day):**
+    - **solar_noon_utc**: Upper transit of the Sun
+    - **sunrise_utc / sunset_utc**: Crossings of the requested altitude (null if there is none)
+    - **day_length_hours**: 24 during polar day, 0 during polar night
+    - **noon_elevation**: Highest solar elevation of the day
+    
+    **Note:** Each date is the local solar day of the site (solar noon nearest 12:00 local
+    mean time, with the sunrise and sunset around it), so far from the Greenwich meridian
+    an event can carry the adjacent UTC date. Use altitude=-0.833 for standard sunrise/sunset,
+    0 for the geometric horizon, or -6/-12/-18 for civil/nautical/astronomical twilight.
+    """
+    logger.info(
+        f"Calculating sun times at ({request.latitude}, {request.longitude}) "
+        f"for {request.start_date} -> {request.end_date}, altitude={request.altitude}°"
+    )
+    
+    try:
+        days = np.arange(
+            np.datetime64(request.start_date, "D"),
+            np.datetime64(request.end_date, "D") + np.timedelta64(1, "D")
+        )
+        if days.size > settings.MAX_SERIES_POINTS:
+            raise ValueError(f"Requested range has {days.size} days, above the limit of {settings.MAX_SERIES_POINTS}")
+        
+        sun = SunTimesCalculator.calculate(days, request.longitude, request.latitude, request.altitude)
+        
+        logger.info(f"Sun times calculated for {days.size} days")
+        
+        return SunTimesResponse(
+            latitude=request.latitude,
+            longitude=request.longitude,
+            altitude=request.altitude,
+            count=int(days.size),
+            date=np.datetime_as_string(days).tolist(),
+            solar_noon_utc=TimeAxis.to_iso(TimeAxis.from_julian_date(sun.solar_noon)),
+            sunrise_utc=TimeAxis.to_iso_optional(TimeAxis.from_julian_date(sun.sunrise)),
+            sunset_utc=TimeAxis.to_iso_optional(TimeAxis.from_julian_date(sun.sunset)),
+            day_length_hours=sun.day_length.tolist(),
+            noon_elevation=sun.noon_elevation.tolist()
+        )
+        
+    except ValidationError as e:
+        logger.exception("Validation error in sun times calculation: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    
+    except ValueError as e:
+        logger.exception("Value error in sun times calculation: %s", e)
+        raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    except Exception as e:
+        logger.exception("Unexpected error in sun times calculation: %s", e)
+        raise HTTPException(
+            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error during sun times calculation"
+        )
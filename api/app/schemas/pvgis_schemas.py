@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from typing import List, Dict, Optional
-from api.app.db.enums import RadiationDatabase, PVTechnology, MountingPlace, TrackingType, OutputFormat
+from api.app.db.enums import RadiationDatabase, PVTechnology, MountingPlace, TrackingType, OutputFormat, AggregateGrouping
 
 
 class PVCalcRequest(BaseModel):
@@ -336,6 +336,7 @@ class PVGISBasicRequest(BaseModel):
     end_year: int = Field(2020, ge=2005, le=2020, description="End year for data")
     slope: int = Field(90, ge=0, le=90, description="Slope angle in degrees")
     azimuth: int = Field(0, ge=-180, le=180, description="Azimuth angle in degrees")
+    raddatabase: Optional[RadiationDatabase] = Field(None, description="Radiation database (PVGIS default for the location if omitted)")
     
     class Config:
         json_schema_extra = {
@@ -428,6 +429,211 @@ class PVGISDayAverageResponse(BaseModel):
         }
 
 
+class VariableStatistics(BaseModel):
+    """Distribution of one variable over the samples of one hour (null when the hour has no samples)."""
+    
+    mean: Optional[float] = Field(None, description="Mean")
+    std: Optional[float] = Field(None, description="Sample standard deviation")
+    min: Optional[float] = Field(None, description="Minimum")
+    max: Optional[float] = Field(None, description="Maximum")
+    p10: Optional[float] = Field(None, description="10th percentile, interpolated linearly between samples (within 1%)")
+    p50: Optional[float] = Field(None, description="Median, interpolated linearly between samples (within 1%)")
+    p90: Optional[float] = Field(None, description="90th percentile, interpolated linearly between samples (within 1%)")
+
+
+class HourlyStatistics(BaseModel):
+    """Distribution of the hourly solar data of one UTC hour."""
+    
+    hour: int = Field(..., ge=0, le=23, description="UTC hour")
+    sample_count: int = Field(..., description="Number of samples (one per year)")
+    G_i: VariableStatistics = Field(..., description="Global irradiance on inclined surface (W/m²)")
+    H_sun: VariableStatistics = Field(..., description="Sun height (degrees)")
+    T2m: VariableStatistics = Field(..., description="Temperature at 2m (°C)")
+    WS10m: VariableStatistics = Field(..., description="Wind speed at 10m (m/s)")
+    Int: VariableStatistics = Field(..., description="Intensity/clearness")
+
+
+class PVGISDayStatisticsResponse(BaseModel):
+    """Response schema for the year-to-year distribution of a specific day."""
+    
+    latitude: float
+    longitude: float
+    month: int
+    day: int
+    years_analyzed: List[int]
+    hourly_statistics: List[HourlyStatistics]
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "latitude": 38.447,
+                "longitude": 27.149,
+                "month": 4,
+                "day": 15,
+                "years_analyzed": [2005, 2006, 2007],
+                "hourly_statistics": [
+                    {
+                        "hour": 10,
+                        "sample_count": 3,
+                        "G_i": {"mean": 612.4, "std": 180.2, "min": 402.0, "max": 745.1,
+                                "p10": 402.9, "p50": 688.5, "p90": 688.5},
+                        "H_sun": {"mean": 55.1, "std": 0.1, "min": 55.0, "max": 55.2,
+                                  "p10": 55.1, "p50": 55.1, "p90": 55.1},
+                        "T2m": {"mean": 17.3, "std": 2.1, "min": 15.2, "max": 19.4,
+                                "p10": 15.1, "p50": 17.4, "p90": 17.4},
+                        "WS10m": {"mean": 3.2, "std": 1.0, "min": 2.1, "max": 4.1,
+                                  "p10": 2.1, "p50": 3.4, "p90": 3.4},
+                        "Int": {"mean": 0.0, "std": 0.0, "min": 0.0, "max": 0.0,
+                                "p10": 0.0, "p50": 0.0, "p90": 0.0}
+                    }
+                ]
+            }
+        }
+
+
+class PVGISDayAverageCubeRequest(BaseModel):
+    """Request schema for the day averages of every calendar day of the year."""
+    
+    latitude: float = Field(..., ge=-90, le=90, description="Latitude in degrees")
+    longitude: float = Field(..., ge=-180, le=180, description="Longitude in degrees")
+    start_year: int = Field(2005, ge=2005, le=2020, description="Start year for analysis")
+    end_year: int = Field(2020, ge=2005, le=2020, description="End year for analysis")
+    slope: int = Field(90, ge=0, le=90, description="Slope angle in degrees")
+    azimuth: int = Field(0, ge=-180, le=180, description="Azimuth angle in degrees")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "latitude": 38.447,
+                "longitude": 27.149,
+                "start_year": 2005,
+                "end_year": 2020,
+                "slope": 90,
+                "azimuth": 0
+            }
+        }
+
+
+class PVGISDayAverageCubeResponse(BaseModel):
+    """
+    Response schema for the day averages of every calendar day.
+    Matrices have one row per entry of `dates` (366, February 29 included) and one column per UTC hour.
+    """
+    
+    latitude: float
+    longitude: float
+    years_analyzed: List[int]
+    dates: List[str] = Field(..., description="Calendar day of each row (MM-DD)")
+    G_i: List[List[float]] = Field(..., description="Average global irradiance on inclined surface (W/m²)")
+    H_sun: List[List[float]] = Field(..., description="Average sun height (degrees)")
+    T2m: List[List[float]] = Field(..., description="Average temperature at 2m (°C)")
+    WS10m: List[List[float]] = Field(..., description="Average wind speed at 10m (m/s)")
+    Int: List[List[float]] = Field(..., description="Average intensity/clearness")
+    sample_count: List[List[int]] = Field(..., description="Number of samples averaged")
+    peak_hour: List[int] = Field(..., description="Hour with maximum G(i), per day")
+    peak_irradiance: List[float] = Field(..., description="Maximum G(i) value (W/m²), per day")
+    daily_total_energy: List[float] = Field(..., description="Total daily energy (Wh/m²), per day")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "latitude": 38.447,
+                "longitude": 27.149,
+                "years_analyzed": [2005, 2006, 2007],
+                "dates": ["01-01", "01-02"],
+                "G_i": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]],
+                "H_sun": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]],
+                "T2m": [[8.1, 7.9, 7.6], [8.4, 8.2, 8.0]],
+                "WS10m": [[3.1, 3.0, 2.9], [2.7, 2.6, 2.6]],
+                "Int": [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]],
+                "sample_count": [[3, 3, 3], [3, 3, 3]],
+                "peak_hour": [10, 10],
+                "peak_irradiance": [612.4, 598.0],
+                "daily_total_energy": [3105.7, 2987.2]
+            }
+        }
+
+
+class PVGISAggregateRequest(BaseModel):
+    """Request schema for averages of selected months, days and hours, grouped on the server."""
+    
+    latitude: float = Field(..., ge=-90, le=90, description="Latitude in degrees")
+    longitude: float = Field(..., ge=-180, le=180, description="Longitude in degrees")
+    start_year: int = Field(2005, ge=2005, le=2020, description="Start year for analysis")
+    end_year: int = Field(2020, ge=2005, le=2020, description="End year for analysis")
+    slope: int = Field(90, ge=0, le=90, description="Slope angle in degrees")
+    azimuth: int = Field(0, ge=-180, le=180, description="Azimuth angle in degrees")
+    months: List[int] = Field(..., min_length=1, description="Months to include (1-12)")
+    days: Optional[List[int]] = Field(None, min_length=1, description="Days of the month to include (1-31); all days if omitted")
+    hours: Optional[List[int]] = Field(None, min_length=1, description="UTC hours to include (0-23); all hours if omitted")
+    group_by: AggregateGrouping = Field(AggregateGrouping.HOUR, description="How the selected records are grouped before averaging")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "latitude": 38.447,
+                "longitude": 27.149,
+                "start_year": 2005,
+                "end_year": 2020,
+                "slope": 90,
+                "azimuth": 0,
+                "months": [4],
+                "days": None,
+                "hours": [3, 6, 9, 12, 15],
+                "group_by": "hour"
+            }
+        }
+
+
+class AggregateGroup(BaseModel):
+    """Averages of one group; the calendar fields not used for grouping are null."""
+    
+    month: Optional[int] = Field(None, description="Month of the group")
+    day: Optional[int] = Field(None, description="Day of the month of the group")
+    hour: Optional[int] = Field(None, description="UTC hour of the group")
+    sample_count: int = Field(..., description="Number of samples averaged")
+    G_i: float = Field(..., description="Average global irradiance on inclined surface (W/m²)")
+    H_sun: float = Field(..., description="Average sun height (degrees)")
+    T2m: float = Field(..., description="Average temperature at 2m (°C)")
+    WS10m: float = Field(..., description="Average wind speed at 10m (m/s)")
+    Int: float = Field(..., description="Average intensity/clearness")
+
+
+class PVGISAggregateResponse(BaseModel):
+    """Response schema for grouped averages; groups without samples are omitted."""
+    
+    latitude: float
+    longitude: float
+    years_analyzed: List[int]
+    group_by: AggregateGrouping
+    record_count: int = Field(..., description="Records that matched the month/day/hour selection")
+    groups: List[AggregateGroup]
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "latitude": 38.447,
+                "longitude": 27.149,
+                "years_analyzed": [2005, 2006, 2007],
+                "group_by": "hour",
+                "record_count": 450,
+                "groups": [
+                    {
+                        "month": None,
+                        "day": None,
+                        "hour": 9,
+                        "sample_count": 90,
+                        "G_i": 524.9,
+                        "H_sun": 52.9,
+                        "T2m": 15.8,
+                        "WS10m": 3.0,
+                        "Int": 0.0
+                    }
+                ]
+            }
+        }
+
+
 class PVGISMetadata(BaseModel):
     """Metadata from PVGIS response."""
     
@@ -437,3 +643,233 @@ class PVGISMetadata(BaseModel):
     radiation_database: str
     slope: int
     azimuth: int
+
+
+class ClearSkyIndexRequest(BaseModel):
+    """Request schema for the clear-sky index of a PVGIS hourly series (horizontal plane)."""
+
+    latitude: float = Field(..., ge=-90, le=90, description="Latitude in degrees")
+    longitude: float = Field(..., ge=-180, le=180, description="Longitude in degrees")
+    start_year: int = Field(2020, ge=2005, le=2020, description="Start year for data")
+    end_year: int = Field(2020, ge=2005, le=2020, description="End year for data")
+
+    # Bird Model atmosphere
+    elevation: Optional[float] = Field(None, description="Meters above sea level (default: PVGIS site elevation)")
+    solar_constant: float = Field(1367, description="W/m² (mean solar constant ~1367 W/m²)")
+    station_pressure: float = Field(1013.25, description="mbar (sea-level weather report pressure)")
+    albedo: float = Field(0.2, ge=0.0, le=1.0, description="Dimensionless surface reflectivity (0–1)")
+    ozone: float = Field(0.3, description="Total column ozone (atm-cm)")
+    water_vapor: float = Field(1.5, description="Precipitable water vapor (cm)")
+    aot500: float = Field(0.1, description="Aerosol optical depth @ 500 nm")
+    aot380: float = Field(0.15, description="Aerosol optical depth @ 380 nm")
+    fast_transmittance: bool = Field(False, description="Use tabulated transmittances in the Bird Model")
+
+    min_clear_sky: float = Field(20.0, ge=0, description="Clear-sky irradiance (W/m²) below which the index is not reported")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "latitude": 38.447,
+                "longitude": 27.149,
+                "start_year": 2020,
+                "end_year": 2020,
+                "station_pressure": 1013.25,
+                "albedo": 0.2,
+                "ozone": 0.3,
+                "water_vapor": 1.5,
+                "aot500": 0.1,
+                "aot380": 0.15,
+                "min_clear_sky": 20.0
+            }
+        }
+
+
+class ClearSkyIndexResponse(BaseModel):
+    """Columnar PVGIS and Bird Model irradiance with the clear-sky index (one list entry per hour)."""
+
+    latitude: float
+    longitude: float
+    elevation: float
+    radiation_database: str
+    count: int = Field(..., description="Number of hourly records")
+    valid_count: int = Field(..., description="Records with a reported clear-sky index")
+    mean_clear_sky_index: Optional[float] = Field(None, description="Ratio of summed measured to summed clear-sky irradiance over valid records")
+    datetime_utc: List[str] = Field(..., description="PVGIS timestamps in ISO 8601 format (UTC)")
+    measured_horizontal: List[float] = Field(..., description="PVGIS global horizontal irradiance G(i) in W/m²")
+    zenith_angle: List[float] = Field(..., description="Solar zenith angle in degrees")
+    clear_sky_direct: List[float] = Field(..., description="Bird direct horizontal irradiance in W/m²")
+    clear_sky_diffuse: List[float] = Field(..., description="Bird diffuse horizontal irradiance in W/m²")
+    clear_sky_total: List[float] = Field(..., description="Bird total horizontal irradiance in W/m²")
+    clear_sky_index: List[Optional[float]] = Field(..., description="Measured / clear-sky total (null below min_clear_sky)")
+
+
+class PVGISHostPoolStats(BaseModel):
+    """Connection pool statistics for one PVGIS host."""
+
+    host: str
+    port: Optional[int] = None
+    scheme: str
+    connections_opened: int = Field(..., description="New TCP/TLS connections opened")
+    requests: int = Field(..., description="Requests sent through this pool")
+    idle_connections: int = Field(..., description="Kept-alive connections waiting for reuse")
+
+
+class PVGISClientStatsResponse(BaseModel):
+    """Response schema for PVGIS HTTP client connection reuse statistics."""
+
+    session_open: bool = Field(..., description="Whether the shared session currently exists")
+    pool_connections: int = Field(..., description="Configured number of per-host pools")
+    pool_maxsize: int = Field(..., description="Configured max connections per host")
+    requests_sent: int = Field(..., description="PVGIS requests sent since startup")
+    async_requests_sent: int = Field(default=0, description="PVGIS requests sent by the async client since startup")
+    upstream_calls: int = Field(default=0, description="Upstream calls started after a cache miss")
+    coalesced_requests: int = Field(default=0, description="Requests that joined an identical in-flight call (upstream calls saved)")
+    in_flight: int = Field(default=0, description="Upstream calls running right now")
+    retries: int = Field(default=0, description="Upstream calls retried after a transient failure")
+    circuit_state: str = Field(default="closed", description="PVGIS circuit breaker state (closed, open, half_open)")
+    circuit_rejected: int = Field(default=0, description="Calls failed fast while the circuit was open")
+    connections_opened: int = Field(..., description="Connections opened by the live pools")
+    connections_reused: int = Field(..., description="Requests served on an already open connection")
+    reuse_ratio: float = Field(..., description="connections_reused / requests on the live pools")
+    hosts: List[PVGISHostPoolStats]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "session_open": True,
+                "pool_connections": 4,
+                "pool_maxsize": 16,
+                "requests_sent": 120,
+                "async_requests_sent": 4800,
+                "upstream_calls": 4920,
+                "coalesced_requests": 1310,
+                "in_flight": 2,
+                "retries": 14,
+                "circuit_state": "closed",
+                "circuit_rejected": 0,
+                "connections_opened": 3,
+                "connections_reused": 117,
+                "reuse_ratio": 0.975,
+                "hosts": [
+                    {
+                        "host": "re.jrc.ec.europa.eu",
+                        "port": 443,
+                        "scheme": "https",
+                        "connections_opened": 3,
+                        "requests": 120,
+                        "idle_connections": 3
+                    }
+                ]
+            }
+        }
+
+
+class PVGISRateLimitStatsResponse(BaseModel):
+    """Response schema for the shared PVGIS rate limiter statistics."""
+
+    rate: float = Field(..., description="Tokens added per second")
+    burst: int = Field(..., description="Bucket capacity (calls that may be sent back to back)")
+    max_wait: Optional[float] = Field(None, description="Max seconds a call may queue before it is rejected")
+    backend: str = Field(..., description="SQLite file shared by all worker processes")
+    available_tokens: float = Field(..., description="Tokens in the shared bucket right now")
+    shared_queue_depth: int = Field(..., description="Calls of all workers holding a slot that is not due yet")
+    queue_depth: int = Field(..., description="Calls of this worker currently waiting")
+    acquired: int = Field(..., description="Tokens taken by this worker since startup")
+    delayed: int = Field(..., description="Calls of this worker that had to wait")
+    rejected: int = Field(..., description="Calls of this worker rejected because the wait exceeded max_wait")
+    total_wait_seconds: float = Field(..., description="Total time this worker spent waiting")
+    mean_wait_seconds: float = Field(..., description="Mean wait per acquired token")
+    max_wait_seconds: float = Field(..., description="Longest single wait")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "rate": 25.0,
+                "burst": 5,
+                "max_wait": 30.0,
+                "backend": "/tmp/pvgis_rate_limit.sqlite",
+                "available_tokens": 0.0,
+                "shared_queue_depth": 12,
+                "queue_depth": 7,
+                "acquired": 480,
+                "delayed": 410,
+                "rejected": 0,
+                "total_wait_seconds": 96.4,
+                "mean_wait_seconds": 0.2,
+                "max_wait_seconds": 0.74
+            }
+        }
+
+
+class PVGISCacheStatsResponse(BaseModel):
+    """Response schema for the PVGIS response cache statistics."""
+
+    enabled: bool = Field(..., description="Whether PVGIS responses are cached")
+    backend: Optional[str] = Field(None, description="SQLite file holding the cache")
+    entries: int = Field(0, description="Responses stored on disk")
+    disk_bytes: int = Field(0, description="Compressed size of all stored responses")
+    uncompressed_bytes: int = Field(0, description="Original size of all stored responses")
+    max_bytes: int = Field(0, description="Compressed size limit before LRU eviction")
+    ttl_seconds: float = Field(0.0, description="Age after which an entry is no longer served")
+    memory_entries: int = Field(0, description="Decoded responses held in the memory tier")
+    memory_bytes: int = Field(0, description="Uncompressed size of the memory tier")
+    memory_max_bytes: int = Field(0, description="Memory tier size limit")
+    hits_memory: int = Field(0, description="Lookups served from the memory tier")
+    hits_disk: int = Field(0, description="Lookups served from disk")
+    misses: int = Field(0, description="Lookups that had to call PVGIS")
+    hit_ratio: float = Field(0.0, description="(hits_memory + hits_disk) / lookups")
+    stores: int = Field(0, description="Responses written to the cache")
+    evicted: int = Field(0, description="Entries evicted to stay under max_bytes")
+    expired: int = Field(0, description="Entries deleted after their TTL")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "enabled": True,
+                "backend": "/tmp/pvgis_cache.sqlite",
+                "entries": 42,
+                "disk_bytes": 31457280,
+                "uncompressed_bytes": 251658240,
+                "max_bytes": 536870912,
+                "ttl_seconds": 2592000.0,
+                "memory_entries": 6,
+                "memory_bytes": 48234496,
+                "memory_max_bytes": 67108864,
+                "hits_memory": 310,
+                "hits_disk": 57,
+                "misses": 42,
+                "hit_ratio": 0.897,
+                "stores": 42,
+                "evicted": 0,
+                "expired": 0
+            }
+        }
+
+
+class PVGISSeriesStoreStatsResponse(BaseModel):
+    """Response schema for the in-memory hourly series store statistics."""
+
+    enabled: bool = Field(..., description="Whether hourly series are kept in memory")
+    entries: int = Field(0, description="Site-years held in the store")
+    sites: int = Field(0, description="Distinct sites (location, slope, azimuth, database)")
+    memory_bytes: int = Field(0, description="Size of the stored arrays")
+    memory_max_bytes: int = Field(0, description="Memory budget before LRU eviction")
+    hits: int = Field(0, description="Site-year lookups served from memory")
+    misses: int = Field(0, description="Site-year lookups that had to fetch the year")
+    hit_ratio: float = Field(0.0, description="hits / lookups")
+    evicted: int = Field(0, description="Site-years evicted to stay under the memory budget")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "enabled": True,
+                "entries": 48,
+                "sites": 3,
+                "memory_bytes": 20183040,
+                "memory_max_bytes": 268435456,
+                "hits": 512,
+                "misses": 48,
+                "hit_ratio": 0.914,
+                "evicted": 0
+            }
+        }
\ No newline at end of file
@@ -1,4 +1,7 @@
-from pydantic import BaseModel, Field
+from datetime import date, datetime, timezone
+from typing import List, Optional
+import numpy as np
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 class SolarInputsSchema(BaseModel):
     """Schema for the input parameters required by the Bird Model."""
@@ -54,3 +57,254 @@ class SolarOutputsSchema(BaseModel):
     direct_horizontal: float = Field(..., description="Direct horizontal irradiance in W/m²")
     diffuse_horizontal: float = Field(..., description="Diffuse horizontal irradiance in W/m²")
     total_horizontal: float = Field(..., description="Total horizontal irradiance in W/m²")
+
+
+class BirdSeriesRequest(BaseModel):
+    """Schema for a Bird Model time series at one site with fixed atmospheric inputs."""
+
+    solar_constant: float = Field(1367, description="W/m² (mean solar constant ~1367 W/m²)")
+    longitude: float = Field(..., ge=-180, le=180, description="Degrees (West negative)")
+    latitude: float = Field(..., ge=-90, le=90, description="Degrees (North positive)")
+    elevation: float = Field(..., description="Meters above sea level")
+    station_pressure: float = Field(..., description="mbar (sea-level weather report pressure)")
+    albedo: float = Field(..., ge=0.0, le=1.0, description="Dimensionless surface reflectivity (0–1)")
+    ozone: float = Field(..., description="Total column ozone (atm-cm)")
+    water_vapor: float = Field(..., description="Precipitable water vapor (cm)")
+    aot500: float = Field(..., description="Aerosol optical depth @ 500 nm")
+    aot380: float = Field(..., description="Aerosol optical depth @ 380 nm")
+
+    start: datetime = Field(..., description="Series start, inclusive (UTC if no timezone is given)")
+    end: datetime = Field(..., description="Series end, inclusive (UTC if no timezone is given)")
+    step_minutes: int = Field(60, ge=1, le=1440, description="Time step in minutes (1–1440)")
+    fast_transmittance: bool = Field(False, description="Use tabulated transmittances (faster, < 1e-6 relative irradiance error)")
+
+    @field_validator("start", "end")
+    @classmethod
+    def to_naive_utc(cls, v: datetime) -> datetime:
+        # Timezone-aware inputs are converted to UTC; naive inputs are already UTC
+        if v.tzinfo is not None:
+            return v.astimezone(timezone.utc).replace(tzinfo=None)
+        return v
+
+    @model_validator(mode="after")
+    def check_range(self):
+        if self.end < self.start:
+            raise ValueError("end must not be earlier than start")
+        return self
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "solar_constant": 1367,
+                "longitude": 27.149,
+                "latitude": 38.447,
+                "elevation": 30,
+                "station_pressure": 1013.25,
+                "albedo": 0.2,
+                "ozone": 0.3,
+                "water_vapor": 1.5,
+                "aot500": 0.10,
+                "aot380": 0.15,
+                "start": "2025-06-21T00:00:00Z",
+                "end": "2025-06-21T23:00:00Z",
+                "step_minutes": 60
+            }
+        }
+
+
+class BirdSeriesResponse(BaseModel):
+    """Columnar Bird Model outputs for a time series (one list entry per time step)."""
+
+    latitude: float
+    longitude: float
+    step_minutes: int
+    count: int = Field(..., description="Number of time steps")
+    station_pressure: float = Field(..., description="Station pressure in mbar")
+    datetime_utc: List[str] = Field(..., description="Time steps in ISO 8601 format (UTC)")
+    julian_date: List[float] = Field(..., description="Julian date")
+    earth_sun_distance: List[float] = Field(..., description="Earth-Sun distance in AU")
+    zenith_angle: List[float] = Field(..., description="Solar zenith angle in degrees")
+    air_mass: List[float] = Field(..., description="Air mass (0 while the sun is below the horizon)")
+    direct_horizontal: List[float] = Field(..., description="Direct horizontal irradiance in W/m²")
+    diffuse_horizontal: List[float] = Field(..., description="Diffuse horizontal irradiance in W/m²")
+    total_horizontal: List[float] = Field(..., description="Total horizontal irradiance in W/m²")
+
+
+class BirdInsolationRequest(BaseModel):
+    """Schema for daily, monthly and annual clear-sky insolation at one site."""
+
+    solar_constant: float = Field(1367, description="W/m² (mean solar constant ~1367 W/m²)")
+    longitude: float = Field(..., ge=-180, le=180, description="Degrees (West negative)")
+    latitude: float = Field(..., ge=-90, le=90, description="Degrees (North positive)")
+    elevation: float = Field(..., description="Meters above sea level")
+    station_pressure: float = Field(..., description="mbar (sea-level weather report pressure)")
+    albedo: float = Field(..., ge=0.0, le=1.0, description="Dimensionless surface reflectivity (0–1)")
+    ozone: float = Field(..., description="Total column ozone (atm-cm)")
+    water_vapor: float = Field(..., description="Precipitable water vapor (cm)")
+    aot500: float = Field(..., description="Aerosol optical depth @ 500 nm")
+    aot380: float = Field(..., description="Aerosol optical depth @ 380 nm")
+
+    start_date: date = Field(..., description="First day (inclusive)")
+    end_date: date = Field(..., description="Last day (inclusive)")
+    tolerance: float = Field(1e-4, gt=0, le=0.1, description="Relative error tolerance of the daily integrals")
+
+    @model_validator(mode="after")
+    def check_range(self):
+        if self.end_date < self.start_date:
+            raise ValueError("end_date must not be earlier than start_date")
+        return self
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "solar_constant": 1367,
+                "longitude": 27.149,
+                "latitude": 38.447,
+                "elevation": 30,
+                "station_pressure": 1013.25,
+                "albedo": 0.2,
+                "ozone": 0.3,
+                "water_vapor": 1.5,
+                "aot500": 0.10,
+                "aot380": 0.15,
+                "start_date": "2025-01-01",
+                "end_date": "2025-12-31",
+                "tolerance": 1e-4
+            }
+        }
+
+
+class DailyInsolation(BaseModel):
+    """Columnar daily clear-sky insolation (one list entry per day)."""
+
+    date: List[str] = Field(..., description="Local solar day (YYYY-MM-DD)")
+    sunrise_utc: List[Optional[str]] = Field(..., description="Sunrise in UTC (null during polar day/night)")
+    sunset_utc: List[Optional[str]] = Field(..., description="Sunset in UTC (null during polar day/night)")
+    day_length_hours: List[float] = Field(..., description="Hours with the sun above the horizon")
+    direct_horizontal: List[float] = Field(..., description="Direct horizontal insolation in Wh/m²")
+    diffuse_horizontal: List[float] = Field(..., description="Diffuse horizontal insolation in Wh/m²")
+    total_horizontal: List[float] = Field(..., description="Total horizontal insolation in Wh/m²")
+
+
+class PeriodInsolation(BaseModel):
+    """Columnar clear-sky insolation summed over calendar periods."""
+
+    period: List[str] = Field(..., description="Period label (YYYY-MM for months, YYYY for years)")
+    days: List[int] = Field(..., description="Number of days from the requested range in the period")
+    direct_horizontal: List[float] = Field(..., description="Direct horizontal insolation in Wh/m²")
+    diffuse_horizontal: List[float] = Field(..., description="Diffuse horizontal insolation in Wh/m²")
+    total_horizontal: List[float] = Field(..., description="Total horizontal insolation in Wh/m²")
+
+
+class BirdInsolationResponse(BaseModel):
+    """Daily, monthly and annual clear-sky insolation at one site."""
+
+    latitude: float
+    longitude: float
+    tolerance: float
+    max_estimated_error: float = Field(..., description="Largest estimated absolute error of a daily total (Wh/m²)")
+    daily: DailyInsolation
+    monthly: PeriodInsolation
+    annual: PeriodInsolation
+
+
+# Same bounds as SolarInputsSchema, checked once per column instead of once per record
+BATCH_COLUMN_BOUNDS = {
+    "month": (1, 12),
+    "day": (1, 31),
+    "year": (1900, 2100),
+    "hour": (0, 23),
+    "minute": (0, 59),
+    "second": (0, 59),
+    "albedo": (0.0, 1.0)
+}
+
+
+class BirdBatchColumns(BaseModel):
+    """Columnar Bird Model inputs: one list per SolarInputsSchema field, all of equal length."""
+
+    solar_constant: List[float] = Field(..., description="W/m² (mean solar constant ~1367 W/m²)")
+    longitude: List[float] = Field(..., description="Degrees (West negative)")
+    latitude: List[float] = Field(..., description="Degrees (North positive)")
+    elevation: List[float] = Field(..., description="Meters above sea level")
+    month: List[int] = Field(..., description="Month (1–12)")
+    day: List[int] = Field(..., description="Day (1–31)")
+    year: List[int] = Field(..., description="Full year (e.g., 2025)")
+    hour: List[int] = Field(..., description="UTC hour (0–23)")
+    minute: List[int] = Field(..., description="Minute (0–59)")
+    second: List[int] = Field(..., description="Second (0–59)")
+    station_pressure: List[float] = Field(..., description="mbar (sea-level weather report pressure)")
+    albedo: List[float] = Field(..., description="Dimensionless surface reflectivity (0–1)")
+    ozone: List[float] = Field(..., description="Total column ozone (atm-cm)")
+    water_vapor: List[float] = Field(..., description="Precipitable water vapor (cm)")
+    aot500: List[float] = Field(..., description="Aerosol optical depth @ 500 nm")
+    aot380: List[float] = Field(..., description="Aerosol optical depth @ 380 nm")
+
+    @model_validator(mode="after")
+    def check_columns(self):
+        lengths = {name: len(getattr(self, name)) for name in type(self).model_fields}
+        if len(set(lengths.values())) > 1:
+            raise ValueError(f"All columns must have the same length, got {lengths}")
+
+        for name, (low, high) in BATCH_COLUMN_BOUNDS.items():
+            values = np.asarray(getattr(self, name))
+            bad = np.flatnonzero((values < low) | (values > high))
+            if bad.size:
+                raise ValueError(
+                    f"{name}[{bad[0]}]={values[bad[0]]} is outside {low}–{high} "
+                    f"({bad.size} invalid values in total)"
+                )
+        return self
+
+
+class BirdBatchRequest(BaseModel):
+    """Schema for a batch of independent Bird Model inputs, as records or as columns."""
+
+    records: Optional[List[SolarInputsSchema]] = Field(None, description="One SolarInputsSchema object per point")
+    columns: Optional[BirdBatchColumns] = Field(None, description="Columnar inputs (faster to validate for large batches)")
+    fast_transmittance: bool = Field(False, description="Use tabulated transmittances (faster, < 1e-6 relative irradiance error)")
+
+    @model_validator(mode="after")
+    def check_payload(self):
+        if (self.records is None) == (self.columns is None):
+            raise ValueError("Provide exactly one of 'records' or 'columns'")
+        return self
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "columns": {
+                    "solar_constant": [1367, 1367],
+                    "longitude": [-75, 27.149],
+                    "latitude": [40, 38.447],
+                    "elevation": [120, 30],
+                    "month": [6, 4],
+                    "day": [21, 15],
+                    "year": [2007, 2025],
+                    "hour": [17, 10],
+                    "minute": [0, 30],
+                    "second": [0, 0],
+                    "station_pressure": [1012, 1013.25],
+                    "albedo": [0.2, 0.2],
+                    "ozone": [0.3, 0.3],
+                    "water_vapor": [1.5, 1.5],
+                    "aot500": [0.10, 0.10],
+                    "aot380": [0.15, 0.15]
+                }
+            }
+        }
+
+
+class BirdBatchResponse(BaseModel):
+    """Columnar Bird Model outputs for a batch, in input order."""
+
+    count: int = Field(..., description="Number of points")
+    julian_date: List[float] = Field(..., description="Julian date")
+    station_pressure: List[float] = Field(..., description="Station pressure in mbar")
+    earth_sun_distance: List[float] = Field(..., description="Earth-Sun distance in AU")
+    zenith_angle: List[float] = Field(..., description="Solar zenith angle in degrees")
+    air_mass: List[float] = Field(..., description="Air mass (0 while the sun is below the horizon)")
+    corrected_solar_constant: List[float] = Field(..., description="Corrected solar constant in W/m²")
+    direct_horizontal: List[float] = Field(..., description="Direct horizontal irradiance in W/m²")
+    diffuse_horizontal: List[float] = Field(..., description="Diffuse horizontal irradiance in W/m²")
+    total_horizontal: List[float] = Field(..., description="Total horizontal irradiance in W/m²")
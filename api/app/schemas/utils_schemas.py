@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from datetime import date
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
 
 
 class JulianDayRequest(BaseModel):
@@ -202,3 +203,86 @@ class SolarPositionBatchResponse(BaseModel):
                 ]
             }
         }
+
+
+class EphemerisCacheStatsResponse(BaseModel):
+    """Response schema for solar ephemeris cache statistics."""
+    
+    scalar_hits: int = Field(..., description="Single-point calls served from the LRU cache")
+    scalar_misses: int = Field(..., description="Single-point calls that computed a new ephemeris")
+    scalar_size: int = Field(..., description="Julian dates currently cached")
+    scalar_max_size: int = Field(..., description="Cache capacity (least recently used entries are evicted)")
+    array_points: int = Field(..., description="Points evaluated through the vectorised path")
+    array_ephemerides_computed: int = Field(..., description="Distinct Julian dates computed by the vectorised path")
+    array_ephemerides_shared: int = Field(..., description="Vectorised points that reused another point's ephemeris")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "scalar_hits": 240,
+                "scalar_misses": 24,
+                "scalar_size": 24,
+                "scalar_max_size": 65536,
+                "array_points": 8760000,
+                "array_ephemerides_computed": 8760,
+                "array_ephemerides_shared": 8751240
+            }
+        }
+
+
+class SunTimesRequest(BaseModel):
+    """Request schema for daily sunrise, sunset and solar noon over a date range."""
+    
+    latitude: float = Field(..., ge=-90, le=90, description="Latitude in degrees (negative = South)")
+    longitude: float = Field(..., ge=-180, le=180, description="Longitude in degrees (negative = West)")
+    start_date: date = Field(..., description="First day (inclusive); each day is the local solar day of the site")
+    end_date: date = Field(..., description="Last day (inclusive)")
+    altitude: float = Field(-0.833, ge=-18, le=10, description="Sun elevation defining sunrise/sunset in degrees (-0.833 standard, -6 civil twilight)")
+    
+    @model_validator(mode="after")
+    def check_range(self):
+        if self.end_date < self.start_date:
+            raise ValueError("end_date must not be earlier than start_date")
+        return self
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "latitude": 38.447,
+                "longitude": 27.149,
+                "start_date": "2025-01-01",
+                "end_date": "2025-12-31",
+                "altitude": -0.833
+            }
+        }
+
+
+class SunTimesResponse(BaseModel):
+    """Columnar daily Sun events (one list entry per day, times in UTC)."""
+    
+    latitude: float = Field(..., description="Latitude (degrees)")
+    longitude: float = Field(..., description="Longitude (degrees)")
+    altitude: float = Field(..., description="Sun elevation used for sunrise/sunset (degrees)")
+    count: int = Field(..., description="Number of days")
+    date: List[str] = Field(..., description="Day (YYYY-MM-DD); its events can fall on the adjacent UTC date far from Greenwich")
+    solar_noon_utc: List[str] = Field(..., description="Upper transit of the Sun (ISO 8601, UTC)")
+    sunrise_utc: List[Optional[str]] = Field(..., description="Sunrise (null during polar day/night)")
+    sunset_utc: List[Optional[str]] = Field(..., description="Sunset (null during polar day/night)")
+    day_length_hours: List[float] = Field(..., description="Hours with the Sun above the altitude")
+    noon_elevation: List[float] = Field(..., description="Solar elevation at solar noon (degrees)")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "latitude": 38.447,
+                "longitude": 27.149,
+                "altitude": -0.833,
+                "count": 1,
+                "date": ["2025-06-21"],
+                "solar_noon_utc": ["2025-06-21T10:13:17"],
+                "sunrise_utc": ["2025-06-21T02:47:45"],
+                "sunset_utc": ["2025-06-21T17:38:50"],
+                "day_length_hours": [14.8515],
+                "noon_elevation": [74.99]
+            }
+        }
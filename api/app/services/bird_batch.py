@@ -0,0 +1,97 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from typing import Dict, Optional
+import numpy as np
+from ..dataclasses.solar_io_dc import SolarInputsArrayDataclass, SolarOutputsArrayDataclass
+from ..schemas.solar_io_schemas import BirdBatchRequest, BirdBatchResponse
+from ..core.config_loader import settings
+from ..core.logger import app_logger as logger
+from .birdmodel import BirdModel
+
+INPUT_FIELDS = [f.name for f in fields(SolarInputsArrayDataclass)]
+OUTPUT_FIELDS = [f.name for f in fields(SolarOutputsArrayDataclass)]
+
+
+class BirdBatchService:
+    """
+    Runs the Bird model over large batches of unrelated inputs.
+
+    The batch is converted to columns once, split into chunks of
+    settings.BATCH_CHUNK_SIZE points and the chunks are evaluated in a shared
+    process pool. Results are concatenated in input order.
+    """
+
+    _executor: Optional[ProcessPoolExecutor] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def calculate(request: BirdBatchRequest) -> BirdBatchResponse:
+        """
+        Evaluate every point of the batch.
+        Input validation is handled by schemas/dataclasses before this method is called.
+
+        Points with the sun below the horizon report zero irradiance and air mass.
+        """
+        columns = BirdBatchService._to_columns(request)
+        count = columns["latitude"].size
+
+        if count > settings.BATCH_MAX_RECORDS:
+            raise ValueError(f"Batch has {count} points, above the limit of {settings.BATCH_MAX_RECORDS}")
+
+        chunk_size = max(1, settings.BATCH_CHUNK_SIZE)
+        chunks = [
+            ({name: values[start:start + chunk_size] for name, values in columns.items()}, request.fast_transmittance)
+            for start in range(0, count, chunk_size)
+        ]
+
+        if len(chunks) <= 1:
+            results = [_calculate_chunk(*chunk) for chunk in chunks]
+        else:
+            # Executor.map yields results in submission order, which keeps the input order
+            results = list(BirdBatchService._get_executor().map(_calculate_chunk, *zip(*chunks)))
+
+        logger.info(f"Bird batch computed: {count} points in {len(chunks)} chunks")
+
+        outputs = {
+            name: np.concatenate([r[name] for r in results]) if results else np.empty(0)
+            for name in OUTPUT_FIELDS
+        }
+        return BirdBatchResponse(count=count, **{name: values.tolist() for name, values in outputs.items()})
+
+    @staticmethod
+    def shutdown() -> None:
+        """Stop the shared process pool (called on application shutdown)."""
+        with BirdBatchService._lock:
+            if BirdBatchService._executor is not None:
+                BirdBatchService._executor.shutdown(wait=True, cancel_futures=True)
+                BirdBatchService._executor = None
+                logger.info("Bird batch process pool shut down")
+
+    @staticmethod
+    def _get_executor() -> ProcessPoolExecutor:
+        with BirdBatchService._lock:
+            if BirdBatchService._executor is None:
+                workers = settings.BATCH_MAX_WORKERS or os.cpu_count() or 1
+                BirdBatchService._executor = ProcessPoolExecutor(max_workers=workers)
+                logger.info(f"Bird batch process pool started with {workers} workers")
+            return BirdBatchService._executor
+
+    @staticmethod
+    def _to_columns(request: BirdBatchRequest) -> Dict[str, np.ndarray]:
+        if request.columns is not None:
+            return {name: np.asarray(getattr(request.columns, name)) for name in INPUT_FIELDS}
+
+        records = request.records
+        return {
+            name: np.fromiter((getattr(r, name) for r in records), dtype=np.float64, count=len(records))
+            for name in INPUT_FIELDS
+        }
+
+
+def _calculate_chunk(columns: Dict[str, np.ndarray], fast_transmittance: bool = False) -> Dict[str, np.ndarray]:
+    """Process-pool worker: run the vectorised Bird model on one chunk of columns."""
+    outputs = BirdModel.calculate_array(SolarInputsArrayDataclass(**columns), clip_night=True,
+                                        fast_transmittance=fast_transmittance)
+    return {name: np.ascontiguousarray(getattr(outputs, name)) for name in OUTPUT_FIELDS}
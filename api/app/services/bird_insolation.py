@@ -0,0 +1,206 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from ..dataclasses.solar_io_dc import SolarInputsArrayDataclass
+from ..schemas.solar_io_schemas import (
+    BirdInsolationRequest,
+    BirdInsolationResponse,
+    DailyInsolation,
+    PeriodInsolation
+)
+from ..utils.sun_times import SunTimesCalculator
+from ..utils.time_axis import TimeAxis
+from ..core.config_loader import settings
+from ..core.logger import app_logger as logger
+from .birdmodel import BirdModel
+
+
+class BirdInsolationService:
+    """
+    Integrates Bird Model irradiance over daylight to get clear-sky insolation (Wh/m²).
+
+    Each day is integrated over the local solar day around solar noon. Sunrise and
+    sunset (elevation = 0°) are solved first with SunTimesCalculator, so night hours are never
+    evaluated and the integrand stays away from the air-mass singularity below the
+    horizon. The daylight interval is then integrated with composite Gauss-Legendre
+    quadrature, doubling the number of panels for each day until successive estimates
+    agree within the requested relative tolerance. Days are integrated in blocks, so a
+    single evaluation never exceeds settings.MAX_SERIES_POINTS quadrature points.
+    """
+
+    GAUSS_NODES = 8
+    MAX_PANELS = 64
+
+    @staticmethod
+    def calculate(request: BirdInsolationRequest) -> BirdInsolationResponse:
+        """
+        Compute daily, monthly and annual clear-sky insolation in one call.
+        Input validation is handled by schemas/dataclasses before this method is called.
+        """
+        days = np.arange(
+            np.datetime64(request.start_date, "D"),
+            np.datetime64(request.end_date, "D") + np.timedelta64(1, "D")
+        )
+        if days.size > settings.MAX_SERIES_POINTS:
+            raise ValueError(f"Requested range has {days.size} days, above the limit of {settings.MAX_SERIES_POINTS}")
+
+        years = days.astype("datetime64[Y]").astype(np.int64) + 1970
+        if years.min() < settings.YEAR_LIMIT_START or years.max() > settings.YEAR_LIMIT_END:
+            raise ValueError(f"Dates must be within {settings.YEAR_LIMIT_START}-{settings.YEAR_LIMIT_END}")
+
+        lat, lon = request.latitude, request.longitude
+
+        sunrise, sunset, has_rise, has_set = BirdInsolationService._daylight_window(days, lon, lat)
+
+        inputs = SolarInputsArrayDataclass(
+            solar_constant=request.solar_constant,
+            longitude=lon,
+            latitude=lat,
+            elevation=request.elevation,
+            # Date fields are unused because Julian dates are passed directly
+            month=1, day=1, year=2000, hour=0, minute=0, second=0,
+            station_pressure=request.station_pressure,
+            albedo=request.albedo,
+            ozone=request.ozone,
+            water_vapor=request.water_vapor,
+            aot500=request.aot500,
+            aot380=request.aot380
+        )
+
+        energy, error = BirdInsolationService._integrate(inputs, sunrise, sunset, request.tolerance)
+        direct, diffuse, total = energy
+
+        logger.info(
+            f"Clear-sky insolation for ({lat}, {lon}): {days.size} days, "
+            f"total={total.sum():.1f} Wh/m², max error estimate={error.max(initial=0.0):.3g} Wh/m²"
+        )
+
+        months = days.astype("datetime64[M]")
+        daily = DailyInsolation(
+            date=np.datetime_as_string(days).tolist(),
+            sunrise_utc=BirdInsolationService._format_events(sunrise, has_rise),
+            sunset_utc=BirdInsolationService._format_events(sunset, has_set),
+            day_length_hours=((sunset - sunrise) * 24.0).tolist(),
+            direct_horizontal=direct.tolist(),
+            diffuse_horizontal=diffuse.tolist(),
+            total_horizontal=total.tolist()
+        )
+
+        return BirdInsolationResponse(
+            latitude=lat,
+            longitude=lon,
+            tolerance=request.tolerance,
+            max_estimated_error=float(error.max(initial=0.0)),
+            daily=daily,
+            monthly=BirdInsolationService._sum_periods(months, energy),
+            annual=BirdInsolationService._sum_periods(days.astype("datetime64[Y]"), energy)
+        )
+
+    @staticmethod
+    def _daylight_window(days: np.ndarray, lon: float,
+                         lat: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sunrise and sunset (elevation = 0°) within solar noon ± 12 h for every day.
+
+        Returns:
+            sunrise JD, sunset JD, has_sunrise mask, has_sunset mask.
+            During polar night sunrise == sunset == noon; during polar day the window is noon ± 12 h.
+        """
+        sun = SunTimesCalculator.calculate(days, lon, lat, altitude=0.0)
+        noon = sun.solar_noon
+        sun_up = sun.noon_elevation > 0.0
+
+        has_rise = ~np.isnan(sun.sunrise)
+        has_set = ~np.isnan(sun.sunset)
+
+        sunrise = np.where(has_rise, sun.sunrise, np.where(sun_up, noon - 0.5, noon))
+        sunset = np.where(has_set, sun.sunset, np.where(sun_up, noon + 0.5, noon))
+
+        return sunrise, sunset, has_rise, has_set
+
+    @staticmethod
+    def _integrate(inputs: SolarInputsArrayDataclass, a: np.ndarray, b: np.ndarray,
+                   tolerance: float) -> Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray], np.ndarray]:
+        """
+        Adaptive composite Gauss-Legendre integration of direct, diffuse and total irradiance.
+
+        Returns:
+            (direct, diffuse, total) in Wh/m² and the per-day absolute error estimate of total
+        """
+        # Evaluations are days x nodes x panels, up to GAUSS_NODES * MAX_PANELS points per day
+        block = max(1, settings.MAX_SERIES_POINTS // (BirdInsolationService.GAUSS_NODES * BirdInsolationService.MAX_PANELS))
+
+        result = np.zeros((3, a.size))
+        error = np.zeros(a.size)
+        for start in range(0, a.size, block):
+            part = slice(start, start + block)
+            energy, error[part] = BirdInsolationService._integrate_block(inputs, a[part], b[part], tolerance)
+            result[:, part] = energy
+
+        return (result[0], result[1], result[2]), error
+
+    @staticmethod
+    def _integrate_block(inputs: SolarInputsArrayDataclass, a: np.ndarray, b: np.ndarray,
+                         tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+        """_integrate() over one block of days; returns (3, days) in Wh/m² and the error estimate."""
+        x, w = np.polynomial.legendre.leggauss(BirdInsolationService.GAUSS_NODES)
+        n_days = a.size
+
+        result = np.zeros((3, n_days))
+        error = np.zeros(n_days)
+        active = np.flatnonzero(b > a)
+
+        panels = 1
+        previous = BirdInsolationService._gauss(inputs, a[active], b[active], panels, x, w)
+
+        while active.size:
+            panels *= 2
+            current = BirdInsolationService._gauss(inputs, a[active], b[active], panels, x, w)
+
+            diff = np.abs(current[2] - previous[2])
+            done = diff <= tolerance * np.maximum(np.abs(current[2]), 1.0)
+            if panels >= BirdInsolationService.MAX_PANELS:
+                done[:] = True
+
+            result[:, active[done]] = current[:, done]
+            error[active[done]] = diff[done]
+
+            active = active[~done]
+            previous = current[:, ~done]
+
+        return result, error
+
+    @staticmethod
+    def _gauss(inputs: SolarInputsArrayDataclass, a: np.ndarray, b: np.ndarray,
+               panels: int, x: np.ndarray, w: np.ndarray) -> np.ndarray:
+        """Composite Gauss-Legendre rule with `panels` equal panels; returns (3, days) in Wh/m²."""
+        if a.size == 0:
+            return np.zeros((3, 0))
+
+        width = (b - a) / panels
+        offsets = (np.arange(panels)[:, np.newaxis] + (x[np.newaxis, :] + 1.0) / 2.0).ravel()
+        jd = a[:, np.newaxis] + width[:, np.newaxis] * offsets[np.newaxis, :]
+
+        out = BirdModel.calculate_array(inputs, julian_date=jd, clip_night=True)
+        weights = np.tile(w, panels) * (width[:, np.newaxis] / 2.0) * 24.0  # days -> hours
+
+        return np.stack([
+            (out.direct_horizontal * weights).sum(axis=1),
+            (out.diffuse_horizontal * weights).sum(axis=1),
+            (out.total_horizontal * weights).sum(axis=1)
+        ])
+
+    @staticmethod
+    def _sum_periods(periods: np.ndarray, energy: Tuple[np.ndarray, np.ndarray, np.ndarray]) -> PeriodInsolation:
+        """Sum daily totals over consecutive runs of equal period labels."""
+        starts = np.flatnonzero(np.r_[True, periods[1:] != periods[:-1]])
+        return PeriodInsolation(
+            period=np.datetime_as_string(periods[starts]).tolist(),
+            days=np.diff(np.r_[starts, periods.size]).tolist(),
+            direct_horizontal=np.add.reduceat(energy[0], starts).tolist(),
+            diffuse_horizontal=np.add.reduceat(energy[1], starts).tolist(),
+            total_horizontal=np.add.reduceat(energy[2], starts).tolist()
+        )
+
+    @staticmethod
+    def _format_events(jd: np.ndarray, mask: np.ndarray) -> List[Optional[str]]:
+        return TimeAxis.to_iso_optional(TimeAxis.from_julian_date(np.where(mask, jd, np.nan)))
@@ -0,0 +1,261 @@
+import hashlib
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict
+from datetime import timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+from ..dataclasses.bird_raster_dc import RasterJobConfig, RasterTile, RasterJobResult
+from ..dataclasses.solar_io_dc import SolarInputsArrayDataclass
+from ..utils.julianday import JulianDateCalculator
+from ..core.config_loader import settings
+from ..core.logger import app_logger as logger
+from .birdmodel import BirdModel
+
+# Order of the irradiance components along axis 1 of every tile file
+COMPONENTS = ("direct_horizontal", "diffuse_horizontal", "total_horizontal")
+
+
+class BirdRasterJob:
+    """
+    Tiled, resumable Bird Model raster computation over a lat/lon bounding box.
+
+    The grid is split into square tiles that are computed in a process pool. Each
+    worker writes its tile to `output_dir/tiles/<name>.npy` as a float32 array of
+    shape (timestamps, 3, rows, cols), with the components ordered as COMPONENTS.
+    Finished tiles are recorded in `output_dir/manifest.json`, so re-running the
+    same job after an interruption only computes the missing tiles.
+
+    Example:
+        >>> job = BirdRasterJob(RasterJobConfig(35.8, 42.1, 25.6, 44.8, 0.05, [ts], Path("turkey")))
+        >>> job.run()
+        >>> total = job.mosaic("total_horizontal", time_index=0)
+    """
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(self, config: RasterJobConfig):
+        if config.lat_max <= config.lat_min or config.lon_max <= config.lon_min:
+            raise ValueError("Raster bounding box must have lat_max > lat_min and lon_max > lon_min")
+        if config.resolution <= 0:
+            raise ValueError("Raster resolution must be positive")
+        if not config.timestamps:
+            raise ValueError("Raster job needs at least one timestamp")
+
+        self.config = config
+        self.output_dir = Path(config.output_dir)
+        self.tile_size = config.tile_size or settings.RASTER_TILE_SIZE
+        self.workers = config.workers or settings.RASTER_MAX_WORKERS or os.cpu_count() or 1
+
+        # Cell centres; rows run north to south, columns west to east
+        self.rows = math.ceil(round((config.lat_max - config.lat_min) / config.resolution, 9))
+        self.cols = math.ceil(round((config.lon_max - config.lon_min) / config.resolution, 9))
+        self.latitudes = config.lat_max - (np.arange(self.rows) + 0.5) * config.resolution
+        self.longitudes = config.lon_min + (np.arange(self.cols) + 0.5) * config.resolution
+
+        # Timezone-aware timestamps are converted to UTC; naive timestamps are already UTC
+        self.timestamps = [
+            ts.astimezone(timezone.utc).replace(tzinfo=None) if ts.tzinfo is not None else ts
+            for ts in config.timestamps
+        ]
+        self.julian_dates = np.array([
+            JulianDateCalculator.calculate(ts.month, ts.day, ts.year, ts.hour, ts.minute, ts.second)
+            for ts in self.timestamps
+        ])
+
+    @property
+    def shape(self) -> tuple:
+        """Full raster shape as (timestamps, rows, cols)."""
+        return (len(self.julian_dates), self.rows, self.cols)
+
+    def tiles(self) -> List[RasterTile]:
+        """All tiles covering the grid, in row-major order."""
+        return [
+            RasterTile(row=r, col=c,
+                       rows=min(self.tile_size, self.rows - r),
+                       cols=min(self.tile_size, self.cols - c))
+            for r in range(0, self.rows, self.tile_size)
+            for c in range(0, self.cols, self.tile_size)
+        ]
+
+    def tile_path(self, tile: RasterTile) -> Path:
+        return self.output_dir / "tiles" / f"{tile.name}.npy"
+
+    def run(self) -> RasterJobResult:
+        """
+        Compute every tile that is not already checkpointed.
+        Tiles that fail are reported in the result and can be retried by running again.
+        """
+        (self.output_dir / "tiles").mkdir(parents=True, exist_ok=True)
+        manifest = self._load_manifest()
+        done = set(manifest["completed"])
+
+        all_tiles = self.tiles()
+        pending = [t for t in all_tiles if t.name not in done or not self.tile_path(t).exists()]
+        skipped = len(all_tiles) - len(pending)
+
+        logger.info(
+            f"Raster job {self.shape} in {self.output_dir}: {len(all_tiles)} tiles, "
+            f"{skipped} already done, {len(pending)} to compute with {self.workers} workers"
+        )
+
+        failed = []
+        computed = 0
+        if pending:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = {
+                    pool.submit(_compute_tile, self._tile_task(tile)): tile
+                    for tile in pending
+                }
+                for future in as_completed(futures):
+                    tile = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Raster tile {tile.name} failed: {str(e)}")
+                        failed.append(tile.name)
+                        continue
+
+                    computed += 1
+                    manifest["completed"].append(tile.name)
+                    self._write_manifest(manifest)
+
+        logger.info(f"Raster job finished: {computed} computed, {skipped} skipped, {len(failed)} failed")
+
+        return RasterJobResult(
+            output_dir=self.output_dir,
+            shape=self.shape,
+            total_tiles=len(all_tiles),
+            computed_tiles=computed,
+            skipped_tiles=skipped,
+            failed_tiles=failed
+        )
+
+    def mosaic(self, component: str = "total_horizontal", time_index: int = 0,
+               out_path: Optional[Path] = None) -> np.ndarray:
+        """
+        Assemble one component at one timestamp into a (rows, cols) float32 array.
+        With out_path the mosaic is written to a memory-mapped .npy file instead of RAM.
+        Cells of missing tiles are NaN.
+        """
+        if component not in COMPONENTS:
+            raise ValueError(f"Unknown component '{component}', expected one of {COMPONENTS}")
+        if not 0 <= time_index < len(self.julian_dates):
+            raise ValueError(f"time_index must be within 0-{len(self.julian_dates) - 1}")
+
+        if out_path is not None:
+            out = np.lib.format.open_memmap(out_path, mode="w+", dtype=np.float32, shape=(self.rows, self.cols))
+        else:
+            out = np.empty((self.rows, self.cols), dtype=np.float32)
+        out[:] = np.nan
+
+        c = COMPONENTS.index(component)
+        for tile in self.tiles():
+            path = self.tile_path(tile)
+            if not path.exists():
+                continue
+            data = np.load(path, mmap_mode="r")
+            out[tile.row:tile.row + tile.rows, tile.col:tile.col + tile.cols] = data[time_index, c]
+
+        if isinstance(out, np.memmap):
+            out.flush()
+        return out
+
+    def _tile_task(self, tile: RasterTile) -> Dict:
+        cfg = self.config
+        return {
+            "path": str(self.tile_path(tile)),
+            "latitudes": self.latitudes[tile.row:tile.row + tile.rows],
+            "longitudes": self.longitudes[tile.col:tile.col + tile.cols],
+            "julian_dates": self.julian_dates,
+            "fast_transmittance": cfg.fast_transmittance,
+            "atmosphere": {
+                "solar_constant": cfg.solar_constant,
+                "elevation": cfg.elevation,
+                "station_pressure": cfg.station_pressure,
+                "albedo": cfg.albedo,
+                "ozone": cfg.ozone,
+                "water_vapor": cfg.water_vapor,
+                "aot500": cfg.aot500,
+                "aot380": cfg.aot380
+            }
+        }
+
+    def _fingerprint(self) -> str:
+        """Hash of everything that determines tile contents, used to guard resumes."""
+        cfg = asdict(self.config)
+        for key in ("output_dir", "workers"):
+            cfg.pop(key)
+        cfg["timestamps"] = [ts.isoformat() for ts in self.timestamps]
+        cfg["tile_size"] = self.tile_size
+        return hashlib.sha256(json.dumps(cfg, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _load_manifest(self) -> Dict:
+        path = self.output_dir / self.MANIFEST_NAME
+        fingerprint = self._fingerprint()
+
+        if path.exists():
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+            if manifest.get("fingerprint") != fingerprint:
+                raise ValueError(
+                    f"{self.output_dir} holds a different raster job. "
+                    "Use a new output directory or delete the old one."
+                )
+            return manifest
+
+        manifest = {
+            "fingerprint": fingerprint,
+            "shape": list(self.shape),
+            "components": list(COMPONENTS),
+            "tile_size": self.tile_size,
+            "completed": []
+        }
+        self._write_manifest(manifest)
+        return manifest
+
+    def _write_manifest(self, manifest: Dict) -> None:
+        # Write then rename so a kill mid-write never leaves a corrupt manifest
+        path = self.output_dir / self.MANIFEST_NAME
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+def _compute_tile(task: Dict) -> str:
+    """
+    Process-pool worker: compute one tile for every timestamp and save it as float32.
+    Each timestamp is written straight into a memory-mapped .npy file, so worker
+    memory stays at one tile whatever the number of timestamps.
+    """
+    lat = task["latitudes"][:, np.newaxis]
+    lon = task["longitudes"][np.newaxis, :]
+    atmosphere = task["atmosphere"]
+
+    inputs = SolarInputsArrayDataclass(
+        latitude=lat,
+        longitude=lon,
+        # Date fields are unused because Julian dates are passed directly
+        month=1, day=1, year=2000, hour=0, minute=0, second=0,
+        **atmosphere
+    )
+
+    path = task["path"]
+    tmp = f"{path}.tmp.npy"
+    shape = (len(task["julian_dates"]), len(COMPONENTS), lat.shape[0], lon.shape[1])
+    out = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float32, shape=shape)
+
+    # One timestamp at a time keeps temporaries at the size of a single tile
+    for i, jd in enumerate(task["julian_dates"]):
+        result = BirdModel.calculate_array(inputs, julian_date=jd, clip_night=True,
+                                           fast_transmittance=task["fast_transmittance"])
+        for c, component in enumerate(COMPONENTS):
+            out[i, c] = getattr(result, component)
+
+    out.flush()
+    del out
+    # Rename only once complete, so an interrupted tile never looks finished
+    os.replace(tmp, path)
+    return path
@@ -0,0 +1,73 @@
+from ..dataclasses.solar_io_dc import SolarInputsArrayDataclass
+from ..schemas.solar_io_schemas import BirdSeriesRequest, BirdSeriesResponse
+from ..utils.time_axis import TimeAxis
+from ..core.config_loader import settings
+from ..core.logger import app_logger as logger
+from .birdmodel import BirdModel
+
+
+class BirdSeriesService:
+    """Computes Bird Model time series for one site in a single vectorised pass."""
+
+    @staticmethod
+    def calculate_series(request: BirdSeriesRequest) -> BirdSeriesResponse:
+        """
+        Evaluate the Bird model on every step of the requested time range.
+        Input validation is handled by schemas/dataclasses before this method is called.
+
+        Steps with the sun below the horizon report zero irradiance and air mass.
+        """
+        count = TimeAxis.count(request.start, request.end, request.step_minutes)
+        if count > settings.MAX_SERIES_POINTS:
+            raise ValueError(
+                f"Requested series has {count} time steps, above the limit of "
+                f"{settings.MAX_SERIES_POINTS}. Use a larger step or a shorter range."
+            )
+
+        times = TimeAxis.build(request.start, request.end, request.step_minutes)
+        year, month, day, hour, minute, second = TimeAxis.split(times)
+
+        if year.size and (year.min() < settings.YEAR_LIMIT_START or year.max() > settings.YEAR_LIMIT_END):
+            raise ValueError(
+                f"Series years must be within {settings.YEAR_LIMIT_START}-{settings.YEAR_LIMIT_END}"
+            )
+
+        inputs = SolarInputsArrayDataclass(
+            solar_constant=request.solar_constant,
+            longitude=request.longitude,
+            latitude=request.latitude,
+            elevation=request.elevation,
+            month=month,
+            day=day,
+            year=year,
+            hour=hour,
+            minute=minute,
+            second=second,
+            station_pressure=request.station_pressure,
+            albedo=request.albedo,
+            ozone=request.ozone,
+            water_vapor=request.water_vapor,
+            aot500=request.aot500,
+            aot380=request.aot380
+        )
+
+        outputs = BirdModel.calculate_array(inputs, clip_night=True,
+                                            fast_transmittance=request.fast_transmittance)
+
+        logger.info(f"Bird series computed: {times.size} steps at ({request.latitude}, {request.longitude})")
+
+        return BirdSeriesResponse(
+            latitude=request.latitude,
+            longitude=request.longitude,
+            step_minutes=request.step_minutes,
+            count=int(times.size),
+            station_pressure=float(outputs.station_pressure.flat[0]) if times.size else 0.0,
+            datetime_utc=TimeAxis.to_iso(times),
+            julian_date=outputs.julian_date.tolist(),
+            earth_sun_distance=outputs.earth_sun_distance.tolist(),
+            zenith_angle=outputs.zenith_angle.tolist(),
+            air_mass=outputs.air_mass.tolist(),
+            direct_horizontal=outputs.direct_horizontal.tolist(),
+            diffuse_horizontal=outputs.diffuse_horizontal.tolist(),
+            total_horizontal=outputs.total_horizontal.tolist()
+        )
@@ -1,11 +1,29 @@
 # https://instesre.org/Solar/BirdModelNew.htm
 
-from ..dataclasses.solar_io_dc import SolarInputsDataclass, SolarOutputsDataclass
+from typing import Optional
+from ..dataclasses.solar_io_dc import (
+    SolarInputsDataclass,
+    SolarOutputsDataclass,
+    SolarInputsArrayDataclass,
+    SolarOutputsArrayDataclass
+)
+import logging
 import math
+import numpy as np
+from numpy.typing import ArrayLike
 from ..utils.julianday import JulianDateCalculator
 from ..utils.pressure import PressureCalculator
 from ..utils.solar_position import SolarPositionCalculator
-from ..core.logger import app_logger as logger
+from ..utils.transmittance import TransmittanceCalculator
+from ..core.logger import app_logger as logger, LogSampler
+
+# Per-call-site samplers: calculate() runs inside per-record loops
+_log_start = LogSampler(logger, logging.INFO)
+_log_position = LogSampler(logger)
+_log_air_mass = LogSampler(logger)
+_log_transmittance = LogSampler(logger)
+_log_done = LogSampler(logger, logging.INFO)
+
 
 class BirdModel:
     """Implementation of the Bird & Hulstrom (1981) clear sky irradiance model."""
@@ -14,9 +32,9 @@ class BirdModel:
     def calculate(inputs: SolarInputsDataclass) -> SolarOutputsDataclass:
         """Run the Bird model with the given inputs."""
         
-        logger.info(
-            f"Starting Bird model calculation for ({inputs.latitude}, {inputs.longitude}) "
-            f"on {inputs.year}-{inputs.month:02d}-{inputs.day:02d} {inputs.hour:02d}:{inputs.minute:02d}"
+        _log_start(
+            "Starting Bird model calculation for (%s, %s) on %s-%02d-%02d %02d:%02d",
+            inputs.latitude, inputs.longitude, inputs.year, inputs.month, inputs.day, inputs.hour, inputs.minute
         )
         
         try:
@@ -28,7 +46,7 @@ class BirdModel:
             p = PressureCalculator.station_pressure(inputs.station_pressure, inputs.elevation)
             zenith_angle, R = SolarPositionCalculator.calculate(jd, inputs.longitude, inputs.latitude)
             
-            logger.debug(f"Initial calculations: JD={jd:.2f}, pressure={p:.2f}mbar, zenith={zenith_angle:.2f}°")
+            _log_position("Initial calculations: JD=%.2f, pressure=%.2fmbar, zenith=%.2f°", jd, p, zenith_angle)
 
             dr = math.pi / 180.0
             Z_rad = zenith_angle * dr
@@ -37,7 +55,7 @@ class BirdModel:
             AM = 1.0 / (math.cos(Z_rad) + 0.15 * pow(93.885 - zenith_angle, -1.25))
             AMp = AM * p / 1013.0
             
-            logger.debug(f"Air mass: AM={AM:.4f}, AMp={AMp:.4f}")
+            _log_air_mass("Air mass: AM=%.4f, AMp=%.4f", AM, AMp)
 
             # Rayleigh scattering
             Tr = math.exp(-0.0903 * pow(AMp, 0.84) * (1.0 + AMp - pow(AMp, 1.01)))
@@ -61,9 +79,9 @@ class BirdModel:
             TAs = Ta / TAA
             Rs = 0.0685 + (1.0 - 0.84) * (1.0 - TAs)
             
-            logger.debug(
-                f"Atmospheric transmittances: Rayleigh={Tr:.4f}, Ozone={Toz:.4f}, "
-                f"MixedGas={Tm:.4f}, Water={Tw:.4f}, Aerosol={Ta:.4f}"
+            _log_transmittance(
+                "Atmospheric transmittances: Rayleigh=%.4f, Ozone=%.4f, MixedGas=%.4f, Water=%.4f, Aerosol=%.4f",
+                Tr, Toz, Tm, Tw, Ta
             )
 
             # Earth–Sun distance correction
@@ -81,10 +99,7 @@ class BirdModel:
             Itot = (Idh + Ias) / (1.0 - inputs.albedo * Rs)
             Idif = Itot - Idh
             
-            logger.info(
-                f"Bird model completed: Direct={Idh:.2f} W/m², Diffuse={Idif:.2f} W/m², "
-                f"Total={Itot:.2f} W/m²"
-            )
+            _log_done("Bird model completed: Direct=%.2f W/m², Diffuse=%.2f W/m², Total=%.2f W/m²", Idh, Idif, Itot)
 
             return SolarOutputsDataclass(
                 julian_date=jd,
@@ -100,4 +115,115 @@ class BirdModel:
             
         except Exception as e:
             logger.error(f"Error in Bird model calculation: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+
+    @staticmethod
+    def calculate_array(inputs: SolarInputsArrayDataclass,
+                        julian_date: Optional[ArrayLike] = None,
+                        clip_night: bool = False,
+                        fast_transmittance: bool = False) -> SolarOutputsArrayDataclass:
+        """
+        Run the Bird model over NumPy arrays in a single vectorised pass.
+
+        Every field of `inputs` may be an array or a scalar; all fields are broadcast
+        together and each output array has the broadcast shape. Results match
+        calculate() element by element to floating-point tolerance.
+
+        Args:
+            inputs: Array inputs (see SolarInputsArrayDataclass)
+            julian_date: Precomputed Julian dates. If provided, the date/time fields of
+                `inputs` are ignored.
+            clip_night: If True, points with the sun below the horizon (zenith >= 90°)
+                return zero irradiance and air mass instead of the raw formula values.
+            fast_transmittance: If True, the Rayleigh and ozone transmittances come from
+                lookup tables instead of the exact formulas (the mixed-gas and water
+                vapour terms are cheap and stay exact).
+                Irradiance then differs from the exact path by less than ~1e-6
+                relative (see TransmittanceTables for the per-term bounds).
+
+        Note:
+            Beyond a zenith of ~93.9° the air-mass formula has no real value. The scalar
+            path raises there; this path returns NaN unless clip_night is set.
+        """
+        try:
+            if julian_date is None:
+                jd = JulianDateCalculator.calculate_array(
+                    inputs.month, inputs.day, inputs.year,
+                    inputs.hour, inputs.minute, inputs.second
+                )
+            else:
+                jd = np.asarray(julian_date, dtype=np.float64)
+
+            p = PressureCalculator.station_pressure_array(inputs.station_pressure, inputs.elevation)
+            zenith_angle, R = SolarPositionCalculator.calculate_array(jd, inputs.longitude, inputs.latitude)
+
+            solar_constant = np.asarray(inputs.solar_constant, dtype=np.float64)
+            albedo = np.asarray(inputs.albedo, dtype=np.float64)
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                dr = math.pi / 180.0
+                cos_Z = np.cos(zenith_angle * dr)
+
+                # Relative air mass
+                AM = 1.0 / (cos_Z + 0.15 * np.power(93.885 - zenith_angle, -1.25))
+                AMp = AM * p / 1013.0
+
+                Ozm = np.asarray(inputs.ozone, dtype=np.float64) * AM
+                Wm = AM * np.asarray(inputs.water_vapor, dtype=np.float64)
+
+                # Rayleigh scattering, mixed gases, ozone and water vapor absorption
+                terms = TransmittanceCalculator.tabulated() if fast_transmittance else TransmittanceCalculator
+                Tr = terms.rayleigh(AMp)
+                Tm = terms.mixed_gases(AMp)
+                Toz = terms.ozone(Ozm)
+                Tw = terms.water_vapor(Wm)
+
+                # Aerosols
+                Tau = (0.2758 * np.asarray(inputs.aot380, dtype=np.float64) +
+                       0.35 * np.asarray(inputs.aot500, dtype=np.float64))
+                Ta = np.exp((-np.power(Tau, 0.873)) * (1.0 + Tau - np.power(Tau, 0.7088)) * np.power(AM, 0.9108))
+                TAA = 1.0 - 0.1 * (1.0 - AM + np.power(AM, 1.06)) * (1.0 - Ta)
+                TAs = Ta / TAA
+                Rs = 0.0685 + (1.0 - 0.84) * (1.0 - TAs)
+
+                # Earth–Sun distance correction
+                Rsq = 1.0 / (R * R)
+
+                # Direct irradiance
+                Id = Rsq * solar_constant * 0.9662 * Tr * Toz * Tm * Tw * Ta
+                Idh = Id * cos_Z
+
+                # Diffuse irradiance
+                Ias = 0.79 * solar_constant * cos_Z * Toz * Tm * Tw * TAA
+                Ias = Ias * (0.5 * (1.0 - Tr) + 0.85 * (1.0 - TAs)) / (1.0 - AM + np.power(AM, 1.02))
+
+                # Total irradiance
+                Itot = (Idh + Ias) / (1.0 - albedo * Rs)
+                Idif = Itot - Idh
+
+            if clip_night:
+                night = zenith_angle >= 90.0
+                AM = np.where(night, 0.0, AM)
+                Idh = np.where(night, 0.0, Idh)
+                Idif = np.where(night, 0.0, Idif)
+                Itot = np.where(night, 0.0, Itot)
+
+            shape = np.shape(Itot)
+            logger.debug(f"Vectorised Bird model completed for {int(np.prod(shape))} points")
+
+            return SolarOutputsArrayDataclass(
+                julian_date=np.broadcast_to(jd, shape),
+                station_pressure=np.broadcast_to(p, shape),
+                earth_sun_distance=np.broadcast_to(R, shape),
+                zenith_angle=np.broadcast_to(zenith_angle, shape),
+                air_mass=np.broadcast_to(AM, shape),
+                corrected_solar_constant=np.broadcast_to(Rsq * solar_constant, shape),
+                direct_horizontal=np.broadcast_to(Idh, shape),
+                diffuse_horizontal=Idif,
+                total_horizontal=Itot
+            )
+
+        except Exception as e:
+            logger.error(f"Error in vectorised Bird model calculation: {str(e)}")
+            raise
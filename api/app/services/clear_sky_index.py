@@ -0,0 +1,144 @@
+import asyncio
+import numpy as np
+from numpy.typing import ArrayLike
+from ..dataclasses.clear_sky_dc import ClearSkyIndexDataclass
+from ..dataclasses.hourly_series_dc import HourlySeriesDataclass
+from ..dataclasses.solar_io_dc import SolarInputsArrayDataclass
+from ..schemas.pvgis_schemas import PVGISBasicRequest, PVGISMetadata, ClearSkyIndexRequest, ClearSkyIndexResponse
+from ..utils.time_axis import TimeAxis
+from ..core.logger import app_logger as logger
+from .birdmodel import BirdModel
+from .pvgis import PVGISService
+from .pvgis_async import AsyncPVGISService
+
+
+class ClearSkyIndexService:
+    """
+    Joins PVGIS hourly irradiance with Bird Model clear-sky irradiance.
+
+    The PVGIS series comes as typed columns from the shared series store, the Bird model is evaluated
+    vectorised on the PVGIS time axis and the clear-sky index is the ratio of
+    the two. The series is fetched for a horizontal plane so G(i) is global
+    horizontal irradiance, directly comparable with the Bird total.
+    """
+
+    @staticmethod
+    def calculate(request: ClearSkyIndexRequest) -> ClearSkyIndexResponse:
+        """
+        Fetch the PVGIS hourly series and compute the matching clear-sky index.
+        Input validation is handled by schemas/dataclasses before this method is called.
+        """
+        metadata, series = PVGISService.load_hourly_series(ClearSkyIndexService._basic_request(request))
+        return ClearSkyIndexService._build_response(request, metadata, series)
+
+    @staticmethod
+    async def calculate_async(request: ClearSkyIndexRequest) -> ClearSkyIndexResponse:
+        """
+        Async version of calculate().
+        The PVGIS fetch is awaited on the event loop; the Bird model runs in a worker thread.
+        """
+        metadata, series = await AsyncPVGISService.load_hourly_series(ClearSkyIndexService._basic_request(request))
+        return await asyncio.to_thread(ClearSkyIndexService._build_response, request, metadata, series)
+
+    @staticmethod
+    def _basic_request(request: ClearSkyIndexRequest) -> PVGISBasicRequest:
+        if request.end_year < request.start_year:
+            raise ValueError("end_year must not be earlier than start_year")
+
+        return PVGISBasicRequest(
+            latitude=request.latitude,
+            longitude=request.longitude,
+            start_year=request.start_year,
+            end_year=request.end_year,
+            slope=0,
+            azimuth=0
+        )
+
+    @staticmethod
+    def _build_response(request: ClearSkyIndexRequest, metadata: PVGISMetadata,
+                        series: HourlySeriesDataclass) -> ClearSkyIndexResponse:
+        """Join the fetched PVGIS series with the Bird clear-sky series."""
+        times = series.times
+        # Missing values stay NaN instead of silently counting as zero irradiance
+        measured = series.column("G(i)")
+        elevation = request.elevation if request.elevation is not None else metadata.elevation
+
+        result = ClearSkyIndexService.compute(request, times, measured, elevation)
+
+        valid = ~np.isnan(result.clear_sky_index)
+        clear_sum = result.total_horizontal[valid].sum()
+        mean_index = float(result.measured[valid].sum() / clear_sum) if clear_sum > 0 else None
+
+        logger.info(
+            f"Clear-sky index for ({request.latitude}, {request.longitude}): "
+            f"{times.size} records, {int(valid.sum())} valid, mean index={mean_index}"
+        )
+
+        index = result.clear_sky_index.astype(object)
+        index[~valid] = None
+
+        return ClearSkyIndexResponse(
+            latitude=metadata.latitude,
+            longitude=metadata.longitude,
+            elevation=elevation,
+            radiation_database=metadata.radiation_database,
+            count=int(times.size),
+            valid_count=int(valid.sum()),
+            mean_clear_sky_index=mean_index,
+            datetime_utc=TimeAxis.to_iso(times),
+            measured_horizontal=result.measured.tolist(),
+            zenith_angle=result.zenith_angle.tolist(),
+            clear_sky_direct=result.direct_horizontal.tolist(),
+            clear_sky_diffuse=result.diffuse_horizontal.tolist(),
+            clear_sky_total=result.total_horizontal.tolist(),
+            clear_sky_index=index.tolist()
+        )
+
+    @staticmethod
+    def compute(request: ClearSkyIndexRequest, times: np.ndarray, measured: ArrayLike,
+                elevation: float) -> ClearSkyIndexDataclass:
+        """
+        Evaluate the Bird model on `times` and divide `measured` by the clear-sky total.
+        The index is NaN where the clear-sky total is below request.min_clear_sky.
+        """
+        times = np.asarray(times, dtype="datetime64[s]")
+        measured = np.asarray(measured, dtype=np.float64)
+        if measured.shape != times.shape:
+            raise ValueError(f"Measured irradiance has shape {measured.shape}, expected {times.shape}")
+
+        year, month, day, hour, minute, second = TimeAxis.split(times)
+        inputs = SolarInputsArrayDataclass(
+            solar_constant=request.solar_constant,
+            longitude=request.longitude,
+            latitude=request.latitude,
+            elevation=elevation,
+            month=month,
+            day=day,
+            year=year,
+            hour=hour,
+            minute=minute,
+            second=second,
+            station_pressure=request.station_pressure,
+            albedo=request.albedo,
+            ozone=request.ozone,
+            water_vapor=request.water_vapor,
+            aot500=request.aot500,
+            aot380=request.aot380
+        )
+        outputs = BirdModel.calculate_array(inputs, clip_night=True,
+                                            fast_transmittance=request.fast_transmittance)
+
+        clear = outputs.total_horizontal
+        valid = clear >= max(request.min_clear_sky, np.finfo(np.float64).tiny)
+        index = np.full(clear.shape, np.nan)
+        np.divide(measured, clear, out=index, where=valid)
+
+        return ClearSkyIndexDataclass(
+            times=times,
+            measured=measured,
+            zenith_angle=outputs.zenith_angle,
+            direct_horizontal=outputs.direct_horizontal,
+            diffuse_horizontal=outputs.diffuse_horizontal,
+            total_horizontal=clear,
+            clear_sky_index=index
+        )
\ No newline at end of file
@@ -1,17 +1,230 @@
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import requests
-from typing import List, Dict, Tuple, Any
+from requests.adapters import HTTPAdapter
+from pydantic import BaseModel
+from typing import List, Dict, Tuple, Any, Optional, Callable
 from collections import defaultdict
 from ..schemas.pvgis_schemas import *
+from ..core.config_loader import settings
 from ..core.logger import app_logger as logger
+from ..core.rate_limiter import TokenBucketLimiter
+from ..core.response_cache import ResponseCache
+from ..core.series_store import HourlySeriesStore
+from ..core.single_flight import SingleFlight
+from ..core.retry import RetryPolicy, CircuitBreaker, CircuitOpenError
 from ..core.response_utils import truncate_large_arrays, get_response_summary
+from ..dataclasses.hourly_series_dc import HourlySeriesDataclass
+from ..utils.pvgis_stream import HourlySeriesParser
+from ..utils.pvgis_csv import PVGISCSVParser
+from ..utils.calendar_index import CalendarFilter
 
 
 class PVGISService:
-    """Service for interacting with all PVGIS API endpoints."""
+    """
+    Service for interacting with all PVGIS API endpoints.
     
-    BASE_URL_V52 = "https://re.jrc.ec.europa.eu/api/v5_2"
-    BASE_URL_V53 = "https://re.jrc.ec.europa.eu/api/v5_3"
+    All calls go through one long-lived requests.Session with a pooled HTTPAdapter,
+    so TCP/TLS connections to PVGIS are kept alive and reused between requests.
+    Every call first takes a token from a token bucket shared by all workers on the
+    host, so bursts are queued below the PVGIS limit of 30 calls/second instead of
+    coming back as 429 errors.
+    
+    PVcalc, seriescalc, TMY and horizon responses are cached on disk by content
+    (endpoint, API version and normalized parameters). The full payload is cached,
+    so truncated and full views are both served from one entry. Concurrent identical
+    requests that miss the cache wait on a single upstream call and share its result.
+    Multi-year series fetched as columns are split into one call per year, so
+    overlapping year ranges reuse the cached years and only fetch the missing ones.
+    Complete hourly series are also kept in memory as NumPy columns per site and
+    year (HourlySeriesStore) for the analytics services.
+    
+    429/529 responses, gateway errors, timeouts and connection errors are retried
+    with exponential backoff and full jitter (honouring Retry-After). A circuit
+    breaker makes calls fail fast while PVGIS keeps failing.
+    """
+    
+    BASE_URL_V52 = settings.PVGIS_BASE_URL_V52.rstrip("/")
+    BASE_URL_V53 = settings.PVGIS_BASE_URL_V53.rstrip("/")
     TIMEOUT = 30
+    CACHEABLE_ENDPOINTS = frozenset({"PVcalc", "seriescalc", "tmy", "printhorizon"})
+    RETRY_STATUSES = frozenset({429, 502, 503, 504, 529})
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+    _requests_sent = 0
+    _limiter: Optional[TokenBucketLimiter] = None
+    _cache: Optional[ResponseCache] = None
+    _fanout_executor: Optional[ThreadPoolExecutor] = None
+    _series_store: Optional[HourlySeriesStore] = None
+    _flights = SingleFlight()
+    _retry = RetryPolicy(settings.PVGIS_RETRIES, settings.PVGIS_RETRY_BASE_DELAY, settings.PVGIS_RETRY_MAX_DELAY)
+    _breaker = CircuitBreaker("PVGIS API", settings.PVGIS_BREAKER_FAILURES, settings.PVGIS_BREAKER_RESET_SECONDS)
+    
+    @staticmethod
+    def _get_session() -> requests.Session:
+        """Shared keep-alive session, created on first use. Each call counts as one request sent."""
+        with PVGISService._session_lock:
+            if PVGISService._session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=settings.PVGIS_POOL_CONNECTIONS,
+                    pool_maxsize=settings.PVGIS_POOL_MAXSIZE
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({
+                    "Accept-Encoding": "gzip, deflate",
+                    "Connection": "keep-alive"
+                })
+                PVGISService._session = session
+                logger.info(
+                    f"PVGIS HTTP session created (pool_connections={settings.PVGIS_POOL_CONNECTIONS}, "
+                    f"pool_maxsize={settings.PVGIS_POOL_MAXSIZE})"
+                )
+            PVGISService._requests_sent += 1
+            return PVGISService._session
+    
+    @staticmethod
+    def rate_limiter() -> TokenBucketLimiter:
+        """Token bucket shared by the sync and async clients and by every worker process."""
+        with PVGISService._session_lock:
+            if PVGISService._limiter is None:
+                path = settings.PVGIS_RATE_LIMIT_FILE or Path(tempfile.gettempdir()) / "pvgis_rate_limit.sqlite"
+                PVGISService._limiter = TokenBucketLimiter(
+                    path,
+                    rate=settings.PVGIS_RATE_LIMIT,
+                    burst=settings.PVGIS_RATE_LIMIT_BURST,
+                    name="pvgis",
+                    max_wait=settings.PVGIS_RATE_LIMIT_MAX_WAIT
+                )
+                logger.info(
+                    f"PVGIS rate limiter: {settings.PVGIS_RATE_LIMIT}/s, burst {settings.PVGIS_RATE_LIMIT_BURST}, "
+                    f"shared through {path}"
+                )
+            return PVGISService._limiter
+    
+    @staticmethod
+    def response_cache() -> Optional[ResponseCache]:
+        """Shared response cache, or None when PVGIS_CACHE_ENABLED is off."""
+        if not settings.PVGIS_CACHE_ENABLED:
+            return None
+        with PVGISService._session_lock:
+            if PVGISService._cache is None:
+                path = settings.PVGIS_CACHE_FILE or Path(tempfile.gettempdir()) / "pvgis_cache.sqlite"
+                PVGISService._cache = ResponseCache(
+                    path,
+                    max_bytes=settings.PVGIS_CACHE_MAX_MB * 1024 * 1024,
+                    ttl=settings.PVGIS_CACHE_TTL_DAYS * 86400.0,
+                    memory_bytes=settings.PVGIS_CACHE_MEMORY_MB * 1024 * 1024
+                )
+                logger.info(f"PVGIS response cache: {path}, {settings.PVGIS_CACHE_MAX_MB} MB, TTL {settings.PVGIS_CACHE_TTL_DAYS} days")
+            return PVGISService._cache
+    
+    @staticmethod
+    def fanout_executor() -> ThreadPoolExecutor:
+        """Shared pool that fetches the years of multi-year series in parallel."""
+        with PVGISService._session_lock:
+            if PVGISService._fanout_executor is None:
+                PVGISService._fanout_executor = ThreadPoolExecutor(
+                    max_workers=settings.PVGIS_FANOUT_WORKERS, thread_name_prefix="pvgis-year"
+                )
+            return PVGISService._fanout_executor
+    
+    @staticmethod
+    def series_store() -> Optional[HourlySeriesStore]:
+        """Shared in-memory store of hourly series, or None when PVGIS_SERIES_STORE_MB is 0."""
+        if settings.PVGIS_SERIES_STORE_MB <= 0:
+            return None
+        with PVGISService._session_lock:
+            if PVGISService._series_store is None:
+                PVGISService._series_store = HourlySeriesStore(settings.PVGIS_SERIES_STORE_MB * 1024 * 1024)
+                logger.info(f"PVGIS series store: {settings.PVGIS_SERIES_STORE_MB} MB")
+            return PVGISService._series_store
+    
+    @staticmethod
+    def close() -> None:
+        """Close the shared session and its pooled connections (called on application shutdown)."""
+        with PVGISService._session_lock:
+            if PVGISService._session is not None:
+                PVGISService._session.close()
+                PVGISService._session = None
+                logger.info("PVGIS HTTP session closed")
+            if PVGISService._limiter is not None:
+                PVGISService._limiter.close()
+            if PVGISService._cache is not None:
+                PVGISService._cache.close()
+            if PVGISService._fanout_executor is not None:
+                PVGISService._fanout_executor.shutdown(wait=False)
+                PVGISService._fanout_executor = None
+    
+    @staticmethod
+    def client_stats() -> Dict[str, Any]:
+        """
+        Connection reuse statistics of the shared session.
+        A request on a kept-alive connection does not open a new one, so
+        connections_reused = requests on the pools - connections opened.
+        """
+        with PVGISService._session_lock:
+            session = PVGISService._session
+            requests_sent = PVGISService._requests_sent
+            hosts = []
+            
+            if session is not None:
+                # Both schemes are mounted on the same adapter
+                adapters = {id(a): a for a in session.adapters.values()}.values()
+                for adapter in adapters:
+                    manager = adapter.poolmanager
+                    for key in manager.pools.keys():
+                        try:
+                            pool = manager.pools[key]
+                        except KeyError:
+                            continue
+                        hosts.append({
+                            "host": pool.host,
+                            "port": pool.port,
+                            "scheme": pool.scheme,
+                            "connections_opened": pool.num_connections,
+                            "requests": pool.num_requests,
+                            # The pool queue is pre-filled with None placeholders
+                            "idle_connections": sum(1 for conn in list(pool.pool.queue) if conn is not None)
+                                                if pool.pool is not None else 0
+                        })
+        
+        opened = sum(h["connections_opened"] for h in hosts)
+        pool_requests = sum(h["requests"] for h in hosts)
+        reused = max(0, pool_requests - opened)
+        
+        return {
+            "session_open": session is not None,
+            "pool_connections": settings.PVGIS_POOL_CONNECTIONS,
+            "pool_maxsize": settings.PVGIS_POOL_MAXSIZE,
+            "requests_sent": requests_sent,
+            "connections_opened": opened,
+            "connections_reused": reused,
+            "reuse_ratio": reused / pool_requests if pool_requests else 0.0,
+            "hosts": hosts
+        }
+    
+    @staticmethod
+    def single_flight_stats() -> Dict[str, int]:
+        """Upstream calls executed, requests coalesced onto an in-flight call, and calls running now."""
+        return PVGISService._flights.stats()
+    
+    @staticmethod
+    def resilience_stats() -> Dict[str, Any]:
+        """Retries scheduled and circuit breaker state."""
+        breaker = PVGISService._breaker.stats()
+        return {
+            "retries": PVGISService._retry.scheduled,
+            "circuit_state": breaker["state"],
+            "circuit_rejected": breaker["rejected"]
+        }
     
     @staticmethod
     def _make_request(endpoint: str, params: Dict[str, Any], use_v53: bool = False, truncate_response: bool = True) -> Dict:
@@ -31,78 +244,385 @@ class PVGISService:
             RuntimeError: On API errors or connection issues
         """
         try:
-            base_url = PVGISService.BASE_URL_V53 if use_v53 else PVGISService.BASE_URL_V52
-            url = f"{base_url}/{endpoint}"
+            url, clean_params = PVGISService._prepare_request(endpoint, params, use_v53)
             
-            # Remove None values and add required defaults
-            clean_params = {k: v for k, v in params.items() if v is not None}
+            key = PVGISService._request_key(endpoint, clean_params, use_v53)
+            cache = PVGISService.response_cache() if PVGISService._is_cacheable(endpoint, clean_params) else None
+            if cache is not None:
+                data = cache.get(key)
+                if data is not None:
+                    logger.info(f"PVGIS {endpoint} served from cache")
+                    return PVGISService._finish_response(data, truncate_response)
             
-            # Ensure outputformat and browser are set
-            if 'outputformat' not in clean_params:
-                clean_params['outputformat'] = 'json'
-            if 'browser' not in clean_params:
-                clean_params['browser'] = '0'
-            
-            logger.info(f"Requesting PVGIS {endpoint} with params: {clean_params}")
-            
-            response = requests.get(url, params=clean_params, timeout=PVGISService.TIMEOUT)
-            
-            # Log response details for debugging
-            logger.info(f"PVGIS response status: {response.status_code}, content-type: {response.headers.get('content-type', 'unknown')}")
-            
-            response.raise_for_status()
-            
-            # Check if response is actually JSON
-            content_type = response.headers.get('content-type', '')
-            if 'application/json' not in content_type:
-                logger.error(f"PVGIS returned non-JSON response. Content-Type: {content_type}, Body preview: {response.text[:500]}")
-                raise ValueError(f"PVGIS API returned non-JSON response (Content-Type: {content_type}). This may indicate invalid parameters.")
-            
-            data = response.json()
-            
-            # Check for PVGIS error messages
-            if "message" in data and "error" in data.get("message", "").lower():
-                raise ValueError(f"PVGIS API error: {data['message']}")
+            # Identical requests already in flight share one upstream call
+            data = PVGISService._flights.do(
+                key, lambda: PVGISService._fetch(endpoint, url, clean_params, key, cache)
+            )
+            return PVGISService._finish_response(data, truncate_response)
             
-            # Log successful response summary
-            logger.info(f"PVGIS {endpoint} response received successfully. Keys: {list(data.keys())}")
-            if 'outputs' in data:
-                logger.info(f"Response outputs keys: {list(data['outputs'].keys())}")
-                # Log data sizes for arrays
-                for key, value in data['outputs'].items():
-                    if isinstance(value, list):
-                        logger.info(f"  - {key}: {len(value)} records")
+        except CircuitOpenError:
+            raise
+        
+        except Exception as e:
+            raise PVGISService._request_error(e) from e
+    
+    @staticmethod
+    def _request_error(e: Exception) -> RuntimeError:
+        """Map an exception raised while calling PVGIS to the RuntimeError reported to callers."""
+        if isinstance(e, requests.Timeout):
+            return RuntimeError(f"PVGIS API request timed out: {str(e)}")
+        if isinstance(e, requests.HTTPError):
+            return PVGISService._http_error(e.response.status_code, e.response.text)
+        if isinstance(e, requests.RequestException):
+            return RuntimeError(f"Error connecting to PVGIS API: {str(e)}")
+        if isinstance(e, ValueError):
+            return RuntimeError(f"Error parsing PVGIS response: {str(e)}")
+        return RuntimeError(f"Unexpected error in PVGIS request: {str(e)}")
+    
+    @staticmethod
+    def _fetch(endpoint: str, url: str, clean_params: Dict[str, Any], key: str,
+               cache: Optional[ResponseCache]) -> Dict:
+        """Upstream call through _send(); the full parsed payload is stored in the cache when given."""
+        response = PVGISService._send(endpoint, url, clean_params)
+        
+        data = PVGISService._parse_response(
+            endpoint, response.headers.get('content-type', ''), response.text, response.json
+        )
+        if cache is not None:
+            cache.put(key, endpoint, response.content, data)
+        return data
+    
+    @staticmethod
+    def _send(endpoint: str, url: str, clean_params: Dict[str, Any], stream: bool = False) -> requests.Response:
+        """
+        Rate-limited GET with retries behind the circuit breaker.
+        With stream=True the body is left unread for the caller, who must close the response.
+        
+        Raises:
+            requests.HTTPError: On a non-retryable error status or when retries are exhausted
+        """
+        attempt = 0
+        while True:
+            # Fail fast while the circuit is open, so rejected calls neither wait for nor spend a token;
+            # the probe itself is only taken once a token is held, so it is not held while queued
+            PVGISService._breaker.fail_fast()
+            PVGISService.rate_limiter().acquire()
+            probe = PVGISService._breaker.check()
+            try:
+                response = PVGISService._get_session().get(
+                    url, params=clean_params, timeout=PVGISService.TIMEOUT, stream=stream
+                )
+            except (requests.Timeout, requests.ConnectionError) as e:
+                PVGISService._breaker.record_failure()
+                delay = PVGISService._retry.delay(attempt)
+                if delay is None:
+                    raise
+                reason = type(e).__name__
+            else:
+                # Log response details for debugging
+                logger.info(f"PVGIS response status: {response.status_code}, content-type: {response.headers.get('content-type', 'unknown')}")
+                
+                delay = PVGISService._retry_delay(response.status_code, response.headers, attempt)
+                if delay is None:
+                    break
+                response.close()
+                reason = f"HTTP {response.status_code}"
+            finally:
+                # A probe that left without a recorded outcome must not keep the circuit half-open
+                if probe:
+                    PVGISService._breaker.release_probe()
             
-            # Truncate large arrays for client compatibility (uses MAX_RECORDS_PER_ARRAY from config)
-            if truncate_response:
-                data = truncate_large_arrays(data)
+            logger.warning(f"PVGIS {endpoint} attempt {attempt + 1} failed ({reason}), retrying in {delay:.2f}s")
+            time.sleep(delay)
+            attempt += 1
+        
+        if not response.ok:
+            # Read the error body so the message can include it
+            response.content
+            response.close()
+        response.raise_for_status()
+        return response
+    
+    @staticmethod
+    def _stream_hourly(url: str, clean_params: Dict[str, Any], key: str, cache: Optional[ResponseCache],
+                       parser: HourlySeriesParser) -> Tuple[Dict[str, Any], HourlySeriesDataclass]:
+        """
+        Feed a seriescalc body to `parser` chunk by chunk, from the cache or from PVGIS.
+        A body downloaded from PVGIS is compressed on the fly and stored in the cache.
+        """
+        if cache is not None:
+            compressed = cache.get_compressed(key)
+            if compressed is not None:
+                logger.info("PVGIS seriescalc streamed from cache")
+                return PVGISService._feed_compressed(parser, compressed)
+        
+        response = PVGISService._send("seriescalc", url, clean_params, stream=True)
+        try:
+            PVGISService._check_json(response.headers.get('content-type', ''))
+            compressor = zlib.compressobj(ResponseCache.COMPRESSION_LEVEL) if cache is not None else None
+            parts, size = [], 0
+            for chunk in response.iter_content(PVGISService.STREAM_CHUNK_SIZE):
+                parser.feed(chunk)
+                if compressor is not None:
+                    parts.append(compressor.compress(chunk))
+                    size += len(chunk)
+            result = parser.close()
+        finally:
+            response.close()
+        
+        if compressor is not None:
+            parts.append(compressor.flush())
+            cache.put_compressed(key, "seriescalc", b"".join(parts), size)
+        return result
+    
+    @staticmethod
+    def _csv_columns(endpoint: str, params: Dict[str, Any]) -> Tuple[Dict[str, str], HourlySeriesDataclass]:
+        """
+        Request `endpoint` as CSV and parse the body into columns.
+        
+        Raises:
+            RuntimeError: On API errors, connection issues or a malformed body
+        """
+        try:
+            url, clean_params = PVGISService._prepare_request(endpoint, {**params, "outputformat": "csv"})
+            key = PVGISService._request_key(endpoint, clean_params, False)
+            cache = PVGISService.response_cache() if endpoint in PVGISService.CACHEABLE_ENDPOINTS else None
             
-            return data
+            # Separate flight key: a pass-through CSV request on _make_request has the same parameters
+            return PVGISService._flights.do(
+                ResponseCache.make_key(key, "columns"),
+                lambda: PVGISService._fetch_csv(endpoint, url, clean_params, key, cache)
+            )
             
-        except requests.Timeout as e:
-            raise RuntimeError(f"PVGIS API request timed out: {str(e)}") from e
-        
-        except requests.HTTPError as e:
-            if e.response.status_code == 429:
-                raise RuntimeError("Rate limit exceeded (30 calls/second). Please wait and try again.") from e
-            elif e.response.status_code == 529:
-                raise RuntimeError("PVGIS server is overloaded. Please try again in a few seconds.") from e
-            else:
-                # Try to get response body for better error message
-                try:
-                    error_body = e.response.text[:500]
-                    raise RuntimeError(f"HTTP {e.response.status_code} from PVGIS API. Response: {error_body}") from e
-                except:
-                    raise RuntimeError(f"HTTP error from PVGIS API: {str(e)}") from e
+        except CircuitOpenError:
+            raise
         
-        except requests.RequestException as e:
-            raise RuntimeError(f"Error connecting to PVGIS API: {str(e)}") from e
+        except Exception as e:
+            raise PVGISService._request_error(e) from e
+    
+    @staticmethod
+    def _fetch_csv(endpoint: str, url: str, clean_params: Dict[str, Any], key: str,
+                   cache: Optional[ResponseCache]) -> Tuple[Dict[str, str], HourlySeriesDataclass]:
+        """CSV body from the cache or from PVGIS, parsed into columns; downloaded bodies are cached once they parse."""
+        if cache is not None:
+            compressed = cache.get_compressed(key)
+            if compressed is not None:
+                logger.info(f"PVGIS {endpoint} CSV served from cache")
+                return PVGISCSVParser.parse(zlib.decompress(compressed))
         
-        except ValueError as e:
-            raise RuntimeError(f"Error parsing PVGIS response: {str(e)}") from e
+        response = PVGISService._send(endpoint, url, clean_params)
+        body = response.content
+        result = PVGISCSVParser.parse(body)
+        if cache is not None:
+            cache.put_compressed(key, endpoint, zlib.compress(body, ResponseCache.COMPRESSION_LEVEL), len(body))
+        return result
+    
+    @staticmethod
+    def _fan_out(params: Dict[str, Any],
+                 fetch: Callable[[Dict[str, Any]], Tuple[Dict, HourlySeriesDataclass]]) -> Tuple[Dict, HourlySeriesDataclass]:
+        """
+        Run `fetch` for every year of a multi-year seriescalc in parallel and join the parts in year order.
         
-        except Exception as e:
-            raise RuntimeError(f"Unexpected error in PVGIS request: {str(e)}") from e
+        Returns:
+            (metadata of the first year, merged series)
+        """
+        years = PVGISService._year_params(params)
+        if len(years) == 1:
+            return fetch(years[0])
+        
+        parts = list(PVGISService.fanout_executor().map(fetch, years))
+        return parts[0][0], HourlySeriesDataclass.concatenate([series for _, series in parts])
+    
+    @staticmethod
+    def _series_part(params: Dict[str, Any], month: Optional[int], day: Optional[int],
+                     hour: Optional[int]) -> Tuple[Dict[str, Any], HourlySeriesDataclass]:
+        """One seriescalc call streamed into columns; requests with the same parameters and filter share one stream."""
+        url, clean_params = PVGISService._prepare_request("seriescalc", params)
+        key = PVGISService._request_key("seriescalc", clean_params, False)
+        cache = PVGISService.response_cache()
+        
+        return PVGISService._flights.do(
+            ResponseCache.make_key(key, "stream", month, day, hour),
+            lambda: PVGISService._stream_hourly(url, clean_params, key, cache, HourlySeriesParser(month, day, hour))
+        )
+    
+    # ----Helpers shared with AsyncPVGISService----
+    
+    @staticmethod
+    def _retry_delay(status_code: int, headers, attempt: int) -> Optional[float]:
+        """
+        Record the response with the circuit breaker and return the wait before the
+        next attempt, or None to stop (success, non-retryable error or retries exhausted).
+        """
+        # 429 means PVGIS is up but throttling us, so only server errors trip the breaker
+        if status_code >= 500:
+            PVGISService._breaker.record_failure()
+        else:
+            PVGISService._breaker.record_success()
+        
+        if status_code not in PVGISService.RETRY_STATUSES:
+            return None
+        return PVGISService._retry.delay(attempt, RetryPolicy.parse_retry_after(headers.get("Retry-After")))
+    
+    @staticmethod
+    def _prepare_request(endpoint: str, params: Dict[str, Any], use_v53: bool = False) -> Tuple[str, Dict[str, Any]]:
+        """Build the endpoint URL and the cleaned query parameters."""
+        base_url = PVGISService.BASE_URL_V53 if use_v53 else PVGISService.BASE_URL_V52
+        url = f"{base_url}/{endpoint}"
+        
+        # Remove None values and add required defaults
+        clean_params = {k: v for k, v in params.items() if v is not None}
+        
+        # Ensure outputformat and browser are set
+        if 'outputformat' not in clean_params:
+            clean_params['outputformat'] = 'json'
+        if 'browser' not in clean_params:
+            clean_params['browser'] = '0'
+        
+        logger.info(f"Requesting PVGIS {endpoint} with params: {clean_params}")
+        
+        return url, clean_params
+    
+    @staticmethod
+    def _request_key(endpoint: str, clean_params: Dict[str, Any], use_v53: bool) -> str:
+        """Content address of a request: endpoint, API version and normalized parameters."""
+        return ResponseCache.make_key(endpoint, "v5_3" if use_v53 else "v5_2", clean_params)
+    
+    @staticmethod
+    def _is_cacheable(endpoint: str, clean_params: Dict[str, Any]) -> bool:
+        return endpoint in PVGISService.CACHEABLE_ENDPOINTS and clean_params.get('outputformat') == 'json'
+    
+    @staticmethod
+    def _year_params(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """seriescalc parameters split into one set per year (unchanged if fan-out is off or the range is open or one year)."""
+        start, end = params.get("startyear"), params.get("endyear")
+        if not settings.PVGIS_YEAR_FANOUT or start is None or end is None or end <= start:
+            return [params]
+        return [{**params, "startyear": year, "endyear": year} for year in range(start, end + 1)]
+    
+    @staticmethod
+    def _feed_compressed(parser: HourlySeriesParser, compressed: bytes) -> Tuple[Dict[str, Any], HourlySeriesDataclass]:
+        """Decompress a cached body chunk by chunk into `parser`."""
+        decompressor = zlib.decompressobj()
+        step = PVGISService.STREAM_CHUNK_SIZE
+        for start in range(0, len(compressed), step):
+            parser.feed(decompressor.decompress(compressed[start:start + step]))
+        parser.feed(decompressor.flush())
+        return parser.close()
+    
+    @staticmethod
+    def _check_json(content_type: str) -> None:
+        if 'application/json' not in content_type:
+            raise ValueError(f"PVGIS API returned non-JSON response (Content-Type: {content_type}). This may indicate invalid parameters.")
+    
+    @staticmethod
+    def _finish_response(data: Dict, truncate_response: bool) -> Dict:
+        # Truncate large arrays for client compatibility (uses MAX_RECORDS_PER_ARRAY from config)
+        return truncate_large_arrays(data) if truncate_response else data
+    
+    @staticmethod
+    def _parse_response(endpoint: str, content_type: str, text: str, load_json) -> Dict:
+        """
+        Validate and decode a successful PVGIS response (always the full, untruncated payload).
+        `load_json` is the HTTP client's JSON decoder for the response body.
+        
+        Raises:
+            ValueError: On non-JSON responses or PVGIS error messages
+        """
+        # Check if response is actually JSON
+        if 'application/json' not in content_type:
+            logger.error(f"PVGIS returned non-JSON response. Content-Type: {content_type}, Body preview: {text[:500]}")
+            raise ValueError(f"PVGIS API returned non-JSON response (Content-Type: {content_type}). This may indicate invalid parameters.")
+        
+        data = load_json()
+        
+        # Check for PVGIS error messages
+        if "message" in data and "error" in data.get("message", "").lower():
+            raise ValueError(f"PVGIS API error: {data['message']}")
+        
+        # Log successful response summary
+        logger.info(f"PVGIS {endpoint} response received successfully. Keys: {list(data.keys())}")
+        if 'outputs' in data:
+            logger.info(f"Response outputs keys: {list(data['outputs'].keys())}")
+            # Log data sizes for arrays
+            for key, value in data['outputs'].items():
+                if isinstance(value, list):
+                    logger.info(f"  - {key}: {len(value)} records")
+        
+        return data
+    
+    @staticmethod
+    def _http_error(status_code: int, body: Optional[str]) -> RuntimeError:
+        """Map an HTTP error status from PVGIS to the RuntimeError raised to callers."""
+        if status_code == 429:
+            return RuntimeError("Rate limit exceeded (30 calls/second). Please wait and try again.")
+        elif status_code == 529:
+            return RuntimeError("PVGIS server is overloaded. Please try again in a few seconds.")
+        
+        # Include the start of the response body for a better error message
+        return RuntimeError(f"HTTP {status_code} from PVGIS API. Response: {(body or '')[:500]}")
+    
+    @staticmethod
+    def _request_params(request: BaseModel) -> Dict[str, Any]:
+        """Query parameters of a PVGIS request schema."""
+        return request.model_dump(by_alias=True, exclude_none=True, mode='json')
+    
+    @staticmethod
+    def _hourly_params(request: PVGISBasicRequest) -> Dict[str, Any]:
+        """seriescalc query parameters for the legacy hourly data fetch."""
+        return {
+            "lat": request.latitude,
+            "lon": request.longitude,
+            "startyear": request.start_year,
+            "endyear": request.end_year,
+            "angle": request.slope,
+            "aspect": request.azimuth,
+            "raddatabase": request.raddatabase.value if request.raddatabase else None,
+            "outputformat": "json",
+            "browser": "0"
+        }
+    
+    @staticmethod
+    def _store_site(request: PVGISBasicRequest) -> Tuple[Any, List[int]]:
+        """Series store key of the request's site and the years it covers."""
+        if request.end_year < request.start_year:
+            raise ValueError("end_year must not be earlier than start_year")
+        site = HourlySeriesStore.site_key(
+            request.latitude, request.longitude, request.slope, request.azimuth,
+            request.raddatabase.value if request.raddatabase else None
+        )
+        return site, list(range(request.start_year, request.end_year + 1))
+    
+    @staticmethod
+    def _year_series_params(params: Dict[str, Any], year: int) -> Dict[str, Any]:
+        return {**params, "startyear": year, "endyear": year}
+    
+    @staticmethod
+    def _parse_hourly(data: Dict, request: PVGISBasicRequest) -> Tuple[PVGISMetadata, List[Dict]]:
+        """Split a seriescalc response into metadata and hourly records."""
+        metadata = PVGISService._hourly_metadata(data.get("inputs", {}), request)
+        
+        # Extract hourly data
+        hourly_data = data.get("outputs", {}).get("hourly", [])
+        
+        logger.info(f"Successfully fetched {len(hourly_data)} hourly records")
+        
+        return metadata, hourly_data
+    
+    @staticmethod
+    def _hourly_metadata(inputs: Dict, request: PVGISBasicRequest) -> PVGISMetadata:
+        """Site metadata from the `inputs` section of a seriescalc response."""
+        location = inputs.get("location", {})
+        mounting = inputs.get("mounting_system", {})
+        
+        return PVGISMetadata(
+            latitude=location.get("latitude", request.latitude),
+            longitude=location.get("longitude", request.longitude),
+            elevation=location.get("elevation", 0),
+            radiation_database=inputs.get("meteo_data", {}).get("source", "Unknown"),
+            slope=mounting.get("slope", {}).get("value", request.slope),
+            azimuth=mounting.get("azimuth", {}).get("value", request.azimuth)
+        )
     
         
     @staticmethod
@@ -112,7 +632,7 @@ class PVGISService:
         Supports fixed, single-axis, and two-axis tracking configurations.
         """
         try:
-            params = request.model_dump(by_alias=True, exclude_none=True, mode='json')
+            params = PVGISService._request_params(request)
             return PVGISService._make_request("PVcalc", params)
             
         except Exception as e:
@@ -125,7 +645,7 @@ class PVGISService:
         Calculate performance of off-grid (stand-alone) PV systems with battery storage.
         """
         try:
-            params = request.model_dump(by_alias=True, exclude_none=True, mode='json')
+            params = PVGISService._request_params(request)
             return PVGISService._make_request("SHScalc", params)
             
         except Exception as e:
@@ -139,7 +659,7 @@ class PVGISService:
         Can output horizontal, optimal angle, or selected angle irradiation.
         """
         try:
-            params = request.model_dump(by_alias=True, exclude_none=True, mode='json')
+            params = PVGISService._request_params(request)
             return PVGISService._make_request("MRcalc", params)
             
         except Exception as e:
@@ -153,7 +673,7 @@ class PVGISService:
         Set month=0 to get all 12 months.
         """
         try:
-            params = request.model_dump(by_alias=True, exclude_none=True, mode='json')
+            params = PVGISService._request_params(request)
             # Handle 'global' field properly
             if 'global' in params:
                 params['global'] = params.pop('global')
@@ -170,7 +690,7 @@ class PVGISService:
         Optionally includes PV power production estimates.
         """
         try:
-            params = request.model_dump(by_alias=True, exclude_none=True, mode='json')
+            params = PVGISService._request_params(request)
             return PVGISService._make_request("seriescalc", params)
             
         except Exception as e:
@@ -184,7 +704,7 @@ class PVGISService:
         Useful for energy simulation software like EnergyPlus.
         """
         try:
-            params = request.model_dump(by_alias=True, exclude_none=True, mode='json')
+            params = PVGISService._request_params(request)
             return PVGISService._make_request("tmy", params)
             
         except Exception as e:
@@ -198,13 +718,149 @@ class PVGISService:
         Returns height of horizon at different directions.
         """
         try:
-            params = request.model_dump(by_alias=True, exclude_none=True, mode='json')
+            params = PVGISService._request_params(request)
             return PVGISService._make_request("printhorizon", params)
             
         except Exception as e:
             raise RuntimeError(f"Error in printhorizon: {str(e)}") from e
     
     
+    # ----Columnar Methods----
+    
+    @staticmethod
+    def seriescalc_columns(request: SeriesCalcRequest) -> Tuple[Dict[str, str], HourlySeriesDataclass]:
+        """
+        Hourly time series fetched as CSV and parsed straight into NumPy columns.
+        Multi-year ranges are fetched one year per call, in parallel.
+        The request's outputformat is ignored.
+        
+        Returns:
+            Tuple of (metadata lines of the CSV, typed hourly series)
+        """
+        try:
+            return PVGISService._fan_out(
+                PVGISService._request_params(request),
+                lambda params: PVGISService._csv_columns("seriescalc", params)
+            )
+            
+        except Exception as e:
+            raise RuntimeError(f"Error in seriescalc: {str(e)}") from e
+    
+    
+    @staticmethod
+    def tmy_columns(request: TMYRequest) -> Tuple[Dict[str, str], HourlySeriesDataclass]:
+        """
+        Typical Meteorological Year fetched as CSV and parsed straight into NumPy columns.
+        The request's outputformat is ignored.
+        
+        Returns:
+            Tuple of (metadata lines of the CSV, typed hourly series)
+        """
+        try:
+            return PVGISService._csv_columns("tmy", PVGISService._request_params(request))
+            
+        except Exception as e:
+            raise RuntimeError(f"Error in TMY: {str(e)}") from e
+    
+    
+    # ----Series Store----
+    
+    @staticmethod
+    def load_hourly_series(request: PVGISBasicRequest) -> Tuple[PVGISMetadata, HourlySeriesDataclass]:
+        """
+        Complete hourly series of a site, served from the in-memory series store.
+        
+        Years already in the store are reused; the missing years are fetched (one
+        seriescalc call per year, in parallel) and added to it. Single-year columns
+        are the stored arrays themselves and are read-only.
+        Falls back to fetch_hourly_series when the store is disabled.
+        
+        Returns:
+            Tuple of (metadata, typed hourly series)
+        """
+        store = PVGISService.series_store()
+        if store is None:
+            return PVGISService.fetch_hourly_series(request)
+        
+        try:
+            inputs, parts = PVGISService._stored_years(request, store)
+            series = parts[0] if len(parts) == 1 else HourlySeriesDataclass.concatenate(parts)
+            return PVGISService._hourly_metadata(inputs, request), series
+            
+        except CircuitOpenError as e:
+            raise RuntimeError(f"Error fetching hourly data: {str(e)}") from e
+        
+        except Exception as e:
+            raise RuntimeError(f"Error fetching hourly data: {str(PVGISService._request_error(e))}") from e
+    
+    @staticmethod
+    def select_hourly_series(request: PVGISBasicRequest, month: CalendarFilter = None, day: CalendarFilter = None,
+                             hour: CalendarFilter = None) -> Tuple[PVGISMetadata, HourlySeriesDataclass]:
+        """
+        Records of a site that fall on the given calendar months/days/hours (a value, a set of
+        values, or None for any), in time order.
+        
+        Every stored year carries a calendar index built when it was stored, so only
+        the matching rows are gathered; the rest of the series is never scanned.
+        Falls back to a filtered fetch_hourly_series when the store is disabled.
+        
+        Returns:
+            Tuple of (metadata, typed hourly series of the matching records)
+        """
+        metadata, parts = PVGISService.select_hourly_years(request, month, day, hour)
+        return metadata, parts[0] if len(parts) == 1 else HourlySeriesDataclass.concatenate(parts)
+    
+    @staticmethod
+    def select_hourly_years(request: PVGISBasicRequest, month: CalendarFilter = None, day: CalendarFilter = None,
+                            hour: CalendarFilter = None) -> Tuple[PVGISMetadata, List[HourlySeriesDataclass]]:
+        """
+        Like select_hourly_series, with the selection of every year kept separate
+        (one series per year, in year order) for analytics that merge years incrementally.
+        Without the store the whole selection comes back as a single part.
+        """
+        store = PVGISService.series_store()
+        if store is None:
+            # The streaming filter takes single values; sets are applied after the fetch
+            single = all(value is None or isinstance(value, int) for value in (month, day, hour))
+            filters = {"month": month, "day": day, "hour": hour} if single else {}
+            metadata, series = PVGISService.fetch_hourly_series(request, **filters)
+            return metadata, [series if single else series.select(month, day, hour)]
+        
+        try:
+            inputs, parts = PVGISService._stored_years(request, store)
+            return PVGISService._hourly_metadata(inputs, request), [part.select(month, day, hour) for part in parts]
+            
+        except CircuitOpenError as e:
+            raise RuntimeError(f"Error fetching hourly data: {str(e)}") from e
+        
+        except Exception as e:
+            raise RuntimeError(f"Error fetching hourly data: {str(PVGISService._request_error(e))}") from e
+    
+    @staticmethod
+    def _stored_years(request: PVGISBasicRequest,
+                      store: HourlySeriesStore) -> Tuple[Dict[str, Any], List[HourlySeriesDataclass]]:
+        """
+        Every year of the request from the store, fetching the missing years in parallel.
+        
+        Returns:
+            (inputs of the first year, one series per year in year order)
+        """
+        site, years = PVGISService._store_site(request)
+        parts = {year: store.get(site, year) for year in years}
+        missing = [year for year, part in parts.items() if part is None]
+        if missing:
+            logger.info(f"Series store: fetching {len(missing)} of {len(years)} years for lat={request.latitude}, lon={request.longitude}")
+            params = PVGISService._hourly_params(request)
+            
+            def fetch(year: int) -> Tuple[Dict[str, Any], HourlySeriesDataclass]:
+                part = PVGISService._series_part(PVGISService._year_series_params(params, year), None, None, None)
+                return store.put(site, year, *part)
+            
+            parts.update(zip(missing, PVGISService.fanout_executor().map(fetch, missing)))
+        
+        return parts[years[0]][0], [parts[year][1] for year in years]
+    
+    
     # ----Legacy Methods----
     
     @staticmethod
@@ -217,45 +873,46 @@ class PVGISService:
             Tuple of (metadata, hourly_data_list)
         """
         try:
-            params = {
-                "lat": request.latitude,
-                "lon": request.longitude,
-                "startyear": request.start_year,
-                "endyear": request.end_year,
-                "angle": request.slope,
-                "aspect": request.azimuth,
-                "outputformat": "json",
-                "browser": "0"
-            }
+            params = PVGISService._hourly_params(request)
             
             logger.info(f"Fetching PVGIS data for lat={request.latitude}, lon={request.longitude}")
             
             # Don't truncate response since we need all data for internal processing
             data = PVGISService._make_request("seriescalc", params, truncate_response=False)
             
-            # Extract metadata
-            inputs = data.get("inputs", {})
-            location = inputs.get("location", {})
-            mounting = inputs.get("mounting_system", {})
-            
-            metadata = PVGISMetadata(
-                latitude=location.get("latitude", request.latitude),
-                longitude=location.get("longitude", request.longitude),
-                elevation=location.get("elevation", 0),
-                radiation_database=inputs.get("meteo_data", {}).get("source", "Unknown"),
-                slope=mounting.get("slope", {}).get("value", request.slope),
-                azimuth=mounting.get("azimuth", {}).get("value", request.azimuth)
-            )
-            
-            # Extract hourly data
-            hourly_data = data.get("outputs", {}).get("hourly", [])
+            return PVGISService._parse_hourly(data, request)
             
-            logger.info(f"Successfully fetched {len(hourly_data)} hourly records")
+        except Exception as e:
+            raise RuntimeError(f"Error fetching hourly data: {str(e)}") from e
+    
+    @staticmethod
+    def fetch_hourly_series(request: PVGISBasicRequest, month: Optional[int] = None, day: Optional[int] = None,
+                            hour: Optional[int] = None) -> Tuple[PVGISMetadata, HourlySeriesDataclass]:
+        """
+        Streaming counterpart of fetch_hourly_data.
+        
+        The seriescalc body is parsed while it downloads (or while it is decompressed
+        from the cache) straight into typed columns, keeping only the records that
+        match the optional month/day/hour filter. No list of per-hour dicts is built.
+        Multi-year ranges are fetched one year per call, in parallel.
+        
+        Returns:
+            Tuple of (metadata, typed hourly series)
+        """
+        try:
+            logger.info(f"Streaming PVGIS data for lat={request.latitude}, lon={request.longitude}")
             
-            return metadata, hourly_data
+            inputs, series = PVGISService._fan_out(
+                PVGISService._hourly_params(request),
+                lambda params: PVGISService._series_part(params, month, day, hour)
+            )
+            return PVGISService._hourly_metadata(inputs, request), series
             
-        except Exception as e:
+        except CircuitOpenError as e:
             raise RuntimeError(f"Error fetching hourly data: {str(e)}") from e
+        
+        except Exception as e:
+            raise RuntimeError(f"Error fetching hourly data: {str(PVGISService._request_error(e))}") from e
     
     
     
@@ -0,0 +1,476 @@
+import asyncio
+import zlib
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import httpx
+from ..schemas.pvgis_schemas import (
+    PVCalcRequest,
+    SHSCalcRequest,
+    MRCalcRequest,
+    DRCalcRequest,
+    SeriesCalcRequest,
+    TMYRequest,
+    HorizonRequest,
+    PVGISBasicRequest,
+    PVGISMetadata
+)
+from ..core.config_loader import settings
+from ..core.logger import app_logger as logger
+from ..core.response_cache import ResponseCache
+from ..core.retry import CircuitOpenError
+from ..core.series_store import HourlySeriesStore
+from ..dataclasses.hourly_series_dc import HourlySeriesDataclass
+from ..utils.pvgis_stream import HourlySeriesParser
+from ..utils.pvgis_csv import PVGISCSVParser
+from ..utils.calendar_index import CalendarFilter
+from .pvgis import PVGISService
+
+
+class AsyncPVGISService:
+    """
+    asyncio-native counterpart of PVGISService.
+
+    Requests go through one shared httpx.AsyncClient, so a single worker can keep
+    many upstream calls in flight without holding a thread per call. URL building,
+    response validation and error mapping are shared with PVGISService, so both
+    clients raise the same RuntimeError messages (rate limit, overload, HTTP errors)
+    and share the rate limiter, response cache, in-flight de-duplication, retry
+    policy and circuit breaker.
+    """
+
+    _client: Optional[httpx.AsyncClient] = None
+    _lock: Optional[asyncio.Lock] = None
+    _requests_sent = 0
+
+    @staticmethod
+    async def _get_client() -> httpx.AsyncClient:
+        """Shared client, created on first use inside the running event loop."""
+        if AsyncPVGISService._lock is None:
+            AsyncPVGISService._lock = asyncio.Lock()
+
+        async with AsyncPVGISService._lock:
+            if AsyncPVGISService._client is None or AsyncPVGISService._client.is_closed:
+                AsyncPVGISService._client = httpx.AsyncClient(
+                    timeout=PVGISService.TIMEOUT,
+                    limits=httpx.Limits(
+                        max_connections=settings.PVGIS_ASYNC_MAX_CONNECTIONS,
+                        max_keepalive_connections=settings.PVGIS_POOL_MAXSIZE
+                    ),
+                    headers={"Accept-Encoding": "gzip, deflate"}
+                )
+                logger.info(
+                    f"PVGIS async client created (max_connections={settings.PVGIS_ASYNC_MAX_CONNECTIONS}, "
+                    f"keepalive={settings.PVGIS_POOL_MAXSIZE})"
+                )
+            return AsyncPVGISService._client
+
+    @staticmethod
+    async def close() -> None:
+        """Close the shared client and its connections (called on application shutdown)."""
+        if AsyncPVGISService._client is not None:
+            await AsyncPVGISService._client.aclose()
+            AsyncPVGISService._client = None
+            logger.info("PVGIS async client closed")
+
+    @staticmethod
+    def requests_sent() -> int:
+        """Number of PVGIS requests sent through the async client since startup."""
+        return AsyncPVGISService._requests_sent
+
+    @staticmethod
+    async def _make_request(endpoint: str, params: Dict[str, Any], use_v53: bool = False,
+                            truncate_response: bool = True) -> Dict:
+        """
+        Async version of PVGISService._make_request.
+
+        Raises:
+            RuntimeError: On API errors or connection issues
+        """
+        try:
+            url, clean_params = PVGISService._prepare_request(endpoint, params, use_v53)
+
+            # Cache lookups decompress and parse JSON, so they run in a worker thread
+            key = PVGISService._request_key(endpoint, clean_params, use_v53)
+            cache = PVGISService.response_cache() if PVGISService._is_cacheable(endpoint, clean_params) else None
+            if cache is not None:
+                data = await asyncio.to_thread(cache.get, key)
+                if data is not None:
+                    logger.info(f"PVGIS {endpoint} served from cache")
+                    return PVGISService._finish_response(data, truncate_response)
+
+            # Identical requests already in flight share one upstream call
+            data = await PVGISService._flights.do_async(
+                key, lambda: AsyncPVGISService._fetch(endpoint, url, clean_params, key, cache)
+            )
+            return PVGISService._finish_response(data, truncate_response)
+
+        except CircuitOpenError:
+            raise
+
+        except Exception as e:
+            raise AsyncPVGISService._request_error(e) from e
+
+    @staticmethod
+    def _request_error(e: Exception) -> RuntimeError:
+        """httpx counterpart of PVGISService._request_error."""
+        if isinstance(e, httpx.TimeoutException):
+            return RuntimeError(f"PVGIS API request timed out: {str(e)}")
+        if isinstance(e, httpx.HTTPStatusError):
+            return PVGISService._http_error(e.response.status_code, e.response.text)
+        if isinstance(e, httpx.RequestError):
+            return RuntimeError(f"Error connecting to PVGIS API: {str(e)}")
+        if isinstance(e, ValueError):
+            return RuntimeError(f"Error parsing PVGIS response: {str(e)}")
+        return RuntimeError(f"Unexpected error in PVGIS request: {str(e)}")
+
+    @staticmethod
+    async def _fetch(endpoint: str, url: str, clean_params: Dict[str, Any], key: str,
+                     cache: Optional[ResponseCache]) -> Dict:
+        """Async version of PVGISService._fetch; decoding and cache writes run in a worker thread."""
+        response = await AsyncPVGISService._send(endpoint, url, clean_params)
+
+        # Multi-year bodies take long enough to decode that they would stall the event loop
+        data = await asyncio.to_thread(lambda: PVGISService._parse_response(
+            endpoint, response.headers.get('content-type', ''), response.text, response.json
+        ))
+        if cache is not None:
+            await asyncio.to_thread(cache.put, key, endpoint, response.content, data)
+        return data
+
+    @staticmethod
+    async def _send(endpoint: str, url: str, clean_params: Dict[str, Any], stream: bool = False) -> httpx.Response:
+        """
+        Async version of PVGISService._send.
+        With stream=True the body is left unread for the caller, who must aclose() the response.
+        """
+        attempt = 0
+        while True:
+            PVGISService._breaker.fail_fast()
+            await PVGISService.rate_limiter().acquire_async()
+            probe = PVGISService._breaker.check()
+            try:
+                client = await AsyncPVGISService._get_client()
+                AsyncPVGISService._requests_sent += 1
+                response = await client.send(client.build_request("GET", url, params=clean_params), stream=stream)
+            except httpx.TransportError as e:
+                PVGISService._breaker.record_failure()
+                delay = PVGISService._retry.delay(attempt)
+                if delay is None:
+                    raise
+                reason = type(e).__name__
+            else:
+                logger.info(f"PVGIS response status: {response.status_code}, content-type: {response.headers.get('content-type', 'unknown')}")
+
+                delay = PVGISService._retry_delay(response.status_code, response.headers, attempt)
+                if delay is None:
+                    break
+                await response.aclose()
+                reason = f"HTTP {response.status_code}"
+            finally:
+                # Also runs when the task is cancelled mid-request
+                if probe:
+                    PVGISService._breaker.release_probe()
+
+            logger.warning(f"PVGIS {endpoint} attempt {attempt + 1} failed ({reason}), retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        if response.is_error:
+            # Read the error body so the message can include it
+            await response.aread()
+            await response.aclose()
+        response.raise_for_status()
+        return response
+
+    @staticmethod
+    async def _fan_out(params: Dict[str, Any],
+                       fetch: Callable[[Dict[str, Any]], Awaitable[Tuple[Dict, HourlySeriesDataclass]]]
+                       ) -> Tuple[Dict, HourlySeriesDataclass]:
+        """Async version of PVGISService._fan_out; the years are gathered concurrently."""
+        years = PVGISService._year_params(params)
+        parts = await asyncio.gather(*(fetch(year) for year in years))
+        if len(parts) == 1:
+            return parts[0]
+        return parts[0][0], HourlySeriesDataclass.concatenate([series for _, series in parts])
+
+    @staticmethod
+    async def _series_part(params: Dict[str, Any], month: Optional[int], day: Optional[int],
+                           hour: Optional[int]) -> Tuple[Dict[str, Any], HourlySeriesDataclass]:
+        """Async version of PVGISService._series_part."""
+        url, clean_params = PVGISService._prepare_request("seriescalc", params)
+        key = PVGISService._request_key("seriescalc", clean_params, False)
+        cache = PVGISService.response_cache()
+
+        return await PVGISService._flights.do_async(
+            ResponseCache.make_key(key, "stream", month, day, hour),
+            lambda: AsyncPVGISService._stream_hourly(
+                url, clean_params, key, cache, HourlySeriesParser(month, day, hour)
+            )
+        )
+
+    @staticmethod
+    async def _stream_hourly(url: str, clean_params: Dict[str, Any], key: str, cache: Optional[ResponseCache],
+                             parser: HourlySeriesParser) -> Tuple[Dict[str, Any], HourlySeriesDataclass]:
+        """Async version of PVGISService._stream_hourly; parsing and cache access run in a worker thread."""
+        if cache is not None:
+            compressed = await asyncio.to_thread(cache.get_compressed, key)
+            if compressed is not None:
+                logger.info("PVGIS seriescalc streamed from cache")
+                return await asyncio.to_thread(PVGISService._feed_compressed, parser, compressed)
+
+        response = await AsyncPVGISService._send("seriescalc", url, clean_params, stream=True)
+        try:
+            PVGISService._check_json(response.headers.get('content-type', ''))
+            compressor = zlib.compressobj(ResponseCache.COMPRESSION_LEVEL) if cache is not None else None
+            parts = []
+
+            def consume(chunk: bytes) -> None:
+                parser.feed(chunk)
+                if compressor is not None:
+                    parts.append(compressor.compress(chunk))
+
+            # Chunks are fed one at a time and in order; the event loop stays free meanwhile
+            size = 0
+            async for chunk in response.aiter_bytes(PVGISService.STREAM_CHUNK_SIZE):
+                await asyncio.to_thread(consume, chunk)
+                size += len(chunk)
+            result = await asyncio.to_thread(parser.close)
+        finally:
+            await response.aclose()
+
+        if compressor is not None:
+            parts.append(compressor.flush())
+            await asyncio.to_thread(cache.put_compressed, key, "seriescalc", b"".join(parts), size)
+        return result
+
+    @staticmethod
+    async def _csv_columns(endpoint: str, params: Dict[str, Any]) -> Tuple[Dict[str, str], HourlySeriesDataclass]:
+        """Async version of PVGISService._csv_columns."""
+        try:
+            url, clean_params = PVGISService._prepare_request(endpoint, {**params, "outputformat": "csv"})
+            key = PVGISService._request_key(endpoint, clean_params, False)
+            cache = PVGISService.response_cache() if endpoint in PVGISService.CACHEABLE_ENDPOINTS else None
+
+            return await PVGISService._flights.do_async(
+                ResponseCache.make_key(key, "columns"),
+                lambda: AsyncPVGISService._fetch_csv(endpoint, url, clean_params, key, cache)
+            )
+
+        except CircuitOpenError:
+            raise
+
+        except Exception as e:
+            raise AsyncPVGISService._request_error(e) from e
+
+    @staticmethod
+    async def _fetch_csv(endpoint: str, url: str, clean_params: Dict[str, Any], key: str,
+                         cache: Optional[ResponseCache]) -> Tuple[Dict[str, str], HourlySeriesDataclass]:
+        """Async version of PVGISService._fetch_csv; parsing and cache access run in a worker thread."""
+        if cache is not None:
+            compressed = await asyncio.to_thread(cache.get_compressed, key)
+            if compressed is not None:
+                logger.info(f"PVGIS {endpoint} CSV served from cache")
+                return await asyncio.to_thread(lambda: PVGISCSVParser.parse(zlib.decompress(compressed)))
+
+        response = await AsyncPVGISService._send(endpoint, url, clean_params)
+        body = response.content
+        result = await asyncio.to_thread(PVGISCSVParser.parse, body)
+        if cache is not None:
+            compressed = await asyncio.to_thread(zlib.compress, body, ResponseCache.COMPRESSION_LEVEL)
+            await asyncio.to_thread(cache.put_compressed, key, endpoint, compressed, len(body))
+        return result
+
+    @staticmethod
+    async def pvcalc(request: PVCalcRequest) -> Dict:
+        """Calculate PV energy production for grid-connected systems."""
+        try:
+            return await AsyncPVGISService._make_request("PVcalc", PVGISService._request_params(request))
+        except Exception as e:
+            raise RuntimeError(f"Error in PVcalc: {str(e)}") from e
+
+    @staticmethod
+    async def shscalc(request: SHSCalcRequest) -> Dict:
+        """Calculate performance of off-grid (stand-alone) PV systems with battery storage."""
+        try:
+            return await AsyncPVGISService._make_request("SHScalc", PVGISService._request_params(request))
+        except Exception as e:
+            raise RuntimeError(f"Error in SHScalc: {str(e)}") from e
+
+    @staticmethod
+    async def mrcalc(request: MRCalcRequest) -> Dict:
+        """Calculate monthly radiation values."""
+        try:
+            return await AsyncPVGISService._make_request("MRcalc", PVGISService._request_params(request))
+        except Exception as e:
+            raise RuntimeError(f"Error in MRcalc: {str(e)}") from e
+
+    @staticmethod
+    async def drcalc(request: DRCalcRequest) -> Dict:
+        """Calculate daily radiation profiles for a specific month."""
+        try:
+            return await AsyncPVGISService._make_request("DRcalc", PVGISService._request_params(request))
+        except Exception as e:
+            raise RuntimeError(f"Error in DRcalc: {str(e)}") from e
+
+    @staticmethod
+    async def seriescalc(request: SeriesCalcRequest) -> Dict:
+        """Get hourly radiation time series data."""
+        try:
+            return await AsyncPVGISService._make_request("seriescalc", PVGISService._request_params(request))
+        except Exception as e:
+            raise RuntimeError(f"Error in seriescalc: {str(e)}") from e
+
+    @staticmethod
+    async def tmy(request: TMYRequest) -> Dict:
+        """Get Typical Meteorological Year (TMY) data."""
+        try:
+            return await AsyncPVGISService._make_request("tmy", PVGISService._request_params(request))
+        except Exception as e:
+            raise RuntimeError(f"Error in TMY: {str(e)}") from e
+
+    @staticmethod
+    async def printhorizon(request: HorizonRequest) -> Dict:
+        """Get horizon profile data for a location."""
+        try:
+            return await AsyncPVGISService._make_request("printhorizon", PVGISService._request_params(request))
+        except Exception as e:
+            raise RuntimeError(f"Error in printhorizon: {str(e)}") from e
+
+    @staticmethod
+    async def seriescalc_columns(request: SeriesCalcRequest) -> Tuple[Dict[str, str], HourlySeriesDataclass]:
+        """Async version of PVGISService.seriescalc_columns."""
+        try:
+            return await AsyncPVGISService._fan_out(
+                PVGISService._request_params(request),
+                lambda params: AsyncPVGISService._csv_columns("seriescalc", params)
+            )
+        except Exception as e:
+            raise RuntimeError(f"Error in seriescalc: {str(e)}") from e
+
+    @staticmethod
+    async def tmy_columns(request: TMYRequest) -> Tuple[Dict[str, str], HourlySeriesDataclass]:
+        """Async version of PVGISService.tmy_columns."""
+        try:
+            return await AsyncPVGISService._csv_columns("tmy", PVGISService._request_params(request))
+        except Exception as e:
+            raise RuntimeError(f"Error in TMY: {str(e)}") from e
+
+    @staticmethod
+    async def fetch_hourly_data(request: PVGISBasicRequest) -> Tuple[PVGISMetadata, List[Dict]]:
+        """
+        Async version of PVGISService.fetch_hourly_data.
+
+        Returns:
+            Tuple of (metadata, hourly_data_list)
+        """
+        try:
+            logger.info(f"Fetching PVGIS data for lat={request.latitude}, lon={request.longitude}")
+
+            # Don't truncate response since we need all data for internal processing
+            data = await AsyncPVGISService._make_request(
+                "seriescalc", PVGISService._hourly_params(request), truncate_response=False
+            )
+            return PVGISService._parse_hourly(data, request)
+
+        except Exception as e:
+            raise RuntimeError(f"Error fetching hourly data: {str(e)}") from e
+
+    @staticmethod
+    async def fetch_hourly_series(request: PVGISBasicRequest, month: Optional[int] = None, day: Optional[int] = None,
+                                  hour: Optional[int] = None) -> Tuple[PVGISMetadata, HourlySeriesDataclass]:
+        """
+        Async version of PVGISService.fetch_hourly_series.
+
+        Returns:
+            Tuple of (metadata, typed hourly series)
+        """
+        try:
+            logger.info(f"Streaming PVGIS data for lat={request.latitude}, lon={request.longitude}")
+
+            inputs, series = await AsyncPVGISService._fan_out(
+                PVGISService._hourly_params(request),
+                lambda params: AsyncPVGISService._series_part(params, month, day, hour)
+            )
+            return PVGISService._hourly_metadata(inputs, request), series
+
+        except CircuitOpenError as e:
+            raise RuntimeError(f"Error fetching hourly data: {str(e)}") from e
+
+        except Exception as e:
+            raise RuntimeError(f"Error fetching hourly data: {str(AsyncPVGISService._request_error(e))}") from e
+
+    @staticmethod
+    async def load_hourly_series(request: PVGISBasicRequest) -> Tuple[PVGISMetadata, HourlySeriesDataclass]:
+        """
+        Async version of PVGISService.load_hourly_series.
+
+        Returns:
+            Tuple of (metadata, typed hourly series)
+        """
+        store = PVGISService.series_store()
+        if store is None:
+            return await AsyncPVGISService.fetch_hourly_series(request)
+
+        try:
+            inputs, parts = await AsyncPVGISService._stored_years(request, store)
+            series = parts[0] if len(parts) == 1 else HourlySeriesDataclass.concatenate(parts)
+            return PVGISService._hourly_metadata(inputs, request), series
+
+        except CircuitOpenError as e:
+            raise RuntimeError(f"Error fetching hourly data: {str(e)}") from e
+
+        except Exception as e:
+            raise RuntimeError(f"Error fetching hourly data: {str(AsyncPVGISService._request_error(e))}") from e
+
+    @staticmethod
+    async def select_hourly_series(request: PVGISBasicRequest, month: CalendarFilter = None, day: CalendarFilter = None,
+                                   hour: CalendarFilter = None) -> Tuple[PVGISMetadata, HourlySeriesDataclass]:
+        """
+        Async version of PVGISService.select_hourly_series.
+
+        Returns:
+            Tuple of (metadata, typed hourly series of the matching records)
+        """
+        metadata, parts = await AsyncPVGISService.select_hourly_years(request, month, day, hour)
+        return metadata, parts[0] if len(parts) == 1 else HourlySeriesDataclass.concatenate(parts)
+
+    @staticmethod
+    async def select_hourly_years(request: PVGISBasicRequest, month: CalendarFilter = None, day: CalendarFilter = None,
+                                  hour: CalendarFilter = None) -> Tuple[PVGISMetadata, List[HourlySeriesDataclass]]:
+        """Async version of PVGISService.select_hourly_years."""
+        store = PVGISService.series_store()
+        if store is None:
+            # The streaming filter takes single values; sets are applied after the fetch
+            single = all(value is None or isinstance(value, int) for value in (month, day, hour))
+            filters = {"month": month, "day": day, "hour": hour} if single else {}
+            metadata, series = await AsyncPVGISService.fetch_hourly_series(request, **filters)
+            return metadata, [series if single else series.select(month, day, hour)]
+
+        try:
+            inputs, parts = await AsyncPVGISService._stored_years(request, store)
+            return PVGISService._hourly_metadata(inputs, request), [part.select(month, day, hour) for part in parts]
+
+        except CircuitOpenError as e:
+            raise RuntimeError(f"Error fetching hourly data: {str(e)}") from e
+
+        except Exception as e:
+            raise RuntimeError(f"Error fetching hourly data: {str(AsyncPVGISService._request_error(e))}") from e
+
+    @staticmethod
+    async def _stored_years(request: PVGISBasicRequest,
+                            store: HourlySeriesStore) -> Tuple[Dict[str, Any], List[HourlySeriesDataclass]]:
+        """Async version of PVGISService._stored_years; the missing years are gathered concurrently."""
+        site, years = PVGISService._store_site(request)
+        parts = {year: store.get(site, year) for year in years}
+        missing = [year for year, part in parts.items() if part is None]
+        if missing:
+            logger.info(f"Series store: fetching {len(missing)} of {len(years)} years for lat={request.latitude}, lon={request.longitude}")
+            params = PVGISService._hourly_params(request)
+            fetched = await asyncio.gather(*(
+                AsyncPVGISService._series_part(PVGISService._year_series_params(params, year), None, None, None)
+                for year in missing
+            ))
+            for year, part in zip(missing, fetched):
+                # Storing builds the calendar index; keep that off the event loop
+                parts[year] = await asyncio.to_thread(store.put, site, year, *part)
+
+        return parts[years[0]][0], [parts[year][1] for year in years]
\ No newline at end of file
@@ -1,10 +1,38 @@
-import requests
-from ..schemas.pvgis_schemas import PVGISDayAverageRequest, PVGISDayAverageResponse, PVGISBasicRequest, HourlyData
+import asyncio
+from typing import List
+import numpy as np
+from ..schemas.pvgis_schemas import (
+    PVGISDayAverageRequest,
+    PVGISDayAverageResponse,
+    PVGISDayAverageCubeRequest,
+    PVGISDayAverageCubeResponse,
+    PVGISDayStatisticsResponse,
+    PVGISAggregateRequest,
+    PVGISAggregateResponse,
+    AggregateGroup,
+    HourlyStatistics,
+    VariableStatistics,
+    PVGISBasicRequest,
+    PVGISMetadata,
+    HourlyData
+)
+from ..db.enums import AggregateGrouping
+from ..dataclasses.hourly_series_dc import HourlySeriesDataclass
+from ..utils.running_stats import GroupedMoments, GroupedQuantileSketch
+from ..utils.time_axis import TimeAxis
 from ..core.logger import app_logger as logger
 from .pvgis import PVGISService
-from collections import defaultdict
+from .pvgis_async import AsyncPVGISService
 
 class PVGISPlusService:
+    # Response field -> PVGIS variable
+    AVERAGED_COLUMNS = {"G_i": "G(i)", "H_sun": "H_sun", "T2m": "T2m", "WS10m": "WS10m", "Int": "Int"}
+    # Row of each month's first day in a 366-day (leap year) calendar
+    MONTH_STARTS = np.cumsum([0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30])
+    CALENDAR_DATES = [date[5:] for date in np.datetime_as_string(
+        np.arange(np.datetime64("2000-01-01"), np.datetime64("2001-01-01"))
+    ).tolist()]
+    
     @staticmethod
     def calculate_day_average(request: PVGISDayAverageRequest) -> PVGISDayAverageResponse:
         """
@@ -14,119 +42,403 @@ class PVGISPlusService:
         For example: April 15 - calculate average for each hour (0-23) across all April 15ths
         from start_year to end_year.
         """
+        basic_request = PVGISPlusService._basic_request(request)
         try:
             # Fetch data from PVGIS
-            basic_request = PVGISBasicRequest(
-                latitude=request.latitude,
-                longitude=request.longitude,
-                start_year=request.start_year,
-                end_year=request.end_year,
-                slope=request.slope,
-                azimuth=request.azimuth
-            )
-            
-            metadata, hourly_data = PVGISService.fetch_hourly_data(basic_request)
-            
-            # Filter for specific month/day and group by hour
-            target_date = f"{request.month:02d}{request.day:02d}"
-            hourly_groups = defaultdict(list)
-            years_found = set()
-            
-            logger.info(f"Filtering data for month={request.month}, day={request.day}")
+            # Only the rows of the requested calendar day are gathered, through the stored series' calendar index
+            metadata, series = PVGISService.select_hourly_series(basic_request, month=request.month, day=request.day)
+            return PVGISPlusService._day_average(request, metadata, series)
             
-            # Debug: Log first few timestamps to see format
-            if hourly_data:
-                logger.info(f"Total records received: {len(hourly_data)}")
-                logger.info(f"Sample timestamps: {[record.get('time', '') for record in hourly_data[:5]]}")
-            
-            for record in hourly_data:
-                timestamp = record.get("time", "")
-                # Format: YYYYMMDD:HHMM (e.g., "20100415:1300")
-                if len(timestamp) >= 13:  # Need at least YYYYMMDD:HHMM
-                    try:
-                        date_part = timestamp[4:8]  # MMDD
-                        year = int(timestamp[:4])
-                        
-                        if date_part == target_date:
-                            hour = int(timestamp[9:11])  # Extract HH from :HHMM
-                            years_found.add(year)
-                        
-                            hourly_groups[hour].append({
-                                "G_i": record.get("G(i)", 0.0),
-                                "H_sun": record.get("H_sun", 0.0),
-                                "T2m": record.get("T2m", 0.0),
-                                "WS10m": record.get("WS10m", 0.0),
-                                "Int": record.get("Int", 0.0)
-                            })
-                    except (ValueError, IndexError) as e:
-                        logger.warning(f"Failed to parse timestamp '{timestamp}': {e}")
-                        continue
+        except ValueError as e:
+            raise RuntimeError(f"Data processing error: {str(e)}") from e
+        
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error in day average calculation: {str(e)}") from e
+    
+    @staticmethod
+    async def calculate_day_average_async(request: PVGISDayAverageRequest) -> PVGISDayAverageResponse:
+        """
+        Async version of calculate_day_average.
+        The PVGIS fetch is awaited on the event loop; averaging runs in a worker thread.
+        """
+        basic_request = PVGISPlusService._basic_request(request)
+        try:
+            metadata, series = await AsyncPVGISService.select_hourly_series(
+                basic_request, month=request.month, day=request.day
+            )
+            return await asyncio.to_thread(PVGISPlusService._day_average, request, metadata, series)
             
-            if not hourly_groups:
-                raise ValueError(
-                    f"No data found for {request.month:02d}/{request.day:02d} "
-                    f"in years {request.start_year}-{request.end_year}"
-                )
+        except ValueError as e:
+            raise RuntimeError(f"Data processing error: {str(e)}") from e
+        
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error in day average calculation: {str(e)}") from e
+    
+    @staticmethod
+    def calculate_day_statistics(request: PVGISDayAverageRequest) -> PVGISDayStatisticsResponse:
+        """
+        Year-to-year distribution of each hour of a specific day: mean, standard
+        deviation, min/max and P10/P50/P90 for every averaged variable.
+        Years are merged one at a time into mergeable accumulators; samples are not kept.
+        """
+        basic_request = PVGISPlusService._basic_request(request)
+        try:
+            metadata, years = PVGISService.select_hourly_years(basic_request, month=request.month, day=request.day)
+            return PVGISPlusService._day_statistics(request, metadata, years)
             
-            logger.info(f"Found data for {len(years_found)} years: {sorted(years_found)}")
+        except ValueError as e:
+            raise RuntimeError(f"Data processing error: {str(e)}") from e
+        
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error in day statistics calculation: {str(e)}") from e
+    
+    @staticmethod
+    async def calculate_day_statistics_async(request: PVGISDayAverageRequest) -> PVGISDayStatisticsResponse:
+        """
+        Async version of calculate_day_statistics.
+        The PVGIS fetch is awaited on the event loop; the statistics run in a worker thread.
+        """
+        basic_request = PVGISPlusService._basic_request(request)
+        try:
+            metadata, years = await AsyncPVGISService.select_hourly_years(
+                basic_request, month=request.month, day=request.day
+            )
+            return await asyncio.to_thread(PVGISPlusService._day_statistics, request, metadata, years)
             
-            # Calculate averages for each hour
-            hourly_averages = []
-            peak_hour = 0
-            peak_irradiance = 0.0
-            daily_total = 0.0
+        except ValueError as e:
+            raise RuntimeError(f"Data processing error: {str(e)}") from e
+        
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error in day statistics calculation: {str(e)}") from e
+    
+    @staticmethod
+    def calculate_day_average_cube(request: PVGISDayAverageCubeRequest) -> PVGISDayAverageCubeResponse:
+        """
+        Hourly averages of every calendar day of the year (366 x 24) in one pass over the series.
+        Each row equals what calculate_day_average returns for that date.
+        """
+        basic_request = PVGISPlusService._basic_request(request)
+        try:
+            metadata, series = PVGISService.load_hourly_series(basic_request)
+            return PVGISPlusService._day_average_cube(request, metadata, series)
             
-            for hour in range(24):
-                if hour in hourly_groups:
-                    records = hourly_groups[hour]
-                    
-                    avg_data = HourlyData(
-                        hour=hour,
-                        G_i=sum(r["G_i"] for r in records) / len(records),
-                        H_sun=sum(r["H_sun"] for r in records) / len(records),
-                        T2m=sum(r["T2m"] for r in records) / len(records),
-                        WS10m=sum(r["WS10m"] for r in records) / len(records),
-                        Int=sum(r["Int"] for r in records) / len(records),
-                        sample_count=len(records)
-                    )
-                    
-                    hourly_averages.append(avg_data)
-                    daily_total += avg_data.G_i
-                    
-                    if avg_data.G_i > peak_irradiance:
-                        peak_irradiance = avg_data.G_i
-                        peak_hour = hour
-                else:
-                    # No data for this hour, add zeros
-                    hourly_averages.append(HourlyData(
-                        hour=hour,
-                        G_i=0.0,
-                        H_sun=0.0,
-                        T2m=0.0,
-                        WS10m=0.0,
-                        Int=0.0,
-                        sample_count=0
-                    ))
+        except ValueError as e:
+            raise RuntimeError(f"Data processing error: {str(e)}") from e
+        
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error in day average cube calculation: {str(e)}") from e
+    
+    @staticmethod
+    async def calculate_day_average_cube_async(request: PVGISDayAverageCubeRequest) -> PVGISDayAverageCubeResponse:
+        """
+        Async version of calculate_day_average_cube.
+        The PVGIS fetch is awaited on the event loop; the reduction runs in a worker thread.
+        """
+        basic_request = PVGISPlusService._basic_request(request)
+        try:
+            metadata, series = await AsyncPVGISService.load_hourly_series(basic_request)
+            return await asyncio.to_thread(PVGISPlusService._day_average_cube, request, metadata, series)
             
-            logger.info(
-                f"Calculated averages: peak at hour {peak_hour} "
-                f"with {peak_irradiance:.2f} W/m², daily total: {daily_total:.2f} Wh/m²"
+        except ValueError as e:
+            raise RuntimeError(f"Data processing error: {str(e)}") from e
+        
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error in day average cube calculation: {str(e)}") from e
+    
+    @staticmethod
+    def calculate_aggregate(request: PVGISAggregateRequest) -> PVGISAggregateResponse:
+        """
+        Averages of the records in the selected months, days and hours, grouped by
+        request.group_by (e.g. every April hour at 03/06/09/12/15 UTC, or each April
+        day and hour). Only the selected rows are gathered from the stored series.
+        """
+        basic_request = PVGISPlusService._basic_request(request)
+        PVGISPlusService._check_selection(request)
+        try:
+            metadata, series = PVGISService.select_hourly_series(
+                basic_request, month=request.months, day=request.days, hour=request.hours
             )
+            return PVGISPlusService._aggregate(request, metadata, series)
             
-            return PVGISDayAverageResponse(
-                latitude=metadata.latitude,
-                longitude=metadata.longitude,
-                month=request.month,
-                day=request.day,
-                years_analyzed=sorted(list(years_found)),
-                hourly_averages=hourly_averages,
-                peak_hour=peak_hour,
-                peak_irradiance=peak_irradiance,
-                daily_total_energy=daily_total
+        except ValueError as e:
+            raise RuntimeError(f"Data processing error: {str(e)}") from e
+        
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error in aggregation: {str(e)}") from e
+    
+    @staticmethod
+    async def calculate_aggregate_async(request: PVGISAggregateRequest) -> PVGISAggregateResponse:
+        """
+        Async version of calculate_aggregate.
+        The PVGIS fetch is awaited on the event loop; the grouping runs in a worker thread.
+        """
+        basic_request = PVGISPlusService._basic_request(request)
+        PVGISPlusService._check_selection(request)
+        try:
+            metadata, series = await AsyncPVGISService.select_hourly_series(
+                basic_request, month=request.months, day=request.days, hour=request.hours
             )
+            return await asyncio.to_thread(PVGISPlusService._aggregate, request, metadata, series)
             
         except ValueError as e:
             raise RuntimeError(f"Data processing error: {str(e)}") from e
         
         except Exception as e:
-            raise RuntimeError(f"Unexpected error in day average calculation: {str(e)}") from e
\ No newline at end of file
+            raise RuntimeError(f"Unexpected error in aggregation: {str(e)}") from e
+    
+    @staticmethod
+    def _basic_request(request: PVGISDayAverageRequest) -> PVGISBasicRequest:
+        if request.end_year < request.start_year:
+            raise ValueError("end_year must not be earlier than start_year")
+        
+        return PVGISBasicRequest(
+            latitude=request.latitude,
+            longitude=request.longitude,
+            start_year=request.start_year,
+            end_year=request.end_year,
+            slope=request.slope,
+            azimuth=request.azimuth
+        )
+    
+    @staticmethod
+    def _day_average(request: PVGISDayAverageRequest, metadata: PVGISMetadata,
+                     series: HourlySeriesDataclass) -> PVGISDayAverageResponse:
+        """Average the hourly records of the requested calendar day (already selected), hour by hour."""
+        logger.info(f"Averaging {series.times.size} records for month={request.month}, day={request.day}")
+        
+        if series.times.size == 0:
+            raise ValueError(
+                f"No data found for {request.month:02d}/{request.day:02d} "
+                f"in years {request.start_year}-{request.end_year}"
+            )
+        
+        year, _, _, hour, _, _ = TimeAxis.split(series.times)
+        years_found = sorted(int(y) for y in np.unique(year))
+        logger.info(f"Found data for {len(years_found)} years: {years_found}")
+        
+        counts, averages = PVGISPlusService._group_means(series, hour, 24)
+        
+        hourly_averages = [
+            HourlyData(
+                hour=h,
+                G_i=float(averages["G_i"][h]),
+                H_sun=float(averages["H_sun"][h]),
+                T2m=float(averages["T2m"][h]),
+                WS10m=float(averages["WS10m"][h]),
+                Int=float(averages["Int"][h]),
+                sample_count=int(counts[h])
+            )
+            for h in range(24)
+        ]
+        
+        irradiance = averages["G_i"]
+        peak_hours, peak_values = PVGISPlusService._peaks(irradiance[None, :])
+        peak_hour, peak_irradiance = int(peak_hours[0]), float(peak_values[0])
+        daily_total = float(irradiance.sum())
+        
+        logger.info(
+            f"Calculated averages: peak at hour {peak_hour} "
+            f"with {peak_irradiance:.2f} W/m², daily total: {daily_total:.2f} Wh/m²"
+        )
+        
+        return PVGISDayAverageResponse(
+            latitude=metadata.latitude,
+            longitude=metadata.longitude,
+            month=request.month,
+            day=request.day,
+            years_analyzed=years_found,
+            hourly_averages=hourly_averages,
+            peak_hour=peak_hour,
+            peak_irradiance=peak_irradiance,
+            daily_total_energy=daily_total
+        )
+    
+    @staticmethod
+    def _day_average_cube(request: PVGISDayAverageCubeRequest, metadata: PVGISMetadata,
+                          series: HourlySeriesDataclass) -> PVGISDayAverageCubeResponse:
+        """Average every (calendar day, hour) cell of the series with one grouped reduction per variable."""
+        if series.times.size == 0:
+            raise ValueError(f"No data found in years {request.start_year}-{request.end_year}")
+        
+        year, month, day, hour, _, _ = TimeAxis.split(series.times)
+        cells = (PVGISPlusService.MONTH_STARTS[month - 1] + day - 1) * 24 + hour
+        counts, averages = PVGISPlusService._group_means(series, cells, 366 * 24)
+        counts = counts.reshape(366, 24)
+        averages = {field: values.reshape(366, 24) for field, values in averages.items()}
+        
+        years_found = sorted(int(y) for y in np.unique(year))
+        peak_hours, peak_values = PVGISPlusService._peaks(averages["G_i"])
+        daily_totals = averages["G_i"].sum(axis=1)
+        logger.info(
+            f"Calculated day average cube from {series.times.size} records, years {years_found[0]}-{years_found[-1]}; "
+            f"{int(np.count_nonzero(counts.sum(axis=1)))} of 366 days have data"
+        )
+        
+        return PVGISDayAverageCubeResponse(
+            latitude=metadata.latitude,
+            longitude=metadata.longitude,
+            years_analyzed=years_found,
+            dates=PVGISPlusService.CALENDAR_DATES,
+            sample_count=counts.tolist(),
+            peak_hour=peak_hours.tolist(),
+            peak_irradiance=peak_values.tolist(),
+            daily_total_energy=daily_totals.tolist(),
+            **{field: values.tolist() for field, values in averages.items()}
+        )
+    
+    @staticmethod
+    def _day_statistics(request: PVGISDayAverageRequest, metadata: PVGISMetadata,
+                        years: List[HourlySeriesDataclass]) -> PVGISDayStatisticsResponse:
+        """Distribution per hour of the requested calendar day (already selected, one series per year)."""
+        counts = np.zeros(24, dtype=np.int64)
+        moments = {field: GroupedMoments(24) for field in PVGISPlusService.AVERAGED_COLUMNS}
+        sketches = {field: GroupedQuantileSketch(24) for field in PVGISPlusService.AVERAGED_COLUMNS}
+        years_found = set()
+        
+        # Fold in one year at a time; the accumulators have a fixed size whatever the number of years
+        for series in years:
+            year, _, _, hour, _, _ = TimeAxis.split(series.times)
+            years_found.update(int(y) for y in np.unique(year))
+            counts += np.bincount(hour, minlength=24)
+            for field, column in PVGISPlusService.AVERAGED_COLUMNS.items():
+                values = series.column(column)
+                moments[field].update(hour, values)
+                sketches[field].update(hour, values)
+        
+        if not counts.any():
+            raise ValueError(
+                f"No data found for {request.month:02d}/{request.day:02d} "
+                f"in years {request.start_year}-{request.end_year}"
+            )
+        logger.info(f"Day statistics for {request.month:02d}/{request.day:02d} from {int(counts.sum())} records")
+        
+        columns = {}
+        for field in PVGISPlusService.AVERAGED_COLUMNS:
+            m, sketch = moments[field], sketches[field]
+            present, std = m.count > 0, m.std()
+            # The sketch is relative-accurate; clamping keeps the extremes exact
+            percentiles = {
+                name: np.clip(sketch.quantile(q), m.min, m.max)
+                for name, q in (("p10", 0.1), ("p50", 0.5), ("p90", 0.9))
+            }
+            columns[field] = [
+                VariableStatistics(
+                    mean=float(m.mean[h]),
+                    std=float(std[h]),
+                    min=float(m.min[h]),
+                    max=float(m.max[h]),
+                    **{name: float(values[h]) for name, values in percentiles.items()}
+                ) if present[h] else VariableStatistics()
+                for h in range(24)
+            ]
+        
+        return PVGISDayStatisticsResponse(
+            latitude=metadata.latitude,
+            longitude=metadata.longitude,
+            month=request.month,
+            day=request.day,
+            years_analyzed=sorted(years_found),
+            hourly_statistics=[
+                HourlyStatistics(hour=h, sample_count=int(counts[h]),
+                                 **{field: columns[field][h] for field in PVGISPlusService.AVERAGED_COLUMNS})
+                for h in range(24)
+            ]
+        )
+    
+    @staticmethod
+    def _check_selection(request: PVGISAggregateRequest) -> None:
+        for name, values, low, high in (("months", request.months, 1, 12), ("days", request.days, 1, 31),
+                                        ("hours", request.hours, 0, 23)):
+            if values is not None and not all(low <= value <= high for value in values):
+                raise ValueError(f"{name} must be between {low} and {high}, got {values}")
+    
+    @staticmethod
+    def _aggregate(request: PVGISAggregateRequest, metadata: PVGISMetadata,
+                   series: HourlySeriesDataclass) -> PVGISAggregateResponse:
+        """Group the selected records by request.group_by and average each group with one bincount per variable."""
+        year, month, day, hour, _, _ = TimeAxis.split(series.times)
+        day_of_year = PVGISPlusService.MONTH_STARTS[month - 1] + day - 1
+        
+        # Group key and number of possible groups of each mode
+        keys, size = {
+            AggregateGrouping.ALL: (np.zeros_like(hour), 1),
+            AggregateGrouping.MONTH: (month - 1, 12),
+            AggregateGrouping.DAY: (day_of_year, 366),
+            AggregateGrouping.HOUR: (hour, 24),
+            AggregateGrouping.MONTH_HOUR: ((month - 1) * 24 + hour, 12 * 24),
+            AggregateGrouping.DAY_HOUR: (day_of_year * 24 + hour, 366 * 24),
+        }[request.group_by]
+        counts, averages = PVGISPlusService._group_means(series, keys, size)
+        
+        # Decode the keys of the groups that have samples back into calendar fields
+        found = np.flatnonzero(counts)
+        by_hour = request.group_by in (AggregateGrouping.MONTH_HOUR, AggregateGrouping.DAY_HOUR)
+        periods = found // 24 if by_hour else found
+        
+        group_month = group_day = group_hour = [None] * found.size
+        if by_hour:
+            group_hour = (found % 24).tolist()
+        elif request.group_by == AggregateGrouping.HOUR:
+            group_hour = found.tolist()
+        if request.group_by in (AggregateGrouping.MONTH, AggregateGrouping.MONTH_HOUR):
+            group_month = (periods + 1).tolist()
+        elif request.group_by in (AggregateGrouping.DAY, AggregateGrouping.DAY_HOUR):
+            months = np.searchsorted(PVGISPlusService.MONTH_STARTS, periods, side="right")
+            group_month = months.tolist()
+            group_day = (periods - PVGISPlusService.MONTH_STARTS[months - 1] + 1).tolist()
+        
+        logger.info(
+            f"Aggregated {series.times.size} records into {found.size} groups "
+            f"(group_by={request.group_by.value})"
+        )
+        
+        return PVGISAggregateResponse(
+            latitude=metadata.latitude,
+            longitude=metadata.longitude,
+            years_analyzed=sorted(int(y) for y in np.unique(year)),
+            group_by=request.group_by,
+            record_count=int(series.times.size),
+            groups=[
+                AggregateGroup(
+                    month=group_month[i],
+                    day=group_day[i],
+                    hour=group_hour[i],
+                    sample_count=int(counts[key]),
+                    **{field: float(values[key]) for field, values in averages.items()}
+                )
+                for i, key in enumerate(found)
+            ]
+        )
+    
+    @staticmethod
+    def _group_means(series: HourlySeriesDataclass, groups: np.ndarray, size: int):
+        """
+        Per-group sample counts and means of the averaged variables, one bincount per variable.
+        Missing values count as zero and groups without records keep zero averages.
+        
+        Returns:
+            (counts, {response field: means}), arrays of length `size`
+        """
+        counts = np.bincount(groups, minlength=size)
+        present = counts > 0
+        averages = {}
+        for field, column in PVGISPlusService.AVERAGED_COLUMNS.items():
+            values = np.nan_to_num(series.column(column, 0.0), nan=0.0)
+            sums = np.bincount(groups, weights=values, minlength=size)
+            averages[field] = np.divide(sums, counts, out=np.zeros(size), where=present)
+        return counts, averages
+    
+    @staticmethod
+    def _peaks(irradiance: np.ndarray):
+        """
+        First hour with the highest positive average of each row; hour 0 when the day is dark throughout.
+        
+        Returns:
+            (peak hour, peak irradiance) per row
+        """
+        hours = np.argmax(irradiance, axis=1)
+        values = np.take_along_axis(irradiance, hours[:, None], axis=1)[:, 0]
+        dark = values <= 0
+        hours[dark] = 0
+        values[dark] = 0.0
+        return hours, values
\ No newline at end of file
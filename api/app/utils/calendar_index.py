@@ -0,0 +1,85 @@
+from typing import Collection, Optional, Union
+import numpy as np
+from numpy.typing import ArrayLike
+from .time_axis import TimeAxis
+
+# One value, a set of values (set, list, tuple or array), or None for any value
+CalendarFilter = Optional[Union[int, Collection[int]]]
+
+
+class CalendarIndex:
+    """
+    Row index of an hourly series by calendar slot (month, day, hour), in CSR form.
+
+    Slots are numbered ((month - 1) * 31 + day - 1) * 24 + hour, so every calendar
+    day owns 24 consecutive slots. `order` lists the row numbers sorted by slot
+    (stable, so rows keep time order within a slot) and the rows of slot k are
+    order[offsets[k]:offsets[k + 1]]. Built once with one argsort and one
+    bincount; a query gathers only the matching rows instead of scanning the series.
+
+    Example:
+        >>> index = CalendarIndex(series.times)
+        >>> rows = index.rows(month=4, day=15)  # every hour of every April 15th
+        >>> rows = index.rows(month=4, hour=[3, 6, 9, 12, 15])
+    """
+
+    SLOTS = 12 * 31 * 24
+
+    def __init__(self, times: ArrayLike):
+        _, month, day, hour, _, _ = TimeAxis.split(times)
+        slots = CalendarIndex._slot(month, day, hour)
+
+        # int32 halves the index next to the series; hourly series stay far below 2**31 rows
+        self.order = np.argsort(slots, kind="stable").astype(np.int32)
+        self.offsets = np.zeros(self.SLOTS + 1, dtype=np.int32)
+        np.cumsum(np.bincount(slots, minlength=self.SLOTS), out=self.offsets[1:])
+
+        self.order.flags.writeable = False
+        self.offsets.flags.writeable = False
+
+    def rows(self, month: CalendarFilter = None, day: CalendarFilter = None, hour: CalendarFilter = None) -> np.ndarray:
+        """
+        Row numbers matching the given calendar fields, in time order. Each field
+        is one value, a set of values, or None to match any value.
+
+        Raises:
+            ValueError: If a field is out of range
+        """
+        months = CalendarIndex._values("month", month, 1, 12)
+        days = CalendarIndex._values("day", day, 1, 31)
+        hours = CalendarIndex._values("hour", hour, 0, 23)
+
+        slots = CalendarIndex._slot(months[:, None, None], days[None, :, None], hours[None, None, :]).ravel()
+        starts = self.offsets[slots]
+        lengths = self.offsets[slots + 1] - starts
+        if slots.size == 1:
+            return self.order[starts[0]:starts[0] + lengths[0]]
+
+        # Concatenate the ranges of all slots in one gather: position i of range j is starts[j] + i
+        ends = np.cumsum(lengths)
+        positions = np.arange(ends[-1]) + np.repeat(starts - (ends - lengths), lengths)
+        return np.sort(self.order[positions])
+
+    def count(self, month: int, day: int, hour: int) -> int:
+        """Number of rows in one calendar slot."""
+        slot = CalendarIndex._slot(month, day, hour)
+        return int(self.offsets[slot + 1] - self.offsets[slot])
+
+    @staticmethod
+    def _slot(month, day, hour):
+        return ((np.asarray(month) - 1) * 31 + (np.asarray(day) - 1)) * 24 + np.asarray(hour)
+
+    @staticmethod
+    def _values(name: str, value: CalendarFilter, low: int, high: int) -> np.ndarray:
+        if value is None:
+            return np.arange(low, high + 1)
+        # np.asarray does not read sets, which have no order
+        if isinstance(value, (set, frozenset)):
+            values = np.unique(np.fromiter(value, dtype=np.int64, count=len(value)))
+        else:
+            values = np.unique(np.asarray(value, dtype=np.int64).ravel())
+        if values.size == 0:
+            raise ValueError(f"At least one {name} must be given")
+        if values[0] < low or values[-1] > high:
+            raise ValueError(f"{name} must be between {low} and {high}, got {values.tolist()}")
+        return values
@@ -1,5 +1,10 @@
 import math
-from ..core.logger import app_logger as logger
+import numpy as np
+from numpy.typing import ArrayLike
+from ..core.logger import app_logger as logger, LogSampler
+
+_log_start = LogSampler(logger)
+_log_done = LogSampler(logger)
 
 
 class JulianDateCalculator:
@@ -13,10 +18,7 @@ class JulianDateCalculator:
         Input validation is handled by schemas/dataclasses before this method is called.
         """
         try:
-            logger.debug(
-                f"Calculating Julian Date for {year}-{month:02d}-{day:02d} "
-                f"{hour:02d}:{minute:02d}:{second:02d}"
-            )
+            _log_start("Calculating Julian Date for %s-%02d-%02d %02d:%02d:%02d", year, month, day, hour, minute, second)
             
             m, d, y = int(month), int(day), int(year)
             hr, mn, sec = float(hour), float(minute), float(second)
@@ -38,7 +40,7 @@ class JulianDateCalculator:
             time_fraction = hr / 24.0 + mn / 1440.0 + sec / 86400.0
             
             result = JD + time_fraction
-            logger.debug(f"Julian Date calculated: {result}")
+            _log_done("Julian Date calculated: %s", result)
             
             return result
 
@@ -55,4 +57,38 @@ class JulianDateCalculator:
         
         except Exception as e:
             logger.error(f"Unexpected error in Julian Date calculation: {str(e)}")
-            raise RuntimeError(f"Unexpected error in Julian Date calculation: {str(e)}") from e
\ No newline at end of file
+            raise RuntimeError(f"Unexpected error in Julian Date calculation: {str(e)}") from e
+
+
+    @staticmethod
+    def calculate_array(month: ArrayLike, day: ArrayLike, year: ArrayLike,
+                        hour: ArrayLike, minute: ArrayLike, second: ArrayLike) -> np.ndarray:
+        """
+        Vectorised version of calculate() for NumPy arrays (or broadcastable scalars).
+        Input validation is handled by schemas/dataclasses before this method is called.
+        """
+        try:
+            m = np.asarray(month, dtype=np.int64)
+            d = np.asarray(day, dtype=np.int64)
+            y = np.asarray(year, dtype=np.int64)
+            hr = np.asarray(hour, dtype=np.float64)
+            mn = np.asarray(minute, dtype=np.float64)
+            sec = np.asarray(second, dtype=np.float64)
+
+            # January and February are counted as months 13 and 14 of the previous year
+            early = m < 3
+            y = np.where(early, y - 1, y)
+            m = np.where(early, m + 12, m)
+
+            A = np.floor(y / 100.0)
+            B = 2 - A + np.floor(A / 4.0)
+
+            JD = (np.floor(365.25 * (y + 4716)) +
+                  np.floor(30.6001 * (m + 1)) +
+                  d + B - 1524.5)
+
+            return JD + (hr / 24.0 + mn / 1440.0 + sec / 86400.0)
+
+        except Exception as e:
+            logger.error(f"Unexpected error in vectorised Julian Date calculation: {str(e)}")
+            raise RuntimeError(f"Unexpected error in vectorised Julian Date calculation: {str(e)}") from e
@@ -1,5 +1,10 @@
 import math
-from ..core.logger import app_logger as logger
+import numpy as np
+from numpy.typing import ArrayLike
+from ..core.logger import app_logger as logger, LogSampler
+
+_log_start = LogSampler(logger)
+_log_done = LogSampler(logger)
 
 
 class PressureCalculator:
@@ -12,7 +17,7 @@ class PressureCalculator:
         Input validation is handled by schemas/dataclasses before this method is called.
         """
         try:
-            logger.debug(f"Calculating station pressure: sea_level={p_sea_level}mbar, elevation={elevation_m}m")
+            _log_start("Calculating station pressure: sea_level=%smbar, elevation=%sm", p_sea_level, elevation_m)
             
             H = float(elevation_m) / 1000.0
             
@@ -20,7 +25,7 @@ class PressureCalculator:
             # Formula accounts for both linear and quadratic elevation effects
             pressure = float(p_sea_level) * math.exp(-0.119 * H - 0.0013 * H * H)
             
-            logger.debug(f"Station pressure calculated: {pressure:.2f}mbar")
+            _log_done("Station pressure calculated: %.2fmbar", pressure)
             
             return pressure
 
@@ -37,4 +42,19 @@ class PressureCalculator:
         
         except Exception as e:
             logger.error(f"Unexpected error in pressure calculation: {str(e)}")
-            raise RuntimeError(f"Unexpected error in pressure calculation: {str(e)}") from e
\ No newline at end of file
+            raise RuntimeError(f"Unexpected error in pressure calculation: {str(e)}") from e
+
+
+    @staticmethod
+    def station_pressure_array(p_sea_level: ArrayLike, elevation_m: ArrayLike) -> np.ndarray:
+        """
+        Vectorised version of station_pressure() for NumPy arrays (or broadcastable scalars).
+        Input validation is handled by schemas/dataclasses before this method is called.
+        """
+        try:
+            H = np.asarray(elevation_m, dtype=np.float64) / 1000.0
+            return np.asarray(p_sea_level, dtype=np.float64) * np.exp(-0.119 * H - 0.0013 * H * H)
+
+        except Exception as e:
+            logger.error(f"Unexpected error in vectorised pressure calculation: {str(e)}")
+            raise RuntimeError(f"Unexpected error in vectorised pressure calculation: {str(e)}") from e
@@ -0,0 +1,83 @@
+import io
+import warnings
+from typing import Dict, Tuple
+import numpy as np
+from ..dataclasses.hourly_series_dc import HourlySeriesDataclass
+from .time_axis import TimeAxis
+
+
+class PVGISCSVParser:
+    """
+    Columnar parser for PVGIS hourly CSV bodies (seriescalc and tmy, outputformat=csv).
+
+    The body has a few "Key: value" metadata lines, a header row starting with
+    "time" (seriescalc) or "time(UTC)" (tmy), the data rows and, after a blank line,
+    a legend. The table is read by NumPy's C parser in two passes (timestamps as
+    fixed-width bytes, values as float64) and the time axis is built with one
+    vectorised TimeAxis.parse_pvgis_buffer call; no per-row Python objects are created.
+
+    Example:
+        >>> header, series = PVGISCSVParser.parse(response.content)
+        >>> series.column("G(i)")
+    """
+
+    TIME_COLUMN = b"time"
+
+    @staticmethod
+    def parse(body: bytes) -> Tuple[Dict[str, str], HourlySeriesDataclass]:
+        """
+        Returns:
+            (metadata lines before the table as {key: value}, typed series)
+
+        Raises:
+            ValueError: If the body does not contain a well-formed PVGIS hourly table
+        """
+        body = body.replace(b"\r\n", b"\n")
+
+        if body.startswith(PVGISCSVParser.TIME_COLUMN):
+            start = 0
+        else:
+            start = body.find(b"\n" + PVGISCSVParser.TIME_COLUMN) + 1
+            if start == 0:
+                raise ValueError(f"PVGIS CSV has no hourly table: {body[:500].decode('utf-8', errors='replace')}")
+
+        header = PVGISCSVParser._parse_metadata(body[:start])
+
+        header_end = body.find(b"\n", start)
+        if header_end < 0:
+            raise ValueError("PVGIS CSV ends after the header row")
+        names = [name.strip() for name in body[start:header_end].decode("utf-8").split(",")[1:]]
+
+        table_end = body.find(b"\n\n", header_end)
+        table = body[header_end + 1:table_end if table_end >= 0 else len(body)]
+        if not table.strip():
+            empty = np.empty(0, dtype=np.float64)
+            return header, HourlySeriesDataclass(times=TimeAxis.parse_pvgis_buffer(b""),
+                                                 columns={name: empty.copy() for name in names})
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            try:
+                # One extra byte per timestamp to detect values longer than YYYYMMDD:HHMM
+                stamps = np.loadtxt(io.BytesIO(table), delimiter=",", usecols=0, dtype="S14", ndmin=1)
+                values = np.loadtxt(io.BytesIO(table), delimiter=",", usecols=range(1, len(names) + 1),
+                                    dtype=np.float64, ndmin=2)
+            except (ValueError, UserWarning) as e:
+                raise ValueError(f"Malformed PVGIS CSV table: {str(e)}") from e
+
+        chars = stamps.view(np.uint8).reshape(stamps.size, 14)
+        if np.any(chars[:, 13]):
+            raise ValueError("PVGIS timestamps must all have the form YYYYMMDD:HHMM")
+        times = TimeAxis.parse_pvgis_buffer(np.ascontiguousarray(chars[:, :13]).tobytes())
+
+        columns = {name: np.ascontiguousarray(values[:, i]) for i, name in enumerate(names)}
+        return header, HourlySeriesDataclass(times=times, columns=columns)
+
+    @staticmethod
+    def _parse_metadata(head: bytes) -> Dict[str, str]:
+        metadata = {}
+        for line in head.decode("utf-8", errors="replace").splitlines():
+            key, colon, value = line.partition(":")
+            if colon and key.strip():
+                metadata[key.strip()] = value.strip()
+        return metadata
@@ -0,0 +1,151 @@
+import json
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from ..dataclasses.hourly_series_dc import HourlySeriesDataclass
+from ..core.logger import app_logger as logger
+from .time_axis import TimeAxis
+
+
+class HourlySeriesParser:
+    """
+    Incremental parser for PVGIS seriescalc JSON responses.
+
+    Bytes are fed as they arrive. Once the `outputs.hourly` array starts, every
+    complete run of records in the buffer is decoded in one json.loads call,
+    filtered, and appended to typed columns (array('d') per variable), after which
+    the bytes and dicts are dropped. Peak memory is the typed result plus one
+    network chunk, instead of one Python dict per hour of the whole series.
+
+    PVGIS hourly records are flat objects of numbers plus a "time" string, so a
+    record never contains '}' or ']'; that is what makes the record boundaries
+    detectable without a full JSON tokenizer.
+
+    Example:
+        >>> parser = HourlySeriesParser(month=4, day=15)
+        >>> for chunk in response.iter_content(65536):
+        ...     parser.feed(chunk)
+        >>> inputs, series = parser.close()
+    """
+
+    HOURLY_KEY = b'"hourly"'
+
+    def __init__(self, month: Optional[int] = None, day: Optional[int] = None, hour: Optional[int] = None):
+        # Compare timestamp slices ("YYYYMMDD:HHMM") instead of parsing every record's date
+        self._checks = [
+            (start, f"{value:02d}")
+            for start, value in ((4, month), (6, day), (9, hour))
+            if value is not None
+        ]
+
+        self._buffer = bytearray()
+        self._in_records = False
+        self._finished = False
+        self._inputs: Dict[str, Any] = {}
+
+        self._names: Optional[List[str]] = None
+        self._values: Dict[str, array] = {}
+        self._times = bytearray()
+        self._records_seen = 0
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume the next chunk of the response body."""
+        if self._finished or not chunk:
+            return
+
+        self._buffer += chunk
+        if not self._in_records:
+            self._find_records()
+        if self._in_records:
+            self._consume_records()
+
+    def close(self) -> Tuple[Dict[str, Any], HourlySeriesDataclass]:
+        """
+        Finish parsing.
+
+        Returns:
+            (`inputs` section of the response, typed series of the records that passed the filter)
+
+        Raises:
+            ValueError: If the body is not a PVGIS hourly series (PVGIS error messages included)
+        """
+        if not self._in_records:
+            self._raise_for_body()
+        if not self._finished:
+            raise ValueError("PVGIS response ended inside the hourly series")
+
+        names = self._names or []
+        series = HourlySeriesDataclass(
+            times=TimeAxis.parse_pvgis_buffer(bytes(self._times)),
+            columns={name: np.frombuffer(self._values[name], dtype=np.float64) for name in names}
+        )
+        logger.info(f"Streamed PVGIS hourly series: {self._records_seen} records, {series.times.size} kept")
+        return self._inputs, series
+
+    def _find_records(self) -> None:
+        start = self._buffer.find(self.HOURLY_KEY)
+        if start < 0:
+            return
+        bracket = self._buffer.find(b"[", start + len(self.HOURLY_KEY))
+        if bracket < 0:
+            return
+
+        # Everything before the series (the "inputs" object) is small; decode it normally
+        head = self._buffer[:start].decode("utf-8")
+        key = head.find('"inputs"')
+        if key >= 0:
+            colon = head.index(":", key)
+            decoder = json.JSONDecoder()
+            position = len(head) - len(head[colon + 1:].lstrip())
+            self._inputs, _ = decoder.raw_decode(head, position)
+
+        del self._buffer[:bracket + 1]
+        self._in_records = True
+
+    def _consume_records(self) -> None:
+        end = self._buffer.find(b"]")
+        if end >= 0:
+            cut = end
+        else:
+            cut = self._buffer.rfind(b"}") + 1
+            if cut <= 0:
+                return
+
+        batch = bytes(self._buffer[:cut]).strip().strip(b",")
+        del self._buffer[:cut]
+        if end >= 0:
+            self._finished = True
+            self._buffer.clear()
+
+        if batch:
+            self._append(json.loads(b"[" + batch + b"]"))
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        self._records_seen += len(records)
+        nan = float("nan")
+        try:
+            if self._checks:
+                records = [r for r in records if all(r["time"][s:s + 2] == v for s, v in self._checks)]
+            if not records:
+                return
+
+            if self._names is None:
+                self._names = [name for name in records[0] if name != "time"]
+                self._values = {name: array("d") for name in self._names}
+
+            self._times += "".join(r["time"] for r in records).encode("ascii")
+            for name in self._names:
+                self._values[name].extend([r.get(name, nan) for r in records])
+        except (KeyError, TypeError, UnicodeEncodeError) as e:
+            raise ValueError(f"Malformed PVGIS hourly record: {str(e)}") from e
+
+    def _raise_for_body(self) -> None:
+        text = bytes(self._buffer).decode("utf-8", errors="replace")
+        try:
+            data = json.loads(text)
+        except ValueError:
+            raise ValueError(f"PVGIS returned a response without an hourly series: {text[:500]}") from None
+
+        if isinstance(data, dict) and "message" in data:
+            raise ValueError(f"PVGIS API error: {data['message']}")
+        raise ValueError("PVGIS response has no outputs.hourly series")
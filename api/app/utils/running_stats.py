@@ -0,0 +1,152 @@
+import math
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+class GroupedMoments:
+    """
+    Count, mean, sum of squared deviations (M2), min and max for each of `size` groups.
+
+    A batch of samples is reduced with bincount (two passes over the batch, so the
+    deviations are taken from the batch mean) and folded into the running values
+    with the pairwise update of Chan et al., the batch form of Welford's algorithm.
+    Partial results merge exactly, so years can be added one at a time without
+    keeping their samples. NaN samples are skipped.
+
+    Example:
+        >>> moments = GroupedMoments(24)
+        >>> for year_hours, year_values in years:
+        ...     moments.update(year_hours, year_values)
+        >>> moments.mean, moments.std()
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.count = np.zeros(size, dtype=np.int64)
+        self.mean = np.zeros(size)
+        self.m2 = np.zeros(size)
+        self.min = np.full(size, np.inf)
+        self.max = np.full(size, -np.inf)
+
+    def update(self, groups: ArrayLike, values: ArrayLike) -> None:
+        """Add a batch of samples; groups[i] is the group (0..size-1) of values[i]."""
+        groups = np.asarray(groups, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+        valid = ~np.isnan(values)
+        groups, values = groups[valid], values[valid]
+
+        batch = GroupedMoments(self.size)
+        batch.count = np.bincount(groups, minlength=self.size)
+        present = batch.count > 0
+        np.divide(np.bincount(groups, weights=values, minlength=self.size), batch.count,
+                  out=batch.mean, where=present)
+        deviations = values - batch.mean[groups]
+        batch.m2 = np.bincount(groups, weights=deviations * deviations, minlength=self.size)
+        np.minimum.at(batch.min, groups, values)
+        np.maximum.at(batch.max, groups, values)
+
+        self.merge(batch)
+
+    def merge(self, other: "GroupedMoments") -> None:
+        """Fold another partial result over the same groups into this one."""
+        if other.size != self.size:
+            raise ValueError(f"Cannot merge moments of {other.size} groups into {self.size}")
+
+        count = self.count + other.count
+        present = count > 0
+        delta = other.mean - self.mean
+        weight = np.divide(other.count, count, out=np.zeros(self.size), where=present)
+
+        self.m2 = self.m2 + other.m2 + delta * delta * self.count * weight
+        self.mean = self.mean + delta * weight
+        self.count = count
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+
+    def std(self, ddof: int = 1) -> np.ndarray:
+        """Standard deviation per group (sample standard deviation by default); 0 with too few samples."""
+        dof = self.count - ddof
+        return np.sqrt(np.divide(self.m2, dof, out=np.zeros(self.size), where=dof > 0))
+
+
+class GroupedQuantileSketch:
+    """
+    Mergeable quantile sketch for each of `size` groups, with relative accuracy.
+
+    Values are counted in logarithmic buckets (DDSketch): bucket k holds magnitudes
+    in (gamma^(k-1), gamma^k] with gamma = (1 + accuracy) / (1 - accuracy), so any
+    quantile is returned within `accuracy` of a sample of that rank. Magnitudes
+    below min_value share one zero bucket and magnitudes above max_value are
+    counted in the last bucket. The buckets of all groups form one dense count
+    matrix, so updates are a single bincount and merging is an addition,
+    whatever the number of samples.
+    """
+
+    def __init__(self, size: int, accuracy: float = 0.01, min_value: float = 1e-3, max_value: float = 1e5):
+        if not 0 < accuracy < 1:
+            raise ValueError("Sketch accuracy must be between 0 and 1")
+
+        self.size = size
+        self.accuracy = accuracy
+        self.min_value = min_value
+        self.max_value = max_value
+
+        self._log_gamma = math.log((1 + accuracy) / (1 - accuracy))
+        self._min_key = math.ceil(math.log(min_value) / self._log_gamma)
+        self._keys = math.ceil(math.log(max_value) / self._log_gamma) - self._min_key + 1
+
+        # Buckets in value order: negative magnitudes descending, zero, positive magnitudes ascending
+        self.counts = np.zeros((size, 2 * self._keys + 1), dtype=np.int64)
+
+    def update(self, groups: ArrayLike, values: ArrayLike) -> None:
+        """Add a batch of samples; groups[i] is the group (0..size-1) of values[i]. NaN samples are skipped."""
+        groups = np.asarray(groups, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+        valid = ~np.isnan(values)
+        groups, values = groups[valid], values[valid]
+
+        buckets = self._bucket(values)
+        width = self.counts.shape[1]
+        self.counts += np.bincount(groups * width + buckets, minlength=self.size * width).reshape(self.size, width)
+
+    def merge(self, other: "GroupedQuantileSketch") -> None:
+        """Add the counts of a sketch with the same groups and bucket layout."""
+        if other.counts.shape != self.counts.shape or other.accuracy != self.accuracy or other.min_value != self.min_value:
+            raise ValueError("Cannot merge quantile sketches with different groups or bucket layouts")
+        self.counts += other.counts
+
+    def quantile(self, q: float) -> np.ndarray:
+        """
+        Estimate of the q-quantile (0 <= q <= 1) of each group, interpolated linearly
+        between the samples of rank floor(q * (n - 1)) and the next one, as numpy's
+        default "linear" method does; each sample is taken within the sketch accuracy.
+        NaN for empty groups.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+
+        cumulative = np.cumsum(self.counts, axis=1)
+        total = cumulative[:, -1]
+        position = q * np.maximum(total - 1, 0)
+        lower = np.floor(position)
+        upper = np.minimum(lower + 1, np.maximum(total - 1, 0))
+        below, above = self._rank_value(cumulative, lower), self._rank_value(cumulative, upper)
+        return np.where(total > 0, below + (position - lower) * (above - below), np.nan)
+
+    def _rank_value(self, cumulative: np.ndarray, rank: np.ndarray) -> np.ndarray:
+        buckets = np.count_nonzero(cumulative <= rank[:, None], axis=1)
+        return self._value(np.minimum(buckets, self.counts.shape[1] - 1))
+
+    def _bucket(self, values: np.ndarray) -> np.ndarray:
+        magnitude = np.abs(values)
+        small = magnitude < self.min_value
+        keys = np.ceil(np.log(np.maximum(magnitude, self.min_value)) / self._log_gamma).astype(np.int64) - self._min_key
+        keys = np.clip(keys, 0, self._keys - 1)
+        return np.where(small, self._keys, np.where(values > 0, self._keys + 1 + keys, self._keys - 1 - keys))
+
+    def _value(self, buckets: np.ndarray) -> np.ndarray:
+        offset = buckets - self._keys
+        keys = np.abs(offset) - 1 + self._min_key
+        # Midpoint (in relative terms) of the bucket's magnitude range
+        magnitude = 2 * np.exp(keys * self._log_gamma) / (1 + math.exp(self._log_gamma))
+        return np.sign(offset) * magnitude
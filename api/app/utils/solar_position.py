@@ -1,9 +1,30 @@
 import math
-from ..core.logger import app_logger as logger
+import threading
+from functools import lru_cache
+import numpy as np
+from numpy.typing import ArrayLike
+from ..dataclasses.ephemeris_dc import EphemerisDataclass
+from ..core.config_loader import settings
+from ..core.logger import app_logger as logger, LogSampler
+
+_log_start = LogSampler(logger)
+_log_done = LogSampler(logger)
 
 
 class SolarPositionCalculator:
-    """Utility class for solar position calculations."""
+    """
+    Utility class for solar position calculations.
+
+    The calculation is split in two stages: a location-independent ephemeris
+    (Sun's right ascension, declination, sidereal time and Earth–Sun distance),
+    which only depends on the Julian date, and a cheap per-site stage that turns
+    the ephemeris into a zenith angle. Scalar ephemerides are kept in a bounded
+    LRU cache; array calls compute each distinct Julian date once.
+    """
+
+    _stats_lock = threading.Lock()
+    _array_points = 0
+    _array_unique_dates = 0
 
     @staticmethod
     def calculate(julian_date: float, longitude: float, latitude: float) -> tuple[float, float]:
@@ -15,48 +36,21 @@ class SolarPositionCalculator:
             zenith_angle (degrees), earth_sun_distance (AU)
         """
         try:
-            logger.debug(f"Calculating solar position: JD={julian_date}, lon={longitude}, lat={latitude}")
-            
+            _log_start("Calculating solar position: JD=%s, lon=%s, lat=%s", julian_date, longitude, latitude)
+
+            eph = SolarPositionCalculator.ephemeris(julian_date)
+
             dr = math.pi / 180.0
-            T = (julian_date - 2451545.0) / 36525.0
-
-            L0 = 280.46645 + 36000.76983 * T + 0.0003032 * T * T
-            M = 357.52910 + 35999.05030 * T - 0.0001559 * T * T - 0.00000048 * T * T * T
-            M_rad = M * dr
-
-            e = 0.016708617 - 0.000042037 * T - 0.0000001236 * T * T
-            C = ((1.914600 - 0.004817 * T - 0.000014 * T * T) * math.sin(M_rad) +
-                 (0.019993 - 0.000101 * T) * math.sin(2.0 * M_rad) +
-                 0.000290 * math.sin(3.0 * M_rad))
-
-            L_true = (L0 + C) % 360.0
-            f = M_rad + C * dr
-            R = 1.000001018 * (1.0 - e * e) / (1.0 + e * math.cos(f))
-
-            sidereal_time = (280.46061837 +
-                             360.98564736629 * (julian_date - 2451545.0) +
-                             0.000387933 * T * T -
-                             T * T * T / 38710000.0) % 360.0
-
-            obliquity = (23.0 + 26.0 / 60.0 +
-                         21.448 / 3600.0 -
-                         46.8150 / 3600.0 * T -
-                         0.00059 / 3600.0 * T * T +
-                         0.001813 / 3600.0 * T * T * T)
-
-            right_ascension = math.atan2(math.sin(L_true * dr) * math.cos(obliquity * dr),
-                                         math.cos(L_true * dr))
-            declination = math.asin(math.sin(obliquity * dr) * math.sin(L_true * dr))
-
-            hour_angle = sidereal_time + longitude - (right_ascension / dr)
-            elevation = math.asin(math.sin(latitude * dr) * math.sin(declination) +
-                                  math.cos(latitude * dr) * math.cos(declination) *
+            hour_angle = eph.sidereal_time + longitude - (eph.right_ascension / dr)
+            elevation = math.asin(math.sin(latitude * dr) * math.sin(eph.declination) +
+                                  math.cos(latitude * dr) * math.cos(eph.declination) *
                                   math.cos(hour_angle * dr)) / dr
 
             zenith_angle = 90.0 - elevation
-            
-            logger.debug(f"Solar position calculated: zenith={zenith_angle:.2f}°, distance={R:.6f}AU")
-            
+            R = eph.earth_sun_distance
+
+            _log_done("Solar position calculated: zenith=%.2f°, distance=%.6fAU", zenith_angle, R)
+
             return zenith_angle, R
 
         except OverflowError as e:
@@ -64,11 +58,154 @@ class SolarPositionCalculator:
             raise OverflowError(
                 f"Numeric overflow in solar position calculation. Error: {str(e)}"
             ) from e
-        
+
         except (ValueError, ZeroDivisionError) as e:
             logger.error(f"Mathematical error in solar position calculation: {str(e)}")
             raise RuntimeError(f"Mathematical error during solar position calculation: {str(e)}") from e
-        
+
         except Exception as e:
             logger.error(f"Unexpected error in solar position calculation: {str(e)}")
-            raise RuntimeError(f"Unexpected error in solar position calculation: {str(e)}") from e
\ No newline at end of file
+            raise RuntimeError(f"Unexpected error in solar position calculation: {str(e)}") from e
+
+    @staticmethod
+    def ephemeris(julian_date: float) -> EphemerisDataclass:
+        """
+        Location-independent solar ephemeris for one Julian date.
+        Results are cached (settings.EPHEMERIS_CACHE_SIZE entries, least recently used evicted).
+        """
+        return _cached_ephemeris(float(julian_date))
+
+    @staticmethod
+    def ephemeris_array(julian_date: ArrayLike) -> EphemerisDataclass:
+        """
+        Vectorised ephemeris for an array of Julian dates.
+        Each distinct date is computed once and broadcast back to the input shape.
+        """
+        jd = np.asarray(julian_date, dtype=np.float64)
+
+        # Strictly increasing axes (time series) are already distinct; skip the sort
+        if jd.size > 1 and not (jd.ndim == 1 and np.all(jd[1:] > jd[:-1])):
+            unique, inverse = np.unique(jd.ravel(), return_inverse=True)
+        else:
+            unique, inverse = jd.ravel(), None
+
+        with SolarPositionCalculator._stats_lock:
+            SolarPositionCalculator._array_points += jd.size
+            SolarPositionCalculator._array_unique_dates += unique.size
+
+        ra, dec, st, R = _ephemeris_terms(unique, np)
+
+        if inverse is None:
+            return EphemerisDataclass(ra.reshape(jd.shape), dec.reshape(jd.shape),
+                                      st.reshape(jd.shape), R.reshape(jd.shape))
+
+        return EphemerisDataclass(
+            right_ascension=ra[inverse].reshape(jd.shape),
+            declination=dec[inverse].reshape(jd.shape),
+            sidereal_time=st[inverse].reshape(jd.shape),
+            earth_sun_distance=R[inverse].reshape(jd.shape)
+        )
+
+    @staticmethod
+    def cache_stats() -> dict:
+        """Hit/miss counters for the scalar LRU cache and sharing counters for the array path."""
+        info = _cached_ephemeris.cache_info()
+        with SolarPositionCalculator._stats_lock:
+            points = SolarPositionCalculator._array_points
+            unique = SolarPositionCalculator._array_unique_dates
+
+        return {
+            "scalar_hits": info.hits,
+            "scalar_misses": info.misses,
+            "scalar_size": info.currsize,
+            "scalar_max_size": info.maxsize,
+            "array_points": points,
+            "array_ephemerides_computed": unique,
+            "array_ephemerides_shared": points - unique
+        }
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Empty the scalar ephemeris cache and reset all counters."""
+        _cached_ephemeris.cache_clear()
+        with SolarPositionCalculator._stats_lock:
+            SolarPositionCalculator._array_points = 0
+            SolarPositionCalculator._array_unique_dates = 0
+
+    @staticmethod
+    def calculate_array(julian_date: ArrayLike, longitude: ArrayLike,
+                        latitude: ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorised version of calculate() for NumPy arrays (or broadcastable scalars).
+        Input validation is handled by schemas/dataclasses before this method is called.
+
+        Returns:
+            zenith_angle (degrees), earth_sun_distance (AU) as arrays of the broadcast shape
+        """
+        try:
+            lon = np.asarray(longitude, dtype=np.float64)
+            lat = np.asarray(latitude, dtype=np.float64)
+
+            eph = SolarPositionCalculator.ephemeris_array(julian_date)
+
+            dr = math.pi / 180.0
+            hour_angle = eph.sidereal_time + lon - (eph.right_ascension / dr)
+            elevation = np.arcsin(np.sin(lat * dr) * np.sin(eph.declination) +
+                                  np.cos(lat * dr) * np.cos(eph.declination) *
+                                  np.cos(hour_angle * dr)) / dr
+
+            zenith_angle = 90.0 - elevation
+            # R only depends on the Julian date; broadcast it so both outputs share one shape
+            R = np.broadcast_to(eph.earth_sun_distance, zenith_angle.shape)
+
+            return zenith_angle, R
+
+        except Exception as e:
+            logger.error(f"Unexpected error in vectorised solar position calculation: {str(e)}")
+            raise RuntimeError(f"Unexpected error in vectorised solar position calculation: {str(e)}") from e
+
+
+def _ephemeris_terms(julian_date, xp):
+    """
+    Sun's right ascension (rad), declination (rad), sidereal time (deg) and distance (AU).
+    `xp` is the math module for scalars or numpy for arrays, so both paths share one formula.
+    """
+    dr = math.pi / 180.0
+    T = (julian_date - 2451545.0) / 36525.0
+
+    L0 = 280.46645 + 36000.76983 * T + 0.0003032 * T * T
+    M = 357.52910 + 35999.05030 * T - 0.0001559 * T * T - 0.00000048 * T * T * T
+    M_rad = M * dr
+
+    e = 0.016708617 - 0.000042037 * T - 0.0000001236 * T * T
+    C = ((1.914600 - 0.004817 * T - 0.000014 * T * T) * xp.sin(M_rad) +
+         (0.019993 - 0.000101 * T) * xp.sin(2.0 * M_rad) +
+         0.000290 * xp.sin(3.0 * M_rad))
+
+    L_true = (L0 + C) % 360.0
+    f = M_rad + C * dr
+    R = 1.000001018 * (1.0 - e * e) / (1.0 + e * xp.cos(f))
+
+    sidereal_time = (280.46061837 +
+                     360.98564736629 * (julian_date - 2451545.0) +
+                     0.000387933 * T * T -
+                     T * T * T / 38710000.0) % 360.0
+
+    obliquity = (23.0 + 26.0 / 60.0 +
+                 21.448 / 3600.0 -
+                 46.8150 / 3600.0 * T -
+                 0.00059 / 3600.0 * T * T +
+                 0.001813 / 3600.0 * T * T * T)
+
+    atan2 = xp.atan2 if xp is math else xp.arctan2
+    asin = xp.asin if xp is math else xp.arcsin
+
+    right_ascension = atan2(xp.sin(L_true * dr) * xp.cos(obliquity * dr), xp.cos(L_true * dr))
+    declination = asin(xp.sin(obliquity * dr) * xp.sin(L_true * dr))
+
+    return right_ascension, declination, sidereal_time, R
+
+
+@lru_cache(maxsize=settings.EPHEMERIS_CACHE_SIZE)
+def _cached_ephemeris(julian_date: float) -> EphemerisDataclass:
+    return EphemerisDataclass(*_ephemeris_terms(julian_date, math))
@@ -0,0 +1,143 @@
+import math
+from typing import Tuple
+import numpy as np
+from numpy.typing import ArrayLike
+from ..dataclasses.sun_times_dc import SunTimesDataclass
+from ..core.logger import app_logger as logger
+from .solar_position import SolarPositionCalculator
+from .time_axis import JD_UNIX_EPOCH
+
+# Apparent rate of the Sun's hour angle (degrees per day)
+HOUR_ANGLE_RATE = 360.0
+
+# Standard sunrise/sunset altitude: refraction at the horizon plus the solar semi-diameter
+STANDARD_ALTITUDE = -0.833
+
+
+class SunTimesCalculator:
+    """
+    Vectorised solar noon, sunrise and sunset for every day of a date range.
+
+    Solar noon is found with Newton iterations on the hour angle. Sunrise and sunset
+    start from the classic hour-angle estimate and are refined with Newton iterations
+    on the elevation function of SolarPositionCalculator, all days at once.
+    """
+
+    NEWTON_STEPS = 16
+    TOLERANCE = 1e-6   # days (≈ 0.09 s)
+    MAX_STEP = 0.05    # days; keeps iterations stable where the Sun barely crosses the altitude
+    POLAR_MARGIN = 0.1
+
+    @staticmethod
+    def calculate(days: ArrayLike, longitude: float, latitude: float,
+                  altitude: float = STANDARD_ALTITUDE) -> SunTimesDataclass:
+        """
+        Solve the Sun events of every date in `days`.
+
+        Each date is taken as the local solar day of the site: the solar noon nearest
+        12:00 local mean time (12:00 UTC minus longitude / 15 hours) with the sunrise
+        before it and the sunset after it, each within 12 h. Far from the Greenwich
+        meridian an event can therefore fall on the adjacent UTC date (at 179.9° E the
+        sunrise of 06-21 is on 06-20 UTC).
+
+        Args:
+            days: datetime64[D] array (or anything convertible to it)
+            altitude: Sun elevation defining sunrise/sunset in degrees
+                (-0.833 standard, 0 geometric, -6 civil twilight, ...)
+        """
+        try:
+            day_jd = np.asarray(days, dtype="datetime64[D]").astype(np.int64) + JD_UNIX_EPOCH
+
+            noon = SunTimesCalculator._transit(day_jd + 0.5 - longitude / HOUR_ANGLE_RATE, longitude)
+            noon_elevation, _, declination = SunTimesCalculator._elevation(noon, longitude, latitude)
+
+            # Hour angle of the crossing for the noon declination. |cos| > 1 means no crossing
+            # at that declination; days just past the limit are still tried because the
+            # declination drifts by up to ~0.2° between midnight and noon.
+            dr = math.pi / 180.0
+            with np.errstate(invalid="ignore", divide="ignore"):
+                cos_h0 = ((math.sin(altitude * dr) - math.sin(latitude * dr) * np.sin(declination)) /
+                          (math.cos(latitude * dr) * np.cos(declination)))
+            crosses = np.abs(cos_h0) < 1.0 + SunTimesCalculator.POLAR_MARGIN
+            # Start just inside noon ± 12 h, where the elevation curve is not flat
+            h0 = np.degrees(np.arccos(np.clip(cos_h0, -0.999, 0.999))) / HOUR_ANGLE_RATE
+
+            sunrise = np.full(noon.shape, np.nan)
+            sunset = np.full(noon.shape, np.nan)
+            if crosses.any():
+                sunrise[crosses] = SunTimesCalculator._crossing(
+                    noon[crosses] - h0[crosses], longitude, latitude, altitude)
+                sunset[crosses] = SunTimesCalculator._crossing(
+                    noon[crosses] + h0[crosses], longitude, latitude, altitude)
+
+            # Converged roots outside noon ± 12 h belong to another day
+            sunrise[(sunrise >= noon) | (sunrise < noon - 0.5)] = np.nan
+            sunset[(sunset <= noon) | (sunset > noon + 0.5)] = np.nan
+
+            both = ~np.isnan(sunrise) & ~np.isnan(sunset)
+            day_length = np.where(noon_elevation > altitude, 24.0, 0.0)
+            day_length[both] = (sunset[both] - sunrise[both]) * 24.0
+
+            logger.debug(f"Sun times solved for {noon.size} days at ({latitude}, {longitude}), altitude={altitude}°")
+
+            return SunTimesDataclass(
+                solar_noon=noon,
+                sunrise=sunrise,
+                sunset=sunset,
+                noon_elevation=noon_elevation,
+                day_length=day_length
+            )
+
+        except Exception as e:
+            logger.error(f"Unexpected error in sun times calculation: {str(e)}")
+            raise RuntimeError(f"Unexpected error in sun times calculation: {str(e)}") from e
+
+    @staticmethod
+    def _elevation(jd: np.ndarray, lon: float, lat: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Elevation (degrees), hour angle (degrees, -180–180) and declination (radians)."""
+        eph = SolarPositionCalculator.ephemeris_array(jd)
+
+        dr = math.pi / 180.0
+        hour_angle = (eph.sidereal_time + lon - eph.right_ascension / dr + 180.0) % 360.0 - 180.0
+        elevation = np.arcsin(math.sin(lat * dr) * np.sin(eph.declination) +
+                              math.cos(lat * dr) * np.cos(eph.declination) *
+                              np.cos(hour_angle * dr)) / dr
+        return elevation, hour_angle, eph.declination
+
+    @staticmethod
+    def _transit(jd: np.ndarray, lon: float) -> np.ndarray:
+        """Newton iterations on the hour angle: the upper transit is where it is zero."""
+        dr = math.pi / 180.0
+        for _ in range(3):
+            eph = SolarPositionCalculator.ephemeris_array(jd)
+            hour_angle = (eph.sidereal_time + lon - eph.right_ascension / dr + 180.0) % 360.0 - 180.0
+            jd = jd - hour_angle / HOUR_ANGLE_RATE
+        return jd
+
+    @staticmethod
+    def _crossing(jd: np.ndarray, lon: float, lat: float, altitude: float) -> np.ndarray:
+        """
+        Newton iterations on elevation(t) - altitude.
+        Points that do not converge within NEWTON_STEPS are returned as NaN.
+        """
+        dr = math.pi / 180.0
+        jd = jd.copy()
+        converged = np.zeros(jd.shape, dtype=bool)
+
+        for _ in range(SunTimesCalculator.NEWTON_STEPS):
+            elevation, hour_angle, declination = SunTimesCalculator._elevation(jd, lon, lat)
+
+            # d(elevation)/dt in degrees/day, ignoring the slow change of declination
+            with np.errstate(invalid="ignore", divide="ignore"):
+                slope = (-math.cos(lat * dr) * np.cos(declination) * np.sin(hour_angle * dr) *
+                         HOUR_ANGLE_RATE / np.cos(elevation * dr))
+                step = np.clip((elevation - altitude) / slope,
+                               -SunTimesCalculator.MAX_STEP, SunTimesCalculator.MAX_STEP)
+
+            step = np.where(converged | ~np.isfinite(step), 0.0, step)
+            jd -= step
+            converged |= np.abs(step) < SunTimesCalculator.TOLERANCE
+            if converged.all():
+                break
+
+        return np.where(converged, jd, np.nan)
@@ -0,0 +1,150 @@
+from datetime import datetime, timezone
+from typing import Optional, Sequence
+import numpy as np
+from numpy.typing import ArrayLike
+from ..core.logger import app_logger as logger
+
+# Julian date of the Unix epoch (1970-01-01T00:00:00 UTC)
+JD_UNIX_EPOCH = 2440587.5
+
+
+class TimeAxis:
+    """Utility class for building and decomposing vectorised UTC time axes."""
+
+    @staticmethod
+    def build(start: datetime, end: datetime, step_minutes: int) -> np.ndarray:
+        """
+        Build an evenly spaced UTC time axis from start to end (inclusive).
+        Timezone-aware datetimes are converted to UTC; naive ones are taken as UTC.
+
+        Returns:
+            datetime64[s] array
+        """
+        start_utc = TimeAxis._to_naive_utc(start)
+        end_utc = TimeAxis._to_naive_utc(end)
+
+        if end_utc < start_utc:
+            raise ValueError("Series end must not be earlier than series start")
+
+        step = np.timedelta64(int(step_minutes) * 60, "s")
+        times = np.arange(
+            np.datetime64(start_utc, "s"),
+            np.datetime64(end_utc, "s") + np.timedelta64(1, "s"),
+            step
+        )
+        logger.debug(f"Built time axis with {times.size} points ({start_utc} -> {end_utc}, step={step_minutes}min)")
+        return times
+
+    @staticmethod
+    def count(start: datetime, end: datetime, step_minutes: int) -> int:
+        """Number of points build() would return, without allocating the axis."""
+        span = (TimeAxis._to_naive_utc(end) - TimeAxis._to_naive_utc(start)).total_seconds()
+        if span < 0:
+            return 0
+        return int(span // (int(step_minutes) * 60)) + 1
+
+    @staticmethod
+    def split(times: ArrayLike) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Decompose a datetime64 array into calendar fields.
+
+        Returns:
+            year, month, day, hour, minute, second as int64 arrays
+        """
+        t = np.asarray(times, dtype="datetime64[s]")
+
+        months = t.astype("datetime64[M]")
+        days = t.astype("datetime64[D]")
+
+        year = t.astype("datetime64[Y]").astype(np.int64) + 1970
+        month = months.astype(np.int64) % 12 + 1
+        day = (days - months.astype("datetime64[D]")).astype(np.int64) + 1
+
+        seconds_of_day = (t - days.astype("datetime64[s]")).astype(np.int64)
+        hour = seconds_of_day // 3600
+        minute = (seconds_of_day % 3600) // 60
+        second = seconds_of_day % 60
+
+        return year, month, day, hour, minute, second
+
+    @staticmethod
+    def to_iso(times: ArrayLike) -> list[str]:
+        """Format a datetime64 array as ISO 8601 strings (second resolution)."""
+        return np.datetime_as_string(np.asarray(times, dtype="datetime64[s]"), unit="s").tolist()
+
+    @staticmethod
+    def to_iso_optional(times: ArrayLike) -> list[Optional[str]]:
+        """Like to_iso(), with NaT entries returned as None."""
+        t = np.asarray(times, dtype="datetime64[s]")
+        iso = np.datetime_as_string(t, unit="s").tolist()
+        return [None if missing else value for value, missing in zip(iso, np.isnat(t).tolist())]
+
+    @staticmethod
+    def from_julian_date(julian_date: ArrayLike) -> np.ndarray:
+        """Convert Julian dates to a datetime64[s] array (rounded to the second, NaN -> NaT)."""
+        jd = np.asarray(julian_date, dtype=np.float64)
+        seconds = np.round((jd - JD_UNIX_EPOCH) * 86400.0)
+        times = np.where(np.isnan(seconds), 0, seconds).astype(np.int64).astype("datetime64[s]")
+        times[np.isnan(seconds)] = np.datetime64("NaT")
+        return times
+
+    @staticmethod
+    def parse_pvgis(timestamps: Sequence[str]) -> np.ndarray:
+        """
+        Parse PVGIS hourly timestamps ("YYYYMMDD:HHMM", UTC) in one vectorised pass.
+
+        Returns:
+            datetime64[s] array
+        """
+        try:
+            buffer = "".join(timestamps).encode("ascii")
+        except UnicodeEncodeError as e:
+            raise ValueError("PVGIS timestamps must be ASCII strings of the form YYYYMMDD:HHMM") from e
+
+        if len(buffer) != len(timestamps) * 13:
+            raise ValueError("PVGIS timestamps must all have the form YYYYMMDD:HHMM")
+
+        return TimeAxis.parse_pvgis_buffer(buffer)
+
+    @staticmethod
+    def parse_pvgis_buffer(buffer: bytes) -> np.ndarray:
+        """
+        Same as parse_pvgis() for timestamps already concatenated into one ASCII buffer
+        (13 bytes per timestamp, no separators).
+        """
+        if len(buffer) % 13:
+            raise ValueError("PVGIS timestamps must all have the form YYYYMMDD:HHMM")
+
+        count = len(buffer) // 13
+        if count == 0:
+            return np.empty(0, dtype="datetime64[s]")
+
+        raw = np.frombuffer(buffer, dtype=np.uint8)
+
+        chars = raw.reshape(count, 13)
+        digits = np.delete(chars, 8, axis=1).astype(np.int64) - ord("0")
+        if np.any(chars[:, 8] != ord(":")) or digits.min() < 0 or digits.max() > 9:
+            raise ValueError("PVGIS timestamps must all have the form YYYYMMDD:HHMM")
+
+        year = digits[:, 0:4] @ np.array([1000, 100, 10, 1])
+        month = digits[:, 4:6] @ np.array([10, 1])
+        day = digits[:, 6:8] @ np.array([10, 1])
+        hour = digits[:, 8:10] @ np.array([10, 1])
+        minute = digits[:, 10:12] @ np.array([10, 1])
+
+        if (np.any((month < 1) | (month > 12)) or np.any((day < 1) | (day > 31)) or
+                np.any(hour > 23) or np.any(minute > 59)):
+            raise ValueError("PVGIS timestamps contain an out-of-range date or time field")
+
+        months = ((year - 1970) * 12 + month - 1).astype("datetime64[M]")
+        days = months.astype("datetime64[D]") + (day - 1)
+        if np.any(days.astype("datetime64[M]") != months):
+            raise ValueError("PVGIS timestamps contain a day that does not exist in its month")
+
+        return days.astype("datetime64[s]") + (hour * 3600 + minute * 60)
+
+    @staticmethod
+    def _to_naive_utc(value: datetime) -> datetime:
+        if value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
@@ -0,0 +1,152 @@
+import threading
+from typing import Callable, Dict, Optional
+import numpy as np
+from numpy.typing import ArrayLike
+from ..core.logger import app_logger as logger
+
+
+class TransmittanceCalculator:
+    """
+    Bird model transmittances that depend on a single scalar argument.
+
+    Exact formulas are vectorised NumPy functions. tabulated() returns the same
+    terms with the expensive ones read from dense lookup tables with linear
+    interpolation, at the cost of a small, bounded error.
+    """
+
+    @staticmethod
+    def rayleigh(AMp: ArrayLike) -> np.ndarray:
+        """Rayleigh scattering transmittance Tr from pressure-corrected air mass."""
+        return np.exp(-0.0903 * np.power(AMp, 0.84) * (1.0 + AMp - np.power(AMp, 1.01)))
+
+    @staticmethod
+    def mixed_gases(AMp: ArrayLike) -> np.ndarray:
+        """Uniformly mixed gases transmittance Tm from pressure-corrected air mass."""
+        return np.exp(-0.0127 * np.power(AMp, 0.26))
+
+    @staticmethod
+    def ozone(Ozm: ArrayLike) -> np.ndarray:
+        """Ozone transmittance Toz from the ozone path length (ozone × air mass)."""
+        return (1.0 - 0.1611 * Ozm * np.power(1.0 + 139.48 * Ozm, -0.3035) -
+                0.002715 * Ozm / (1.0 + 0.044 * Ozm + 0.0003 * Ozm * Ozm))
+
+    @staticmethod
+    def water_vapor(Wm: ArrayLike) -> np.ndarray:
+        """Water vapour transmittance Tw from the water vapour path length (water vapour × air mass)."""
+        return 1.0 - 2.4959 * Wm / ((1.0 + np.power(79.034 * Wm, 0.6828)) + 6.385 * Wm)
+
+    @staticmethod
+    def tabulated() -> "TransmittanceTables":
+        """Shared lookup tables, built on first use."""
+        return TransmittanceTables.instance()
+
+
+class _LookupTable:
+    """
+    Linear interpolation on a uniform grid in x (or in sqrt(x) for terms that are steep near zero).
+    Arguments outside [lower, upper) fall back to the exact formula.
+    """
+
+    def __init__(self, func: Callable[[np.ndarray], np.ndarray], lower: float, upper: float,
+                 size: int, sqrt_spacing: bool):
+        self.func = func
+        self.lower = lower
+        self.upper = upper
+        self.sqrt_spacing = sqrt_spacing
+
+        transform = np.sqrt if sqrt_spacing else (lambda v: v)
+        self.origin = float(transform(lower))
+        grid = np.linspace(self.origin, float(transform(upper)), size + 1)
+        values = func(grid * grid if sqrt_spacing else grid)
+
+        self.scale = size / (grid[-1] - grid[0])
+        self.values = values[:-1].copy()
+        self.slopes = np.diff(values)
+
+    def __call__(self, x: ArrayLike) -> np.ndarray:
+        x = np.asarray(x, dtype=np.float64)
+        u = np.sqrt(x) if self.sqrt_spacing else x.copy()
+        u -= self.origin
+        u *= self.scale
+
+        # One min/max pass decides the common case; NaN fails both comparisons
+        size = self.values.size
+        if u.size and not (u.min() >= 0.0 and u.max() < size):
+            inside = (u >= 0.0) & (u < size)
+            # The exact formula returns a NumPy scalar for 0-d input; make it assignable
+            out = np.array(self.func(x), dtype=np.float64)
+            out[inside] = self._interpolate(u[inside])
+            return out
+        return self._interpolate(u)
+
+    def _interpolate(self, u: np.ndarray) -> np.ndarray:
+        i = u.astype(np.intp)
+        u -= i
+        out = np.take(self.slopes, i)
+        out *= u
+        out += np.take(self.values, i)
+        return out
+
+
+class TransmittanceTables:
+    """
+    Dense lookup tables for the Bird model transmittances.
+
+    Only Tr and Toz are tabulated: their pow/exp chains cost more than a table
+    lookup, while Tm (one pow and one exp) and Tw (a rational function) are cheaper
+    to evaluate exactly, so mixed_gases and water_vapor delegate to the formulas.
+
+    Table ranges cover every physically meaningful argument (air mass up to the
+    horizon value of ~38 at pressures up to 1100 mbar and ozone up to ~0.65 atm-cm
+    at that air mass). Outside them the exact formula is used, so results never
+    degrade past the documented bound.
+
+    Maximum absolute error against the exact formulas over the table range
+    (measured with max_abs_error(), 2 million random arguments per term):
+
+    ====  ===================  ========  =============
+    Term  Argument             Range     Max abs error
+    ====  ===================  ========  =============
+    Tr    AMp                  0.25–45   5e-7
+    Toz   Ozm (sqrt grid)      0–25      2e-8
+    ====  ===================  ========  =============
+
+    Both terms are close to 1 in daylight, so the relative error of direct and
+    diffuse irradiance stays below ~1e-6 (about 0.001 W/m² at 1000 W/m²).
+    """
+
+    SIZE = 8192
+
+    _instance: Optional["TransmittanceTables"] = None
+    _lock = threading.Lock()
+
+    mixed_gases = staticmethod(TransmittanceCalculator.mixed_gases)
+    water_vapor = staticmethod(TransmittanceCalculator.water_vapor)
+
+    def __init__(self, size: int = SIZE):
+        # AMp never drops below ~0.3 (air mass >= 1 at station pressures above ~300 mbar)
+        self.rayleigh = _LookupTable(TransmittanceCalculator.rayleigh, 0.25, 45.0, size, sqrt_spacing=False)
+        self.ozone = _LookupTable(TransmittanceCalculator.ozone, 0.0, 25.0, size, sqrt_spacing=True)
+
+    @classmethod
+    def instance(cls) -> "TransmittanceTables":
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                logger.info(f"Built Bird transmittance lookup tables ({cls.SIZE} intervals per term)")
+            return cls._instance
+
+    def max_abs_error(self, samples: int = 2_000_000, seed: int = 0) -> Dict[str, float]:
+        """Measure the maximum absolute error of every table against its exact formula."""
+        rng = np.random.default_rng(seed)
+        errors = {}
+        for name in ("rayleigh", "ozone"):
+            table = getattr(self, name)
+            # Half the samples uniform, half clustered near the lower edge where the terms are steepest
+            span = table.upper - table.lower
+            x = table.lower + np.concatenate([
+                rng.uniform(0.0, span, samples // 2),
+                span * rng.uniform(0.0, 1.0, samples - samples // 2) ** 4
+            ])
+            errors[name] = float(np.max(np.abs(table(x) - table.func(x))))
+        return errors
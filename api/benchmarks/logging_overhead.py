@@ -0,0 +1,95 @@
+"""
+Per-call logging overhead on the scalar Bird model hot path.
+
+Run from the repository root:
+    python -m api.benchmarks.logging_overhead [--calls 20000]
+
+Every scenario times the same BirdModel.calculate() loop and reports the cost per
+call on top of a baseline with logging disabled. Log handlers are redirected to
+os.devnull so that terminal and disk speed do not dominate the numbers.
+"""
+
+import argparse
+import logging
+import os
+import time
+from ..app.core.logger import app_logger, configure_logging
+from ..app.core.config_loader import settings
+from ..app.dataclasses.solar_io_dc import SolarInputsDataclass
+from ..app.services.birdmodel import BirdModel
+
+INPUTS = SolarInputsDataclass(
+    solar_constant=1367, longitude=27.149, latitude=38.447, elevation=30,
+    month=6, day=21, year=2025, hour=10, minute=30, second=0,
+    station_pressure=1013.25, albedo=0.2, ozone=0.3, water_vapor=1.5,
+    aot500=0.10, aot380=0.15
+)
+
+
+def time_calls(calls: int) -> float:
+    """Mean seconds per BirdModel.calculate() call (best of 3 runs)."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(calls):
+            BirdModel.calculate(INPUTS)
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def time_message(calls: int, lazy: bool) -> float:
+    """Mean seconds per disabled debug call with an eager f-string vs. lazy %-style arguments."""
+    AM, AMp = 1.0345, 1.0311
+    start = time.perf_counter()
+    if lazy:
+        for _ in range(calls):
+            app_logger.debug("Air mass: AM=%.4f, AMp=%.4f", AM, AMp)
+    else:
+        for _ in range(calls):
+            app_logger.debug(f"Air mass: AM={AM:.4f}, AMp={AMp:.4f}")
+    return (time.perf_counter() - start) / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20_000, help="Bird model calls per scenario")
+    args = parser.parse_args()
+
+    devnull = open(os.devnull, "w", encoding="utf-8")
+    for handler in app_logger.handlers:
+        handler.setStream(devnull)
+
+    logging.disable(logging.CRITICAL)
+    baseline = time_calls(args.calls)
+    logging.disable(logging.NOTSET)
+
+    scenarios = [
+        ("DEBUG, every call logged (previous default)", "DEBUG", 1),
+        ("DEBUG, sampled", "DEBUG", settings.LOG_SAMPLE_EVERY),
+        ("INFO, every call logged", "INFO", 1),
+        ("INFO, sampled (default)", "INFO", settings.LOG_SAMPLE_EVERY),
+    ]
+
+    print(f"BirdModel.calculate, {args.calls} calls per scenario, sample rate 1/{settings.LOG_SAMPLE_EVERY}")
+    print(f"{'scenario':<46}{'us/call':>10}{'overhead':>12}")
+    print(f"{'logging disabled (baseline)':<46}{baseline * 1e6:>10.2f}{'':>12}")
+
+    for name, level, every in scenarios:
+        configure_logging(level, every)
+        per_call = time_calls(args.calls)
+        print(f"{name:<46}{per_call * 1e6:>10.2f}{(per_call - baseline) * 1e6:>+10.2f}us")
+
+    configure_logging("INFO", settings.LOG_SAMPLE_EVERY)
+    eager = time_message(args.calls * 10, lazy=False)
+    lazy = time_message(args.calls * 10, lazy=True)
+    print()
+    print("Disabled debug message (level INFO):")
+    print(f"{'  eager f-string':<46}{eager * 1e6:>10.3f}")
+    print(f"{'  lazy %-style':<46}{lazy * 1e6:>10.3f}")
+
+    configure_logging(settings.LOG_LEVEL, settings.LOG_SAMPLE_EVERY)
+    devnull.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,540 @@
+"""
+Local stand-in for the PVGIS API, for load tests and benchmarks without network access.
+
+Run from the repository root:
+    python -m api.benchmarks.pvgis_standin [--port 8081] [--latency 0.2] [--rate-429 0.05] [--rate-529 0.02]
+
+and point the API at it (environment or .env):
+    PVGIS_BASE_URL_V52=http://127.0.0.1:8081/api/v5_2
+    PVGIS_BASE_URL_V53=http://127.0.0.1:8081/api/v5_3
+
+All seven endpoints (PVcalc, SHScalc, MRcalc, DRcalc, seriescalc, tmy, printhorizon)
+are served under both API versions. A response is replayed from the fixture directory
+when it holds <endpoint>.json or <endpoint>.csv (for example saved with curl from the
+real service). seriescalc fixtures depend on the requested years: the stand-in replays
+seriescalc_<startyear>-<endyear>.json/.csv when present, else seriescalc.json/.csv cut
+down to the requested years, so fanned-out per-year calls do not each get the whole
+series. Requests no fixture covers are generated: synthetic, shaped like the PVGIS
+documents, and deterministic for a given location and year, so a multi-year series
+equals its single-year parts. seriescalc and tmy also answer outputformat=csv.
+
+Latency, 429/529 error rates and a minimum payload size are configurable, and
+GET /stats reports the calls, statuses and bytes served (POST /stats/reset clears them).
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+ENDPOINTS = ("PVcalc", "SHScalc", "MRcalc", "DRcalc", "seriescalc", "tmy", "printhorizon")
+CSV_ENDPOINTS = ("seriescalc", "tmy")
+YEAR_MIN, YEAR_MAX = 2005, 2023
+# Hourly rows of a seriescalc CSV start with their timestamp, e.g. 20200101:0010
+CSV_ROW = re.compile(r"^(\d{4})\d{4}:\d{4},")
+
+
+@dataclass
+class StandinConfig:
+    latency: float = 0.0            # Seconds added to every response
+    jitter: float = 0.0             # Extra uniform random latency, 0..jitter seconds
+    rate_429: float = 0.0           # Share of requests answered with 429 Too Many Requests
+    rate_529: float = 0.0           # Share of requests answered with 529 (server overloaded)
+    retry_after: Optional[int] = 1  # Retry-After header of 429 responses (None: no header)
+    payload_bytes: int = 0          # Responses smaller than this are padded up to it
+    fixtures: Optional[Path] = None
+    seed: Optional[int] = None
+
+
+class StandinError(Exception):
+    """Invalid request parameters; answered with 400 and a PVGIS-style message."""
+
+
+# ----Synthetic data----
+
+def _rng(lat: float, lon: float, year: int, salt: int) -> np.random.Generator:
+    return np.random.default_rng([int(round((lat + 90) * 1000)), int(round((lon + 180) * 1000)), year, salt])
+
+
+def _hourly_year(lat: float, lon: float, year: int, slope: float, minute: int = 10) -> Dict[str, np.ndarray]:
+    """One year of hourly weather: rough clear-sky geometry times a random daily cloud factor."""
+    start = np.datetime64(f"{year}-01-01T00:{minute:02d}")
+    times = np.arange(start, np.datetime64(f"{year + 1}-01-01T00:{minute:02d}"), np.timedelta64(1, "h"))
+    days = times.astype("datetime64[D]")
+    doy = (days - np.datetime64(f"{year}-01-01")).astype(np.int64) + 1
+    hours = (times - days).astype(np.int64) / 60.0
+    rng = _rng(lat, lon, year, 1)
+
+    declination = np.radians(23.45) * np.sin(2 * np.pi * (284 + doy) / 365.0)
+    hour_angle = np.radians(15.0 * (hours + lon / 15.0 - 12.0))
+    phi = np.radians(lat)
+    sin_elevation = np.sin(phi) * np.sin(declination) + np.cos(phi) * np.cos(declination) * np.cos(hour_angle)
+    elevation = np.degrees(np.arcsin(np.clip(sin_elevation, -1.0, 1.0)))
+
+    cloud = np.repeat(rng.uniform(0.25, 1.0, size=doy[-1]), 24)[:times.size]
+    horizontal = 1000.0 * np.clip(sin_elevation, 0.0, None) ** 1.15 * cloud
+    tilt_gain = 1.0 + 0.35 * np.sin(np.radians(slope)) * np.cos(phi - declination)
+    season = -np.cos(2 * np.pi * (doy - 15) / 365.0) * np.sign(lat or 1.0)
+
+    return {
+        "times": times,
+        "G(h)": horizontal,
+        "G(i)": horizontal * tilt_gain,
+        "beam": horizontal * np.clip(cloud - 0.2, 0.0, None),
+        "H_sun": np.clip(elevation, 0.0, None),
+        "T2m": 12.0 + 10.0 * season + 4.0 * np.sin(2 * np.pi * (hours - 9) / 24.0) + rng.normal(0, 1.5, times.size),
+        "WS10m": rng.gamma(2.0, 1.4, times.size),
+        "WD10m": rng.uniform(0, 360, times.size),
+        "RH": np.clip(70.0 - 20.0 * cloud + rng.normal(0, 8, times.size), 5.0, 100.0),
+        "SP": 101325.0 + rng.normal(0, 600, times.size),
+    }
+
+
+def _stamps(times: np.ndarray) -> List[str]:
+    """PVGIS timestamps (YYYYMMDD:HHMM)."""
+    return [f"{s[0:4]}{s[5:7]}{s[8:10]}:{s[11:13]}{s[14:16]}" for s in np.datetime_as_string(times, unit="m")]
+
+
+def _round(values: np.ndarray) -> List[float]:
+    return np.round(values, 2).tolist()
+
+
+# ----Request parsing----
+
+def _float(params: Dict[str, str], name: str, default: Optional[float] = None) -> float:
+    value = params.get(name)
+    if value is None:
+        if default is None:
+            raise StandinError(f"Required parameter {name} not found")
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        raise StandinError(f"{name}: Incorrect value. Please, enter a number") from None
+
+
+def _site(params: Dict[str, str]) -> Tuple[float, float]:
+    lat, lon = _float(params, "lat"), _float(params, "lon")
+    if not -90 <= lat <= 90 or not -180 <= lon <= 180:
+        raise StandinError("Location out of range")
+    return lat, lon
+
+
+def _year_range(params: Dict[str, str], default: Tuple[int, int] = (2005, 2020)) -> Tuple[int, int]:
+    start = int(_float(params, "startyear", default[0]))
+    end = int(_float(params, "endyear", default[1]))
+    for name, year in (("startyear", start), ("endyear", end)):
+        if not YEAR_MIN <= year <= YEAR_MAX:
+            raise StandinError(f"{name}: Incorrect value. Please, enter an integer between {YEAR_MIN} and {YEAR_MAX}")
+    if end < start:
+        raise StandinError("endyear must be greater than or equal to startyear")
+    return start, end
+
+
+def _inputs(params: Dict[str, str], lat: float, lon: float, years: Tuple[int, int]) -> Dict[str, Any]:
+    return {
+        "location": {"latitude": lat, "longitude": lon, "elevation": 100.0},
+        "meteo_data": {
+            "radiation_db": params.get("raddatabase", "PVGIS-SARAH2"),
+            "meteo_db": "ERA5",
+            "year_min": years[0],
+            "year_max": years[1],
+            "use_horizon": True,
+            "horizon_db": "DEM-calculated"
+        },
+        "mounting_system": {
+            "fixed": {
+                "slope": {"value": _float(params, "angle", 0.0), "optimal": False},
+                "azimuth": {"value": _float(params, "aspect", 0.0), "optimal": False},
+                "type": params.get("mountingplace", "free")
+            }
+        }
+    }
+
+
+# ----Endpoints----
+
+def _seriescalc(params: Dict[str, str]) -> Tuple[Dict[str, Any], List[str], Dict[str, List[float]]]:
+    lat, lon = _site(params)
+    years = _year_range(params)
+    slope = _float(params, "angle", 0.0)
+    pv = params.get("pvcalculation") == "1"
+    components = params.get("components") == "1"
+    peakpower = _float(params, "peakpower", 1.0)
+    loss = _float(params, "loss", 14.0)
+
+    stamps: List[str] = []
+    columns: Dict[str, List[float]] = {}
+    for year in range(years[0], years[1] + 1):
+        data = _hourly_year(lat, lon, year, slope)
+        part: Dict[str, np.ndarray] = {}
+        if pv:
+            part["P"] = data["G(i)"] * peakpower * (1 - loss / 100.0)
+        if components:
+            part["Gb(i)"] = data["beam"]
+            part["Gd(i)"] = data["G(i)"] - data["beam"] - 0.02 * data["G(i)"]
+            part["Gr(i)"] = 0.02 * data["G(i)"]
+        else:
+            part["G(i)"] = data["G(i)"]
+        part["H_sun"] = data["H_sun"]
+        part["T2m"] = data["T2m"]
+        part["WS10m"] = data["WS10m"]
+        part["Int"] = np.zeros(data["times"].size)
+
+        stamps.extend(_stamps(data["times"]))
+        for name, values in part.items():
+            columns.setdefault(name, []).extend(_round(values))
+
+    return _inputs(params, lat, lon, years), stamps, columns
+
+
+def _tmy(params: Dict[str, str]) -> Tuple[Dict[str, Any], List[Dict[str, int]], List[str], Dict[str, List[float]]]:
+    lat, lon = _site(params)
+    years = _year_range(params, (2005, 2020))
+    rng = _rng(lat, lon, 0, 2)
+    months = [{"month": month, "year": int(rng.integers(years[0], years[1] + 1))} for month in range(1, 13)]
+
+    stamps: List[str] = []
+    columns: Dict[str, List[float]] = {}
+    for selected in months:
+        data = _hourly_year(lat, lon, selected["year"], 0.0, minute=0)
+        mask = data["times"].astype("datetime64[M]").astype(np.int64) % 12 == selected["month"] - 1
+        part = {
+            "T2m": data["T2m"], "RH": data["RH"], "G(h)": data["G(h)"], "Gb(n)": data["beam"] * 1.3,
+            "Gd(h)": data["G(h)"] - data["beam"], "IR(h)": 280.0 + 2.0 * data["T2m"],
+            "WS10m": data["WS10m"], "WD10m": data["WD10m"], "SP": data["SP"]
+        }
+        stamps.extend(_stamps(data["times"][mask]))
+        for name, values in part.items():
+            columns.setdefault(name, []).extend(_round(values[mask]))
+
+    return _inputs(params, lat, lon, years), months, stamps, columns
+
+
+def _monthly_energy(lat: float, lon: float, year: int, slope: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Monthly in-plane insolation (kWh/m2) and its day count for one year."""
+    data = _hourly_year(lat, lon, year, slope)
+    month = data["times"].astype("datetime64[M]").astype(np.int64) % 12
+    insolation = np.bincount(month, weights=data["G(i)"], minlength=12) / 1000.0
+    days = np.bincount(month, minlength=12) / 24.0
+    return insolation, days
+
+
+def _pvcalc(params: Dict[str, str]) -> Dict[str, Any]:
+    lat, lon = _site(params)
+    years = _year_range(params)
+    peakpower = _float(params, "peakpower")
+    loss = _float(params, "loss")
+    insolation, days = _monthly_energy(lat, lon, years[0], _float(params, "angle", 35.0))
+    energy = insolation * peakpower * (1 - loss / 100.0)
+    monthly = [
+        {"month": m + 1, "E_d": round(energy[m] / days[m], 2), "E_m": round(energy[m], 2),
+         "H(i)_d": round(insolation[m] / days[m], 2), "H(i)_m": round(insolation[m], 2), "SD_m": round(energy[m] * 0.08, 2)}
+        for m in range(12)
+    ]
+    totals = {
+        "E_d": round(energy.sum() / days.sum(), 2), "E_m": round(energy.mean(), 2), "E_y": round(energy.sum(), 2),
+        "H(i)_d": round(insolation.sum() / days.sum(), 2), "H(i)_m": round(insolation.mean(), 2),
+        "H(i)_y": round(insolation.sum(), 2), "SD_m": round(energy.mean() * 0.05, 2), "SD_y": round(energy.sum() * 0.04, 2),
+        "l_aoi": -2.9, "l_spec": 1.1, "l_tg": -5.2, "l_total": round(-loss - 7.0, 2)
+    }
+    return {"inputs": _inputs(params, lat, lon, years), "outputs": {"monthly": {"fixed": monthly}, "totals": {"fixed": totals}}}
+
+
+def _shscalc(params: Dict[str, str]) -> Dict[str, Any]:
+    lat, lon = _site(params)
+    peakpower = _float(params, "peakpower") / 1000.0
+    consumption = _float(params, "consumptionday")
+    insolation, days = _monthly_energy(lat, lon, 2020, _float(params, "angle", 35.0))
+    produced = insolation / days * peakpower * 1000.0 * 0.8
+    monthly = [
+        {"month": m + 1, "E_d": round(min(produced[m], consumption), 2),
+         "E_lost_d": round(max(produced[m] - consumption, 0.0), 2),
+         "f_f": round(100.0 * min(1.0, produced[m] / consumption), 2),
+         "f_e": round(100.0 * max(0.0, 1.0 - produced[m] / consumption), 2)}
+        for m in range(12)
+    ]
+    histogram = [{"CS_min": i * 10, "CS_max": (i + 1) * 10, "f_CS": round(100.0 / 10, 2)} for i in range(10)]
+    totals = {
+        "d_total": int(days.sum()),
+        "E_lost": round(sum(m["E_lost_d"] for m in monthly) * 30.4, 2),
+        "f_f": round(sum(m["f_f"] for m in monthly) / 12, 2),
+        "f_e": round(sum(m["f_e"] for m in monthly) / 12, 2)
+    }
+    return {"inputs": _inputs(params, lat, lon, (2005, 2020)), "outputs": {"monthly": monthly, "histogram": histogram, "totals": totals}}
+
+
+def _mrcalc(params: Dict[str, str]) -> Dict[str, Any]:
+    lat, lon = _site(params)
+    years = _year_range(params)
+    monthly = []
+    for year in range(years[0], years[1] + 1):
+        horizontal, _ = _monthly_energy(lat, lon, year, 0.0)
+        monthly.extend({"year": year, "month": m + 1, "H(h)_m": round(horizontal[m], 2)} for m in range(12))
+    return {"inputs": _inputs(params, lat, lon, years), "outputs": {"monthly": monthly}}
+
+
+def _drcalc(params: Dict[str, str]) -> Dict[str, Any]:
+    lat, lon = _site(params)
+    month = int(_float(params, "month"))
+    if not 0 <= month <= 12:
+        raise StandinError("month: Incorrect value. Please, enter an integer between 0 and 12")
+
+    data = _hourly_year(lat, lon, 2020, _float(params, "angle", 0.0))
+    months = data["times"].astype("datetime64[M]").astype(np.int64) % 12
+    selected = [month - 1] if month else list(range(12))
+    profile = []
+    for m in selected:
+        mask = months == m
+        hourly = data["G(i)"][mask].reshape(-1, 24).mean(axis=0)
+        beam = data["beam"][mask].reshape(-1, 24).mean(axis=0)
+        profile.extend(
+            {"month": m + 1, "time": f"{h:02d}:00", "G(i)": round(hourly[h], 2),
+             "Gb(i)": round(beam[h], 2), "Gd(i)": round(hourly[h] - beam[h], 2)}
+            for h in range(24)
+        )
+    return {"inputs": _inputs(params, lat, lon, (2005, 2020)), "outputs": {"daily_profile": profile}}
+
+
+def _printhorizon(params: Dict[str, str]) -> Dict[str, Any]:
+    lat, lon = _site(params)
+    rng = _rng(lat, lon, 0, 3)
+    azimuth = np.arange(-180.0, 180.1, 7.5)
+    heights = np.clip(np.convolve(rng.uniform(0, 8, azimuth.size + 4), np.ones(5) / 5, mode="valid"), 0, None)
+
+    def sun_path(day: str) -> List[Dict[str, float]]:
+        data = _hourly_year(lat, lon, 2020, 0.0, minute=0)
+        mask = data["times"].astype("datetime64[D]") == np.datetime64(day)
+        return [{"A_sun": round(-180.0 + 15.0 * h, 1), "H_sun": round(float(v), 1)} for h, v in enumerate(data["H_sun"][mask])]
+
+    return {
+        "inputs": {"location": {"latitude": lat, "longitude": lon, "elevation": 100.0}, "horizon_db": "DEM-calculated"},
+        "outputs": {
+            "horizon_profile": [{"A": float(a), "H_hor": round(float(h), 1)} for a, h in zip(azimuth, heights)],
+            "winter_solstice": sun_path("2020-12-21"),
+            "summer_solstice": sun_path("2020-06-21")
+        }
+    }
+
+
+def _records(stamps: List[str], columns: Dict[str, List[float]], time_key: str) -> List[Dict[str, Any]]:
+    names = list(columns)
+    return [dict(zip([time_key] + names, row)) for row in zip(stamps, *(columns[n] for n in names))]
+
+
+def _csv(header: List[str], time_key: str, stamps: List[str], columns: Dict[str, List[float]], legend: List[str]) -> str:
+    names = list(columns)
+    lines = header + [",".join([time_key] + names)]
+    lines.extend(",".join([stamp] + [repr(v) for v in row]) for stamp, *row in zip(stamps, *(columns[n] for n in names)))
+    return "\r\n".join(lines + [""] + legend) + "\r\n"
+
+
+@lru_cache(maxsize=256)
+def generate(endpoint: str, query: Tuple[Tuple[str, str], ...], payload_bytes: int) -> Tuple[bytes, str]:
+    """Synthetic body and content type for one request (memoised, so generation does not skew benchmarks)."""
+    params = dict(query)
+    csv = params.get("outputformat", "json") == "csv"
+    if csv and endpoint not in CSV_ENDPOINTS:
+        raise StandinError(f"outputformat=csv is only served for {', '.join(CSV_ENDPOINTS)} by the stand-in")
+
+    if endpoint == "seriescalc":
+        inputs, stamps, columns = _seriescalc(params)
+        if csv:
+            location = inputs["location"]
+            header = [f"Latitude (decimal degrees):\t{location['latitude']:.3f}",
+                      f"Longitude (decimal degrees):\t{location['longitude']:.3f}",
+                      f"Elevation (m):\t{location['elevation']:.0f}",
+                      f"Radiation database:\t{inputs['meteo_data']['radiation_db']}", "", "",
+                      f"Slope: {inputs['mounting_system']['fixed']['slope']['value']:g} deg. ",
+                      f"Azimuth: {inputs['mounting_system']['fixed']['azimuth']['value']:g} deg. "]
+            body = _csv(header, "time", stamps, columns, ["G(i): Global irradiance on the inclined plane (W/m2)",
+                                                          "PVGIS stand-in (synthetic data)"])
+        else:
+            document = {"inputs": inputs, "outputs": {"hourly": _records(stamps, columns, "time")}, "meta": {}}
+    elif endpoint == "tmy":
+        inputs, months, stamps, columns = _tmy(params)
+        if csv:
+            location = inputs["location"]
+            header = [f"Latitude (decimal degrees): {location['latitude']:.3f}",
+                      f"Longitude (decimal degrees): {location['longitude']:.3f}",
+                      f"Elevation (m): {location['elevation']:.0f}", "month,year"]
+            header += [f"{m['month']},{m['year']}" for m in months]
+            body = _csv(header, "time(UTC)", stamps, columns, ["T2m: 2-m air temperature (degree Celsius)",
+                                                               "PVGIS stand-in (synthetic data)"])
+        else:
+            document = {"inputs": inputs, "outputs": {"months_selected": months,
+                                                      "tmy_hourly": _records(stamps, columns, "time(UTC)")}, "meta": {}}
+    else:
+        document = {"PVcalc": _pvcalc, "SHScalc": _shscalc, "MRcalc": _mrcalc, "DRcalc": _drcalc,
+                    "printhorizon": _printhorizon}[endpoint](params)
+        document.setdefault("meta", {})
+
+    if csv:
+        missing = payload_bytes - len(body)
+        if missing > 0:
+            body += "\r\n" + "#" * missing
+        return body.encode("utf-8"), "text/csv"
+
+    text = json.dumps(document)
+    missing = payload_bytes - len(text)
+    if missing > 0:
+        document["meta"]["padding"] = "x" * missing
+        text = json.dumps(document)
+    return text.encode("utf-8"), "application/json"
+
+
+# ----Fixtures----
+
+@lru_cache(maxsize=64)
+def _fixture_years(path: Path, csv: bool, years: Tuple[int, int]) -> Optional[bytes]:
+    """
+    A seriescalc fixture cut down to the hourly records of the given years, or None
+    when it does not hold all of them (memoised like generate()).
+    """
+    wanted = set(range(years[0], years[1] + 1))
+    found = set()
+
+    if csv:
+        lines = []
+        for line in path.read_bytes().decode("utf-8").splitlines(keepends=True):
+            row = CSV_ROW.match(line)
+            if row is not None:
+                year = int(row.group(1))
+                if year not in wanted:
+                    continue
+                found.add(year)
+            lines.append(line)
+        return "".join(lines).encode("utf-8") if found == wanted else None
+
+    document = json.loads(path.read_bytes())
+    hourly = [record for record in document["outputs"]["hourly"] if int(record["time"][:4]) in wanted]
+    found.update(int(record["time"][:4]) for record in hourly)
+    if found != wanted:
+        return None
+    document["outputs"]["hourly"] = hourly
+    meteo = document.get("inputs", {}).get("meteo_data")
+    if meteo is not None:
+        meteo["year_min"], meteo["year_max"] = years
+    return json.dumps(document).encode("utf-8")
+
+
+# ----Server----
+
+def create_app(config: StandinConfig) -> FastAPI:
+    app = FastAPI(title="PVGIS stand-in", docs_url=None, redoc_url=None)
+    rng = random.Random(config.seed)
+    stats: Counter = Counter()
+    endpoints = {name.lower(): name for name in ENDPOINTS}
+
+    def fixture(endpoint: str, params: Dict[str, str], csv: bool) -> Optional[bytes]:
+        """Recorded body matching the request, or None to generate one."""
+        if config.fixtures is None:
+            return None
+        extension = "csv" if csv else "json"
+        if endpoint != "seriescalc":
+            path = config.fixtures / f"{endpoint}.{extension}"
+            return path.read_bytes() if path.is_file() else None
+
+        try:
+            years = _year_range(params)
+        except StandinError:
+            return None  # Answered with 400 by the generator
+        path = config.fixtures / f"seriescalc_{years[0]}-{years[1]}.{extension}"
+        if path.is_file():
+            return path.read_bytes()
+        path = config.fixtures / f"seriescalc.{extension}"
+        return _fixture_years(path, csv, years) if path.is_file() else None
+
+    def reply(endpoint: str, status: int, body: bytes, media_type: str, headers: Optional[Dict[str, str]] = None) -> Response:
+        stats[f"{endpoint}.{status}"] += 1
+        stats["bytes_sent"] += len(body)
+        return Response(content=body, status_code=status, media_type=media_type, headers=headers)
+
+    def message(endpoint: str, status: int, text: str, headers: Optional[Dict[str, str]] = None) -> Response:
+        return reply(endpoint, status, json.dumps({"message": text, "status": status}).encode(), "application/json", headers)
+
+    @app.get("/api/{version}/{endpoint}")
+    async def serve(version: str, endpoint: str, request: Request) -> Response:
+        name = endpoints.get(endpoint.lower())
+        if version not in ("v5_2", "v5_3") or name is None:
+            return message(endpoint, 404, f"Unknown endpoint {version}/{endpoint}")
+
+        stats["requests"] += 1
+        delay = config.latency + (rng.uniform(0.0, config.jitter) if config.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        draw = rng.random()
+        if draw < config.rate_429:
+            headers = {"Retry-After": str(config.retry_after)} if config.retry_after is not None else None
+            return message(name, 429, "Too many requests. Please reduce the request rate.", headers)
+        if draw < config.rate_429 + config.rate_529:
+            return message(name, 529, "The server is overloaded. Please try again later.")
+
+        params = {key: value for key, value in request.query_params.items() if key != "browser"}
+        csv = params.get("outputformat", "json") == "csv"
+        body = await asyncio.to_thread(fixture, name, params, csv)
+        if body is not None:
+            return reply(name, 200, body, "text/csv" if csv else "application/json")
+
+        try:
+            body, media_type = await asyncio.to_thread(generate, name, tuple(sorted(params.items())), config.payload_bytes)
+        except StandinError as e:
+            return message(name, 400, str(e))
+        return reply(name, 200, body, media_type)
+
+    @app.get("/stats")
+    def read_stats() -> Dict[str, int]:
+        return dict(stats)
+
+    @app.post("/stats/reset")
+    def reset_stats() -> Dict[str, int]:
+        stats.clear()
+        return {}
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, uniform in 0..JITTER seconds")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Share of requests answered with 429 (0..1)")
+    parser.add_argument("--rate-529", type=float, default=0.0, help="Share of requests answered with 529 (0..1)")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429 (negative: none)")
+    parser.add_argument("--payload-kb", type=int, default=0, help="Pad smaller responses up to this many KiB")
+    parser.add_argument("--fixtures", type=Path, default=None, help="Directory with <endpoint>.json / <endpoint>.csv (seriescalc also "
+                             "seriescalc_<startyear>-<endyear>.json / .csv) to replay")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the latency and error draws")
+    args = parser.parse_args()
+
+    if not 0 <= args.rate_429 + args.rate_529 <= 1:
+        parser.error("--rate-429 plus --rate-529 must be between 0 and 1")
+
+    config = StandinConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_429=args.rate_429,
+        rate_529=args.rate_529,
+        retry_after=args.retry_after if args.retry_after >= 0 else None,
+        payload_bytes=args.payload_kb * 1024,
+        fixtures=args.fixtures,
+        seed=args.seed
+    )
+    print(f"PVGIS stand-in on http://{args.host}:{args.port}/api/v5_2 (and /api/v5_3)")
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
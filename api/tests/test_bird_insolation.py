@@ -0,0 +1,33 @@
+from datetime import date
+import numpy as np
+from api.app.core.config_loader import settings
+from api.app.schemas.solar_io_schemas import BirdInsolationRequest
+from api.app.services.bird_insolation import BirdInsolationService
+
+
+def _request() -> BirdInsolationRequest:
+    return BirdInsolationRequest(
+        longitude=32.8, latitude=39.9, elevation=900.0, station_pressure=1013.25, albedo=0.2,
+        ozone=0.3, water_vapor=1.5, aot500=0.1, aot380=0.15,
+        start_date=date(2024, 1, 1), end_date=date(2024, 3, 31)
+    )
+
+
+def test_quadrature_points_stay_within_series_limit(monkeypatch):
+    full = BirdInsolationService.calculate(_request())
+
+    limit = 10 * BirdInsolationService.GAUSS_NODES * BirdInsolationService.MAX_PANELS
+    monkeypatch.setattr(settings, "MAX_SERIES_POINTS", limit)
+    sizes = []
+    gauss = BirdInsolationService._gauss
+
+    def tracked(inputs, a, b, panels, x, w):
+        sizes.append(a.size * panels * x.size)
+        return gauss(inputs, a, b, panels, x, w)
+
+    monkeypatch.setattr(BirdInsolationService, "_gauss", staticmethod(tracked))
+    blocked = BirdInsolationService.calculate(_request())
+
+    assert max(sizes) <= limit
+    np.testing.assert_allclose(blocked.daily.total_horizontal, full.daily.total_horizontal)
+    assert blocked.annual.total_horizontal == full.annual.total_horizontal
@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta, timezone
+import numpy as np
+from api.app.dataclasses.bird_raster_dc import RasterJobConfig
+from api.app.dataclasses.solar_io_dc import SolarInputsArrayDataclass
+from api.app.services.bird_raster import BirdRasterJob, COMPONENTS, _compute_tile
+from api.app.services.birdmodel import BirdModel
+
+
+def _config(tmp_path, timestamps):
+    return RasterJobConfig(lat_min=38.0, lat_max=38.2, lon_min=32.0, lon_max=32.3, resolution=0.05,
+                           timestamps=timestamps, output_dir=tmp_path, tile_size=4, workers=1)
+
+
+def test_aware_timestamps_are_converted_to_utc(tmp_path):
+    naive = BirdRasterJob(_config(tmp_path, [datetime(2024, 6, 21, 9, 30)]))
+    aware = BirdRasterJob(_config(tmp_path, [datetime(2024, 6, 21, 12, 30, tzinfo=timezone(timedelta(hours=3)))]))
+    np.testing.assert_array_equal(aware.julian_dates, naive.julian_dates)
+    assert aware._fingerprint() == naive._fingerprint()
+
+
+def test_compute_tile_streams_every_timestamp_to_disk(tmp_path):
+    timestamps = [datetime(2024, 6, 21, h) for h in (6, 9, 12, 15)]
+    job = BirdRasterJob(_config(tmp_path, timestamps))
+    tile = job.tiles()[0]
+    job.tile_path(tile).parent.mkdir(parents=True)
+
+    path = _compute_tile(job._tile_task(tile))
+    data = np.load(path)
+    assert data.shape == (len(timestamps), len(COMPONENTS), tile.rows, tile.cols)
+    assert not list(job.tile_path(tile).parent.glob("*.tmp.npy"))
+
+    inputs = job._tile_task(tile)
+    for i, jd in enumerate(job.julian_dates):
+        expected = BirdModel.calculate_array(
+            SolarInputsArrayDataclass(latitude=inputs["latitudes"][:, None], longitude=inputs["longitudes"][None, :],
+                                      month=1, day=1, year=2000, hour=0, minute=0, second=0, **inputs["atmosphere"]),
+            julian_date=jd, clip_night=True)
+        np.testing.assert_allclose(data[i, 2], expected.total_horizontal.astype(np.float32), rtol=1e-6)
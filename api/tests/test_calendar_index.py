@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from api.app.dataclasses.hourly_series_dc import HourlySeriesDataclass
+from api.app.utils.calendar_index import CalendarIndex
+from api.app.utils.time_axis import TimeAxis
+
+TIMES = np.arange(np.datetime64("2019-01-01T00:10"), np.datetime64("2021-01-01T00:10"), np.timedelta64(1, "h")).astype("datetime64[s]")
+
+
+def _mask(month=None, day=None, hour=None):
+    _, months, days, hours, _, _ = TimeAxis.split(TIMES)
+    mask = np.ones(TIMES.size, dtype=bool)
+    for field, values in ((months, month), (days, day), (hours, hour)):
+        if values is not None:
+            mask &= np.isin(field, sorted(values) if isinstance(values, (set, frozenset)) else values)
+    return mask
+
+
+@pytest.mark.parametrize("month, day, hour", [
+    (4, 15, None),
+    (None, None, 12),
+    ([1, 7], None, [3, 6, 9]),
+    ({2, 12}, {1, 29}, None),
+    (frozenset({6}), 21, {11, 12, 13}),
+    (np.array([3, 9]), None, (0, 23)),
+])
+def test_rows_match_a_mask_scan(month, day, hour):
+    rows = CalendarIndex(TIMES).rows(month, day, hour)
+    np.testing.assert_array_equal(rows, np.flatnonzero(_mask(month, day, hour)))
+
+
+def test_select_accepts_sets():
+    series = HourlySeriesDataclass(times=TIMES, columns={"G(i)": np.arange(TIMES.size, dtype=np.float64)})
+    selected = series.select(month={5, 4}, hour={12})
+    assert selected.times.size == (30 + 31) * 2
+    np.testing.assert_array_equal(selected.times, TIMES[_mask({4, 5}, None, {12})])
+
+
+@pytest.mark.parametrize("kwargs", [{"month": 13}, {"hour": {24}}, {"day": set()}])
+def test_invalid_fields_raise_value_error(kwargs):
+    with pytest.raises(ValueError):
+        CalendarIndex(TIMES).rows(**kwargs)
@@ -0,0 +1,28 @@
+import asyncio
+import threading
+import httpx
+from api.app.services.pvgis import PVGISService
+from api.app.services.pvgis_async import AsyncPVGISService
+
+
+def test_fetch_decodes_response_off_the_event_loop(monkeypatch):
+    threads = []
+    parse = PVGISService._parse_response
+
+    def tracked(*args):
+        threads.append(threading.current_thread())
+        return parse(*args)
+
+    async def send(endpoint, url, clean_params, stream=False):
+        return httpx.Response(200, json={"outputs": {"totals": {}}}, headers={"content-type": "application/json"})
+
+    monkeypatch.setattr(PVGISService, "_parse_response", staticmethod(tracked))
+    monkeypatch.setattr(AsyncPVGISService, "_send", staticmethod(send))
+
+    async def run():
+        data = await AsyncPVGISService._fetch("PVcalc", "http://pvgis.invalid/api", {}, "key", None)
+        return data, threading.current_thread()
+
+    data, loop_thread = asyncio.run(run())
+    assert data["outputs"] == {"totals": {}}
+    assert threads and threads[0] is not loop_thread
@@ -0,0 +1,44 @@
+import json
+from fastapi.testclient import TestClient
+from api.benchmarks.pvgis_standin import StandinConfig, create_app, generate
+
+SITE = {"lat": "39.9", "lon": "32.8"}
+
+
+def _generated(startyear: int, endyear: int, **extra) -> bytes:
+    params = dict(SITE, startyear=str(startyear), endyear=str(endyear), **extra)
+    return generate("seriescalc", tuple(sorted(params.items())), 0)[0]
+
+
+def _client(fixtures) -> TestClient:
+    return TestClient(create_app(StandinConfig(fixtures=fixtures)))
+
+
+def test_seriescalc_fixture_is_cut_to_requested_years(tmp_path):
+    (tmp_path / "seriescalc.json").write_bytes(_generated(2019, 2020))
+    client = _client(tmp_path)
+
+    hourly = client.get("/api/v5_3/seriescalc", params=dict(SITE, startyear=2020, endyear=2020)).json()
+    expected = json.loads(_generated(2020, 2020))
+    assert hourly["outputs"]["hourly"] == expected["outputs"]["hourly"]
+    assert hourly["inputs"]["meteo_data"]["year_min"] == 2020
+
+    # Years the fixture does not hold fall back to synthetic data
+    other = client.get("/api/v5_3/seriescalc", params=dict(SITE, startyear=2018, endyear=2019))
+    assert other.content == _generated(2018, 2019)
+
+
+def test_seriescalc_csv_fixture_is_cut_to_requested_years(tmp_path):
+    (tmp_path / "seriescalc.csv").write_bytes(_generated(2019, 2020, outputformat="csv"))
+    client = _client(tmp_path)
+
+    body = client.get("/api/v5_3/seriescalc", params=dict(SITE, startyear=2019, endyear=2019, outputformat="csv")).content
+    assert body == _generated(2019, 2019, outputformat="csv")
+
+
+def test_year_keyed_seriescalc_fixture_is_replayed(tmp_path):
+    (tmp_path / "seriescalc.json").write_bytes(_generated(2019, 2020))
+    (tmp_path / "seriescalc_2019-2019.json").write_bytes(b'{"recorded": true}')
+    client = _client(tmp_path)
+
+    assert client.get("/api/v5_3/seriescalc", params=dict(SITE, startyear=2019, endyear=2019)).json() == {"recorded": True}
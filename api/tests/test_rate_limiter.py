@@ -0,0 +1,37 @@
+import asyncio
+import threading
+from api.app.core.rate_limiter import TokenBucketLimiter
+
+
+def test_acquire_async_reserves_off_the_event_loop(tmp_path, monkeypatch):
+    limiter = TokenBucketLimiter(str(tmp_path / "limit.sqlite"), rate=1000, burst=5)
+    reserve = limiter._reserve
+    threads = []
+
+    def tracked():
+        threads.append(threading.current_thread())
+        return reserve()
+
+    monkeypatch.setattr(limiter, "_reserve", tracked)
+
+    async def run():
+        await limiter.acquire_async()
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(run())
+    assert threads and threads[0] is not loop_thread
+    assert limiter.stats()["acquired"] == 1
+    limiter.close()
+
+
+def test_acquire_async_waits_for_future_slot(tmp_path):
+    limiter = TokenBucketLimiter(str(tmp_path / "limit.sqlite"), rate=50, burst=1)
+
+    async def run():
+        return [await limiter.acquire_async() for _ in range(3)]
+
+    waits = asyncio.run(run())
+    assert waits[0] == 0
+    assert waits[1] > 0 and waits[2] > 0
+    assert limiter.stats()["delayed"] == 2
+    limiter.close()
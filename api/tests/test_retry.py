@@ -0,0 +1,155 @@
+import asyncio
+import time
+import httpx
+import pytest
+import requests
+from api.app.core.retry import CircuitBreaker, CircuitOpenError
+from api.app.services.pvgis import PVGISService
+from api.app.services.pvgis_async import AsyncPVGISService
+
+
+class _NoLimit:
+    def acquire(self):
+        pass
+
+    async def acquire_async(self):
+        pass
+
+
+def _half_open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.01)
+    breaker.record_failure()
+    time.sleep(0.02)
+    return breaker
+
+
+def test_released_probe_lets_next_call_through():
+    breaker = _half_open_breaker()
+    assert breaker.check() is True
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    breaker.release_probe()
+    assert breaker.check() is True
+
+
+def test_release_after_recorded_outcome_is_noop():
+    breaker = _half_open_breaker()
+    breaker.check()
+    breaker.record_failure()
+    breaker.release_probe()
+    assert breaker.stats()["state"] == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_sync_probe_with_unexpected_error_does_not_wedge_breaker(monkeypatch):
+    breaker = _half_open_breaker()
+
+    class Session:
+        def get(self, *args, **kwargs):
+            raise requests.TooManyRedirects("redirect loop")
+
+    monkeypatch.setattr(PVGISService, "_breaker", breaker)
+    monkeypatch.setattr(PVGISService, "rate_limiter", staticmethod(lambda: _NoLimit()))
+    monkeypatch.setattr(PVGISService, "_get_session", staticmethod(lambda: Session()))
+
+    for _ in range(3):
+        with pytest.raises(requests.TooManyRedirects):
+            PVGISService._send("seriescalc", "http://pvgis.invalid/api", {})
+    assert breaker.stats()["state"] == CircuitBreaker.HALF_OPEN
+
+
+def test_rate_limit_timeout_does_not_take_probe(monkeypatch):
+    breaker = _half_open_breaker()
+
+    class Limiter:
+        def acquire(self):
+            raise RuntimeError("rate limit wait exceeded")
+
+    monkeypatch.setattr(PVGISService, "_breaker", breaker)
+    monkeypatch.setattr(PVGISService, "rate_limiter", staticmethod(lambda: Limiter()))
+
+    with pytest.raises(RuntimeError):
+        PVGISService._send("seriescalc", "http://pvgis.invalid/api", {})
+    assert breaker.check() is True
+
+
+def test_async_cancelled_probe_is_released(monkeypatch):
+    breaker = _half_open_breaker()
+
+    class Client:
+        def build_request(self, *args, **kwargs):
+            return None
+
+        async def send(self, *args, **kwargs):
+            await asyncio.sleep(10)
+
+    async def get_client():
+        return Client()
+
+    monkeypatch.setattr(PVGISService, "_breaker", breaker)
+    monkeypatch.setattr(PVGISService, "rate_limiter", staticmethod(lambda: _NoLimit()))
+    monkeypatch.setattr(AsyncPVGISService, "_get_client", staticmethod(get_client))
+
+    async def run():
+        task = asyncio.create_task(AsyncPVGISService._send("seriescalc", "http://pvgis.invalid/api", {}))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert breaker.check() is True
+
+
+def test_async_non_transport_error_releases_probe(monkeypatch):
+    breaker = _half_open_breaker()
+
+    class Client:
+        def build_request(self, *args, **kwargs):
+            return None
+
+        async def send(self, *args, **kwargs):
+            raise httpx.TooManyRedirects("redirect loop")
+
+    async def get_client():
+        return Client()
+
+    monkeypatch.setattr(PVGISService, "_breaker", breaker)
+    monkeypatch.setattr(PVGISService, "rate_limiter", staticmethod(lambda: _NoLimit()))
+    monkeypatch.setattr(AsyncPVGISService, "_get_client", staticmethod(get_client))
+
+    with pytest.raises(httpx.TooManyRedirects):
+        asyncio.run(AsyncPVGISService._send("seriescalc", "http://pvgis.invalid/api", {}))
+    assert breaker.check() is True
+
+
+def test_open_circuit_fails_before_taking_a_token(monkeypatch):
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=60.0)
+    breaker.record_failure()
+
+    class Limiter:
+        def acquire(self):
+            raise AssertionError("rate limiter token taken while the circuit is open")
+
+        async def acquire_async(self):
+            raise AssertionError("rate limiter token taken while the circuit is open")
+
+    monkeypatch.setattr(PVGISService, "_breaker", breaker)
+    monkeypatch.setattr(PVGISService, "rate_limiter", staticmethod(lambda: Limiter()))
+
+    with pytest.raises(CircuitOpenError):
+        PVGISService._send("seriescalc", "http://pvgis.invalid/api", {})
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(AsyncPVGISService._send("seriescalc", "http://pvgis.invalid/api", {}))
+    assert breaker.stats()["rejected"] == 2
+
+
+def test_fail_fast_does_not_take_the_probe():
+    breaker = _half_open_breaker()
+    breaker.fail_fast()
+    breaker.fail_fast()
+    assert breaker.check() is True
+    with pytest.raises(CircuitOpenError):
+        breaker.fail_fast()
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from api.app.utils.running_stats import GroupedMoments, GroupedQuantileSketch
+
+
+@pytest.mark.parametrize("samples", [1, 2, 4, 10, 500])
+def test_quantiles_interpolate_like_numpy(samples):
+    rng = np.random.default_rng(samples)
+    values = rng.uniform(5.0, 1000.0, (3, samples))
+    groups = np.repeat(np.arange(3), samples)
+
+    sketch = GroupedQuantileSketch(3)
+    sketch.update(groups, values.ravel())
+    for q in (0.0, 0.1, 0.5, 0.9, 1.0):
+        expected = np.quantile(values, q, axis=1)
+        np.testing.assert_allclose(sketch.quantile(q), expected, rtol=sketch.accuracy)
+
+
+def test_few_samples_keep_p90_above_p50():
+    sketch = GroupedQuantileSketch(1)
+    sketch.update([0, 0, 0], [100.0, 200.0, 800.0])
+    assert sketch.quantile(0.9)[0] == pytest.approx(680.0, rel=0.01)
+    assert sketch.quantile(0.9)[0] > sketch.quantile(0.5)[0]
+
+
+def test_empty_groups_are_nan():
+    sketch = GroupedQuantileSketch(2)
+    sketch.update([1], [42.0])
+    result = sketch.quantile(0.5)
+    assert np.isnan(result[0]) and result[1] == pytest.approx(42.0, rel=0.01)
+
+
+def test_moments_merge_matches_numpy():
+    rng = np.random.default_rng(0)
+    groups = rng.integers(0, 4, 1000)
+    values = rng.normal(300.0, 50.0, 1000)
+
+    moments = GroupedMoments(4)
+    for part in np.array_split(np.arange(1000), 7):
+        moments.update(groups[part], values[part])
+    for g in range(4):
+        np.testing.assert_allclose(moments.mean[g], values[groups == g].mean())
+        np.testing.assert_allclose(moments.std()[g], values[groups == g].std(ddof=1))
@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+from api.app.utils.sun_times import SunTimesCalculator
+from api.app.utils.time_axis import JD_UNIX_EPOCH
+
+
+@pytest.mark.parametrize("longitude", [-179.9, -75.0, 0.0, 100.0, 179.9])
+def test_events_belong_to_the_local_solar_day(longitude):
+    days = np.arange(np.datetime64("2025-01-01"), np.datetime64("2026-01-01"))
+    sun = SunTimesCalculator.calculate(days, longitude, 35.0)
+
+    # Solar noon stays within the equation of time (< 17 min) of 12:00 local mean time
+    local_noon = days.astype(np.int64) + JD_UNIX_EPOCH + 0.5 - longitude / 360.0
+    assert np.abs(sun.solar_noon - local_noon).max() < 17.0 / 1440.0
+    assert np.all((sun.sunrise < sun.solar_noon) & (sun.solar_noon - sun.sunrise < 0.5))
+    assert np.all((sun.sunset > sun.solar_noon) & (sun.sunset - sun.solar_noon < 0.5))
+
+
+def test_far_east_sunrise_is_on_the_previous_utc_date():
+    sun = SunTimesCalculator.calculate(np.array(["2025-06-21"], dtype="datetime64[D]"), 179.9, 10.0)
+    sunrise_day = np.floor(sun.sunrise[0] - JD_UNIX_EPOCH).astype(np.int64).astype("datetime64[D]")
+    assert sunrise_day == np.datetime64("2025-06-20")
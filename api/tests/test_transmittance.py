@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from api.app.dataclasses.solar_io_dc import SolarInputsArrayDataclass
+from api.app.services.birdmodel import BirdModel
+from api.app.utils.julianday import JulianDateCalculator
+from api.app.utils.transmittance import TransmittanceTables
+
+# Documented in the TransmittanceTables docstring
+MAX_ABS_ERROR = {"rayleigh": 5e-7, "ozone": 2e-8}
+
+
+@pytest.fixture(scope="module")
+def tables():
+    return TransmittanceTables.instance()
+
+
+def test_table_error_within_documented_bound(tables):
+    errors = tables.max_abs_error()
+    for name, bound in MAX_ABS_ERROR.items():
+        assert errors[name] <= bound, f"{name}: {errors[name]:.2e} exceeds {bound:.0e}"
+
+
+@pytest.mark.parametrize("month, hour", [(1, 8), (3, 11), (6, 5), (6, 12), (9, 16), (12, 13)])
+def test_fast_irradiance_matches_exact(month, hour):
+    inputs = SolarInputsArrayDataclass(
+        latitude=np.linspace(-60.0, 70.0, 131)[:, np.newaxis],
+        longitude=np.linspace(-180.0, 180.0, 181)[np.newaxis, :],
+        month=1, day=1, year=2000, hour=0, minute=0, second=0,
+        solar_constant=1367.0, elevation=0.0, albedo=0.2, water_vapor=1.5, aot500=0.1, aot380=0.15,
+        station_pressure=np.linspace(700.0, 1050.0, 181)[np.newaxis, :],
+        ozone=np.linspace(0.2, 0.5, 131)[:, np.newaxis]
+    )
+    jd = JulianDateCalculator.calculate(month, 21, 2024, hour, 0, 0)
+    exact = BirdModel.calculate_array(inputs, julian_date=jd, clip_night=True)
+    fast = BirdModel.calculate_array(inputs, julian_date=jd, clip_night=True, fast_transmittance=True)
+
+    for component in ("direct_horizontal", "diffuse_horizontal", "total_horizontal"):
+        reference = getattr(exact, component)
+        # Relative error is only meaningful away from sunrise and sunset
+        lit = reference > 1.0
+        assert lit.any()
+        relative = np.abs(getattr(fast, component)[lit] - reference[lit]) / reference[lit]
+        assert relative.max() < 1e-6, f"{component}: {relative.max():.2e}"
+
+
+@pytest.mark.parametrize("name, x", [("rayleigh", 0.1), ("rayleigh", 60.0), ("rayleigh", 2.0), ("ozone", 30.0), ("ozone", 0.5)])
+def test_scalar_arguments(tables, name, x):
+    table = getattr(tables, name)
+    assert float(table(x)) == pytest.approx(float(table.func(x)), abs=MAX_ABS_ERROR[name])
+    assert float(table(np.float64(np.nan))) != float(table(np.float64(np.nan)))
+
+
+@pytest.mark.parametrize("hour", [0, 12])
+def test_fast_scalar_point_matches_exact(hour):
+    # Midnight is a night point; at noon the low pressure puts AMp below the Rayleigh table
+    inputs = SolarInputsArrayDataclass(
+        latitude=39.9, longitude=32.8, month=6, day=21, year=2024, hour=hour, minute=0, second=0,
+        solar_constant=1367.0, elevation=0.0, albedo=0.2, water_vapor=1.5, aot500=0.1, aot380=0.15,
+        station_pressure=200.0, ozone=0.3
+    )
+    exact = BirdModel.calculate_array(inputs, clip_night=True)
+    fast = BirdModel.calculate_array(inputs, clip_night=True, fast_transmittance=True)
+    for component in ("direct_horizontal", "diffuse_horizontal", "total_horizontal"):
+        np.testing.assert_allclose(getattr(fast, component), getattr(exact, component), rtol=1e-6, atol=1e-9)